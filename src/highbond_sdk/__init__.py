@@ -35,6 +35,9 @@ __license__ = "MIT"
 # Cliente principal
 from .client import HighBondClient
 
+# Cliente assíncrono (requer o extra "async")
+from .aio import AsyncHighBondClient
+
 # Configurações
 from .config import (
     APIConfig,
@@ -43,6 +46,34 @@ from .config import (
     ClientConfig,
 )
 
+# Concorrência
+from .concurrency import AdaptiveConcurrencyLimiter, WorkerPool
+from .pipeline import TraversalPipeline
+
+# Cache de respostas
+from .cache import CacheBackend, CacheEntry, CacheStats, MemoryCache, SQLiteCache
+
+# Índice de hierarquia
+from .hierarchy import HierarchyIndex
+
+# Retomada de listagens longas
+from .checkpoint import Checkpoint
+
+# Recursos incluídos (JSON:API)
+from .included import IncludedIndex
+
+# Modelos compactos de registros
+from .models import Record, Project, Objective, Risk, Control, Issue, Action, to_model
+
+# Sincronização incremental
+from .sync import SyncResult, SyncState, SyncStore, SQLiteSyncStore, Synchronizer
+
+# Exportação Arrow/Parquet
+from .export import Exporter, ExportResult
+
+# Snapshot relacional local
+from .snapshot import SnapshotEngine, SnapshotResult
+
 # Exceções
 from .exceptions import (
     HighBondAPIError,
@@ -86,6 +117,7 @@ __all__ = [
     
     # Cliente principal
     "HighBondClient",
+    "AsyncHighBondClient",
     
     # Configurações
     "APIConfig",
@@ -93,6 +125,36 @@ __all__ = [
     "ThreadingConfig",
     "ClientConfig",
     
+    # Concorrência
+    "AdaptiveConcurrencyLimiter",
+    "WorkerPool",
+    "TraversalPipeline",
+    "HierarchyIndex",
+    "CacheBackend",
+    "CacheEntry",
+    "CacheStats",
+    "MemoryCache",
+    "SQLiteCache",
+    "Synchronizer",
+    "SyncStore",
+    "SQLiteSyncStore",
+    "SyncState",
+    "SyncResult",
+    "Exporter",
+    "ExportResult",
+    "SnapshotEngine",
+    "SnapshotResult",
+    "Checkpoint",
+    "IncludedIndex",
+    "Record",
+    "Project",
+    "Objective",
+    "Risk",
+    "Control",
+    "Issue",
+    "Action",
+    "to_model",
+    
     # Exceções
     "HighBondAPIError",
     "HighBondAuthError",
@@ -0,0 +1,30 @@
+"""
+Suporte assíncrono (asyncio) do HighBond SDK.
+
+Requer o pacote opcional ``httpx``:
+    
+    pip install highbond-sdk[async]
+"""
+from .client import AsyncHighBondClient
+from .http_client import AsyncHighBondHTTPClient
+from .modules import (
+    AsyncProjectsModule,
+    AsyncProjectTypesModule,
+    AsyncObjectivesModule,
+    AsyncRisksModule,
+    AsyncControlsModule,
+    AsyncIssuesModule,
+    AsyncActionsModule,
+)
+
+__all__ = [
+    "AsyncHighBondClient",
+    "AsyncHighBondHTTPClient",
+    "AsyncProjectsModule",
+    "AsyncProjectTypesModule",
+    "AsyncObjectivesModule",
+    "AsyncRisksModule",
+    "AsyncControlsModule",
+    "AsyncIssuesModule",
+    "AsyncActionsModule",
+]
@@ -0,0 +1,190 @@
+"""
+Cliente assíncrono do HighBond SDK.
+"""
+from typing import Optional, Union
+
+from ..config import APIConfig, PaginationConfig, ThreadingConfig, ClientConfig
+from ..enums import Region
+from .http_client import AsyncHighBondHTTPClient
+from .modules import (
+    AsyncProjectsModule,
+    AsyncProjectTypesModule,
+    AsyncObjectivesModule,
+    AsyncRisksModule,
+    AsyncControlsModule,
+    AsyncIssuesModule,
+    AsyncActionsModule,
+)
+
+
+class AsyncHighBondClient:
+    """Cliente assíncrono para a API HighBond.
+    
+    Espelha o `HighBondClient` com os mesmos módulos, mas todas as
+    operações são corrotinas executadas sobre um transporte HTTP
+    assíncrono (``httpx``). As travessias ``list_all`` disparam as
+    requisições de cada nível com ``asyncio.gather``, limitadas por
+    ``max_concurrency`` requisições em voo.
+    
+    As operações de criação e atualização continuam disponíveis apenas no
+    `HighBondClient` síncrono.
+    
+    Attributes:
+        projects: Módulo assíncrono de projetos.
+        project_types: Módulo assíncrono de tipos de projeto.
+        objectives: Módulo assíncrono de objetivos.
+        risks: Módulo assíncrono de riscos.
+        controls: Módulo assíncrono de controles.
+        issues: Módulo assíncrono de issues.
+        actions: Módulo assíncrono de ações.
+    
+    Example:
+        >>> import asyncio
+        >>> from highbond_sdk import AsyncHighBondClient
+        >>>
+        >>> async def main():
+        ...     async with AsyncHighBondClient(token="seu-token", org_id=12345) as client:
+        ...         risks = await client.risks.list_all()
+        ...         actions = await client.actions.list_all()
+        >>>
+        >>> asyncio.run(main())
+    """
+    
+    def __init__(
+        self,
+        token: str,
+        org_id: int,
+        region: Union[str, Region] = Region.US,
+        timeout: int = 30,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        page_size: int = 50,
+        max_pages: Optional[int] = None,
+        max_concurrency: int = 50,
+        threading_enabled: bool = True,
+        requests_per_second: Optional[float] = None,
+        config: Optional[ClientConfig] = None
+    ):
+        """Inicializa o cliente HighBond assíncrono.
+        
+        Args:
+            token: Token de autenticação Bearer da API.
+            org_id: ID da organização no HighBond.
+            region: Região da API (us, eu, au, ca).
+            timeout: Timeout das requisições em segundos.
+            max_retries: Número máximo de tentativas em caso de erro.
+            retry_delay: Delay inicial entre tentativas em segundos.
+            page_size: Número de itens por página na paginação.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            max_concurrency: Máximo de requisições simultâneas em voo.
+            threading_enabled: Se False, as travessias são executadas sequencialmente.
+            requests_per_second: Limite de requisições por segundo compartilhado
+                por todas as corrotinas (None = sem limite).
+            config: Configuração completa (sobrescreve outros parâmetros).
+        
+        Raises:
+            ImportError: Se o pacote ``httpx`` não estiver instalado.
+        """
+        if config:
+            self._config = config
+        else:
+            api_config = APIConfig(
+                token=token,
+                org_id=org_id,
+                region=Region(region) if isinstance(region, str) else region,
+                timeout=timeout,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                requests_per_second=requests_per_second
+            )
+            pagination_config = PaginationConfig(
+                page_size=page_size,
+                max_pages=max_pages
+            )
+            threading_config = ThreadingConfig(
+                enabled=threading_enabled
+            )
+            self._config = ClientConfig(
+                api=api_config,
+                pagination=pagination_config,
+                threading=threading_config
+            )
+        
+        # Inicializa cliente HTTP
+        self._http_client = AsyncHighBondHTTPClient(
+            self._config.api,
+            max_concurrency=max_concurrency
+        )
+        
+        # Inicializa módulos
+        module_args = (
+            self._http_client,
+            self._config.api.org_id,
+            self._config.pagination,
+            self._config.threading
+        )
+        self._projects = AsyncProjectsModule(*module_args)
+        self._project_types = AsyncProjectTypesModule(*module_args)
+        self._objectives = AsyncObjectivesModule(*module_args)
+        self._risks = AsyncRisksModule(*module_args)
+        self._controls = AsyncControlsModule(*module_args)
+        self._issues = AsyncIssuesModule(*module_args)
+        self._actions = AsyncActionsModule(*module_args)
+    
+    @property
+    def projects(self) -> AsyncProjectsModule:
+        """Módulo de Projetos."""
+        return self._projects
+    
+    @property
+    def project_types(self) -> AsyncProjectTypesModule:
+        """Módulo de Tipos de Projeto."""
+        return self._project_types
+    
+    @property
+    def objectives(self) -> AsyncObjectivesModule:
+        """Módulo de Objetivos."""
+        return self._objectives
+    
+    @property
+    def risks(self) -> AsyncRisksModule:
+        """Módulo de Riscos."""
+        return self._risks
+    
+    @property
+    def controls(self) -> AsyncControlsModule:
+        """Módulo de Controles."""
+        return self._controls
+    
+    @property
+    def issues(self) -> AsyncIssuesModule:
+        """Módulo de Issues."""
+        return self._issues
+    
+    @property
+    def actions(self) -> AsyncActionsModule:
+        """Módulo de Ações."""
+        return self._actions
+    
+    @property
+    def config(self) -> ClientConfig:
+        """Configuração do cliente."""
+        return self._config
+    
+    async def close(self):
+        """Fecha conexões e libera recursos."""
+        await self._http_client.close()
+    
+    async def __aenter__(self):
+        """Suporte a context manager assíncrono."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Fecha cliente ao sair do context manager."""
+        await self.close()
+    
+    def __repr__(self) -> str:
+        return (
+            f"AsyncHighBondClient(org_id={self._config.api.org_id}, "
+            f"region={self._config.api.region.value})"
+        )
@@ -0,0 +1,301 @@
+"""
+Cliente HTTP assíncrono para o HighBond SDK.
+
+Requer o pacote opcional ``httpx`` (``pip install highbond-sdk[async]``).
+"""
+import asyncio
+from typing import Optional, Dict, Any, AsyncGenerator, List
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - dependência opcional
+    httpx = None
+
+from ..config import APIConfig, PaginationConfig, ThreadingConfig
+from ..exceptions import HighBondConnectionError
+from ..http_client import (
+    ResponseHandlerMixin,
+    PaginationMixin,
+    RateLimiter,
+    _parse_retry_after,
+)
+
+
+class AsyncHighBondHTTPClient(ResponseHandlerMixin):
+    """Cliente HTTP assíncrono de baixo nível para a API HighBond.
+    
+    Usa ``httpx.AsyncClient`` com a mesma política de retry e o mesmo
+    mapeamento de erros do `HighBondHTTPClient`. O número de requisições
+    simultâneas é limitado por um semáforo, de modo que centenas de
+    requisições em voo custam apenas algumas corrotinas.
+    """
+    
+    def __init__(self, config: APIConfig, max_concurrency: int = 50):
+        """
+        Args:
+            config: Configuração da API.
+            max_concurrency: Máximo de requisições simultâneas em voo.
+        
+        Raises:
+            ImportError: Se o pacote ``httpx`` não estiver instalado.
+        """
+        if httpx is None:
+            raise ImportError(
+                "O cliente assíncrono requer o pacote 'httpx'. "
+                "Instale com: pip install highbond-sdk[async]"
+            )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency deve ser pelo menos 1")
+        
+        self.config = config
+        self.max_concurrency = max_concurrency
+        self.rate_limiter = RateLimiter(
+            config.requests_per_second, config.burst_size
+        )
+        self._client = httpx.AsyncClient(
+            headers=config.headers,
+            timeout=config.timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrency,
+                max_keepalive_connections=max_concurrency
+            )
+        )
+        # Criado sob demanda para ficar associado ao event loop em execução
+        self._semaphore: Optional[asyncio.Semaphore] = None
+    
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """Retorna o semáforo que limita as requisições em voo."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._semaphore
+    
+    async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        **kwargs
+    ) -> "httpx.Response":
+        """Executa requisição com retry automático.
+        
+        Cada tentativa passa pelo `RateLimiter` do cliente. Um 429 pausa todas
+        as corrotinas até o prazo do ``Retry-After``.
+        
+        Args:
+            method: Método HTTP (GET, POST, etc).
+            url: URL completa da requisição.
+            **kwargs: Argumentos adicionais para httpx.
+        
+        Returns:
+            Resposta da requisição.
+        
+        Raises:
+            HighBondConnectionError: Se todas as tentativas falharem.
+        """
+        last_exception = None
+        
+        for attempt in range(self.config.max_retries):
+            await self.rate_limiter.acquire_async()
+            try:
+                async with self._get_semaphore():
+                    response = await self._client.request(method, url, **kwargs)
+                
+                # Retry apenas em erros 5xx e 429
+                if response.status_code == 429:
+                    self.rate_limiter.pause(
+                        _parse_retry_after(response.headers.get("Retry-After"))
+                    )
+                    continue
+                
+                if response.status_code >= 500:
+                    delay = self.config.retry_delay * (2 ** attempt)
+                    await asyncio.sleep(delay)
+                    continue
+                
+                return response
+            
+            except httpx.HTTPError as e:
+                last_exception = e
+                delay = self.config.retry_delay * (2 ** attempt)
+                await asyncio.sleep(delay)
+        
+        raise HighBondConnectionError(
+            f"Falha ao conectar após {self.config.max_retries} tentativas: {last_exception}"
+        )
+    
+    async def get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executa requisição GET.
+        
+        Args:
+            endpoint: Endpoint da API (sem base URL).
+            params: Parâmetros de query string.
+        
+        Returns:
+            Dados JSON da resposta.
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        response = await self._request_with_retry("GET", url, params=params)
+        return self._handle_response(response)
+    
+    async def post(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executa requisição POST.
+        
+        Args:
+            endpoint: Endpoint da API (sem base URL).
+            data: Dados JSON para enviar.
+        
+        Returns:
+            Dados JSON da resposta.
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        response = await self._request_with_retry("POST", url, json=data)
+        return self._handle_response(response)
+    
+    async def patch(
+        self,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executa requisição PATCH.
+        
+        Args:
+            endpoint: Endpoint da API (sem base URL).
+            data: Dados JSON para enviar.
+        
+        Returns:
+            Dados JSON da resposta.
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        response = await self._request_with_retry("PATCH", url, json=data)
+        return self._handle_response(response)
+    
+    async def delete(self, endpoint: str) -> Dict[str, Any]:
+        """Executa requisição DELETE.
+        
+        Args:
+            endpoint: Endpoint da API (sem base URL).
+        
+        Returns:
+            Dados JSON da resposta (pode ser vazio).
+        """
+        url = f"{self.config.base_url}{endpoint}"
+        response = await self._request_with_retry("DELETE", url)
+        return self._handle_response(response)
+    
+    async def close(self):
+        """Fecha o cliente HTTP."""
+        await self._client.aclose()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+
+class AsyncPaginationMixin:
+    """Mixin para adicionar paginação assíncrona."""
+    
+    _encode_page_number = PaginationMixin._encode_page_number
+    _pagination_with = PaginationMixin._pagination_with
+    
+    async def _paginate(
+        self,
+        endpoint: str,
+        pagination_config: PaginationConfig,
+        params: Optional[Dict[str, Any]] = None
+    ) -> AsyncGenerator[Dict[str, Any], None]:
+        """Itera de forma assíncrona sobre todas as páginas de um endpoint.
+        
+        Args:
+            endpoint: Endpoint da API.
+            pagination_config: Configuração de paginação.
+            params: Parâmetros adicionais de query string.
+        
+        Yields:
+            Cada item da resposta paginada.
+        """
+        http_client: AsyncHighBondHTTPClient = self._http_client
+        params = dict(params or {})
+        params["page[size]"] = pagination_config.page_size
+        
+        page = 1
+        pages_fetched = 0
+        
+        while True:
+            params["page[number]"] = self._encode_page_number(page)
+            response = await http_client.get(endpoint, params)
+            
+            data = response.get("data", [])
+            if isinstance(data, list):
+                for item in data:
+                    yield item
+            else:
+                yield data
+                return
+            
+            pages_fetched += 1
+            
+            # Verifica limite de páginas
+            if pagination_config.max_pages and pages_fetched >= pagination_config.max_pages:
+                return
+            
+            # Verifica se há próxima página
+            links = response.get("links", {})
+            if not links.get("next"):
+                return
+            
+            page += 1
+    
+    async def _collect(
+        self,
+        endpoint: str,
+        pagination_config: PaginationConfig,
+        params: Optional[Dict[str, Any]] = None
+    ) -> List[Dict[str, Any]]:
+        """Consome `_paginate` e retorna todos os itens em uma lista."""
+        return [
+            item async for item in self._paginate(endpoint, pagination_config, params)
+        ]
+
+
+class AsyncConcurrencyMixin:
+    """Mixin para executar corrotinas em paralelo com asyncio."""
+    
+    async def _execute_parallel(
+        self,
+        func,
+        items: List[Any],
+        threading_config: ThreadingConfig
+    ) -> List[Any]:
+        """Executa uma função assíncrona para múltiplos itens em paralelo.
+        
+        A concorrência efetiva é limitada pelo semáforo do
+        `AsyncHighBondHTTPClient`, não pelo número de itens.
+        
+        Args:
+            func: Função assíncrona a ser executada para cada item.
+            items: Lista de itens para processar.
+            threading_config: Configuração de threading (``enabled=False``
+                executa os itens sequencialmente).
+        
+        Returns:
+            Lista de resultados, na mesma ordem dos itens.
+        """
+        if not threading_config.enabled or len(items) <= 1:
+            return [await func(item) for item in items]
+        
+        async def run(item):
+            try:
+                return await func(item)
+            except Exception as e:
+                return {"error": str(e), "item": item}
+        
+        return list(await asyncio.gather(*(run(item) for item in items)))
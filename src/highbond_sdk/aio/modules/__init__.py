@@ -0,0 +1,20 @@
+"""
+Módulos assíncronos para o HighBond SDK.
+"""
+from .projects import AsyncProjectsModule
+from .project_types import AsyncProjectTypesModule
+from .objectives import AsyncObjectivesModule
+from .risks import AsyncRisksModule
+from .controls import AsyncControlsModule
+from .issues import AsyncIssuesModule
+from .actions import AsyncActionsModule
+
+__all__ = [
+    "AsyncProjectsModule",
+    "AsyncProjectTypesModule",
+    "AsyncObjectivesModule",
+    "AsyncRisksModule",
+    "AsyncControlsModule",
+    "AsyncIssuesModule",
+    "AsyncActionsModule",
+]
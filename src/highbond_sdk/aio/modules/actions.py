@@ -0,0 +1,294 @@
+"""
+Módulo assíncrono de Actions (Ações) para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncActionsModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `ActionsModule` (operações de leitura e exclusão).
+    
+    As ações de todas as issues são buscadas concorrentemente com
+    ``asyncio.gather``.
+    """
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    def _action_base_endpoint(self, action_id: int) -> str:
+        """Endpoint para acessar ação por ID (para GET, DELETE)."""
+        return f"/orgs/{self._org_id}/actions/{action_id}"
+    
+    def _issue_actions_endpoint(self, issue_id: int) -> str:
+        """Endpoint para listar ações de uma issue."""
+        return f"/orgs/{self._org_id}/issues/{issue_id}/actions"
+    
+    def _project_endpoint(self, project_id: int) -> str:
+        """Endpoint base para issues de um projeto."""
+        return f"/orgs/{self._org_id}/projects/{project_id}/issues"
+    
+    @property
+    def _org_endpoint(self) -> str:
+        """Endpoint base para issues a nível de organização."""
+        return f"/orgs/{self._org_id}/issues"
+    
+    # ==================== LISTAGEM ====================
+    
+    async def _list_for_issues(
+        self,
+        issues_endpoint: str,
+        include: Optional[List[str]],
+        filters: Optional[Dict[str, Any]],
+        max_pages: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Lista as issues de um endpoint e busca as ações de todas elas concorrentemente."""
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        issues = await self._collect(issues_endpoint, pagination, params)
+        issue_ids = [issue['id'] for issue in issues]
+        
+        async def fetch_actions_for_issue(issue_id):
+            return await self.list_by_issue(issue_id, include=include, filters=filters)
+        
+        all_actions = await self._execute_parallel(
+            fetch_actions_for_issue,
+            issue_ids,
+            self._threading_config
+        )
+        
+        actions = []
+        for action_list in all_actions:
+            if isinstance(action_list, list):
+                actions.extend(action_list)
+        return actions
+    
+    async def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as ações da organização.
+        
+        Busca todas as issues da organização e depois as ações de todas as
+        issues concorrentemente.
+        
+        Args:
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de ações ou DataFrame.
+        
+        Example:
+            >>> actions = await client.actions.list_all()
+        """
+        actions = await self._list_for_issues(
+            self._org_endpoint, include, filters, max_pages
+        )
+        
+        if return_pandas:
+            return to_dataframe(actions)
+        return actions
+    
+    async def list_by_project(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as ações de um projeto.
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de ações ou DataFrame.
+        """
+        actions = await self._list_for_issues(
+            self._project_endpoint(project_id), include, filters, max_pages
+        )
+        
+        if return_pandas:
+            return to_dataframe(actions)
+        return actions
+    
+    async def list_by_issue(
+        self,
+        issue_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as ações de uma issue com paginação automática.
+        
+        Args:
+            issue_id: ID da issue.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de ações ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        actions = await self._collect(
+            self._issue_actions_endpoint(issue_id), pagination, params
+        )
+        
+        if return_pandas:
+            return to_dataframe(actions)
+        return actions
+    
+    # ==================== OBTENÇÃO ====================
+    
+    async def get(
+        self,
+        action_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém uma ação específica por ID.
+        
+        Args:
+            action_id: ID da ação.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+        
+        Returns:
+            Dados da ação ou DataFrame.
+        """
+        endpoint = self._action_base_endpoint(action_id)
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            data = response.get('data', {})
+            return to_dataframe([data] if isinstance(data, dict) else data)
+        return response
+    
+    async def get_many(
+        self,
+        action_ids: List[int],
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplas ações em paralelo.
+        
+        Args:
+            action_ids: Lista de IDs de ações.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de ações ou DataFrame.
+        """
+        async def fetch_action(aid):
+            return await self.get(aid, include=include, return_pandas=False)
+        
+        actions = await self._execute_parallel(
+            fetch_action,
+            action_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(actions)
+        return actions
+    
+    async def get_many_by_issue(
+        self,
+        issue_id: int,
+        max_actions: Optional[int] = None,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplas ações de uma issue em paralelo, com detalhes completos.
+        
+        Args:
+            issue_id: ID da issue.
+            max_actions: Número máximo de ações a buscar (None = todas).
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de ações ou DataFrame.
+        """
+        actions_list = await self.list_by_issue(issue_id=issue_id)
+        
+        if max_actions is not None:
+            actions_list = actions_list[:max_actions]
+        
+        action_ids = [action['id'] for action in actions_list]
+        detailed_actions = await self.get_many(action_ids=action_ids, include=include)
+        
+        if return_pandas:
+            return to_dataframe(detailed_actions)
+        return detailed_actions
+    
+    # ==================== DELEÇÃO ====================
+    
+    async def delete(self, action_id: int) -> Dict[str, Any]:
+        """Deleta uma ação.
+        
+        Args:
+            action_id: ID da ação a deletar.
+        
+        Returns:
+            Resposta da API.
+        """
+        endpoint = self._action_base_endpoint(action_id)
+        return await self._http_client.delete(endpoint)
@@ -0,0 +1,285 @@
+"""
+Módulo assíncrono de Controles para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncControlsModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `ControlsModule` (operações de leitura e exclusão)."""
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    @property
+    def _org_endpoint(self) -> str:
+        """Endpoint base para controles a nível de organização."""
+        return f"/orgs/{self._org_id}/controls"
+    
+    def _objective_endpoint(self, objective_id: int) -> str:
+        """Endpoint base para controles de um objetivo."""
+        return f"/orgs/{self._org_id}/objectives/{objective_id}/controls"
+    
+    # ==================== LISTAGEM ====================
+    
+    async def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os controles da organização com paginação automática.
+        
+        Args:
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de todos os controles ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        controles = await self._collect(self._org_endpoint, pagination, params)
+        
+        if return_pandas:
+            return to_dataframe(controles)
+        return controles
+    
+    async def list_by_project(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_pandas: bool = False,
+        with_parent_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os controles de um projeto (buscando todos os objetivos e seus controles).
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+            with_parent_ids: Se True, adiciona 'objective_id' e 'project_id' em cada controle
+                (IDs JSON:API, como strings).
+        
+        Returns:
+            Lista de controles do projeto ou DataFrame.
+        """
+        from .objectives import AsyncObjectivesModule
+        objectives_module = AsyncObjectivesModule(
+            self._http_client,
+            self._org_id,
+            self._pagination_config,
+            self._threading_config
+        )
+        objetivos = await objectives_module.list_by_project(project_id)
+        
+        async def fetch_controls(obj):
+            controles = await self.list_all_by_objective(
+                objective_id=obj["id"],
+                include=include,
+                filters=filters
+            )
+            if with_parent_ids:
+                for controle in controles:
+                    controle["objective_id"] = obj["id"]
+                    controle["project_id"] = str(project_id)
+            return controles
+        
+        nested = await self._execute_parallel(
+            fetch_controls,
+            objetivos,
+            self._threading_config
+        )
+        controles = [c for sublist in nested if isinstance(sublist, list) for c in sublist]
+        
+        if return_pandas:
+            return to_dataframe(controles)
+        return controles
+    
+    async def list_by_objective(
+        self,
+        objective_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Lista uma página de controles de um objetivo específico.
+        
+        Para percorrer todas as páginas, use `list_all_by_objective`.
+        
+        Args:
+            objective_id: ID do objetivo.
+            page: Número da página.
+            page_size: Itens por página.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Resposta completa da API ou DataFrame.
+        """
+        params = {
+            "page[number]": self._encode_page_number(page),
+            "page[size]": min(page_size, 100)
+        }
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(self._objective_endpoint(objective_id), params)
+        
+        if return_pandas:
+            data = response["data"] if "data" in response else response
+            return to_dataframe(data)
+        return response
+    
+    async def list_all_by_objective(
+        self,
+        objective_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os controles de um objetivo com paginação automática.
+        
+        Args:
+            objective_id: ID do objetivo.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de controles ou DataFrame.
+        
+        Example:
+            >>> controles = await client.controls.list_all_by_objective(objective_id=789)
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        controles = await self._collect(
+            self._objective_endpoint(objective_id), pagination, params
+        )
+        
+        if return_pandas:
+            return to_dataframe(controles)
+        return controles
+    
+    # ==================== OBTENÇÃO ====================
+    
+    async def get(
+        self,
+        control_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém um controle específico por ID.
+        
+        Args:
+            control_id: ID do controle.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Dados do controle ou DataFrame.
+        """
+        endpoint = f"{self._org_endpoint}/{control_id}"
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def get_many(
+        self,
+        control_ids: List[int],
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplos controles em paralelo.
+        
+        Args:
+            control_ids: Lista de IDs de controles.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+        
+        Returns:
+            Lista de dados de controles ou DataFrame.
+        """
+        async def fetch_control(cid):
+            return await self.get(cid, include, return_pandas=False)
+        
+        controls = await self._execute_parallel(
+            fetch_control,
+            control_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(controls)
+        return controls
+    
+    # ==================== EXCLUSÃO ====================
+    
+    async def delete(self, control_id: int) -> Dict[str, Any]:
+        """Exclui um controle.
+        
+        Args:
+            control_id: ID do controle a excluir.
+        
+        Returns:
+            Resposta da API.
+        
+        Warning:
+            Esta ação é irreversível.
+        """
+        endpoint = f"{self._org_endpoint}/{control_id}"
+        return await self._http_client.delete(endpoint)
@@ -0,0 +1,217 @@
+"""
+Módulo assíncrono de Issues para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncIssuesModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `IssuesModule` (operações de leitura e exclusão)."""
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    @property
+    def _org_endpoint(self) -> str:
+        """Endpoint base para issues a nível de organização."""
+        return f"/orgs/{self._org_id}/issues"
+    
+    def _project_endpoint(self, project_id: int) -> str:
+        """Endpoint base para issues de um projeto."""
+        return f"/orgs/{self._org_id}/projects/{project_id}/issues"
+    
+    # ==================== LISTAGEM ====================
+    
+    async def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as issues da organização com paginação automática.
+        
+        Args:
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de issues ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        issues = await self._collect(self._org_endpoint, pagination, params)
+        
+        if return_pandas:
+            return to_dataframe(issues)
+        return issues
+    
+    async def list_by_project(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as issues de um projeto com paginação automática.
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de issues ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        issues = await self._collect(
+            self._project_endpoint(project_id), pagination, params
+        )
+        
+        if return_pandas:
+            return to_dataframe(issues)
+        return issues
+    
+    async def list_open(
+        self,
+        include: Optional[List[str]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todas as issues abertas (status = open).
+        
+        Args:
+            include: Relacionamentos para incluir.
+            max_pages: Máximo de páginas.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de issues abertas ou DataFrame.
+        """
+        return await self.list_all(
+            include=include,
+            filters={"closed": "false"},
+            max_pages=max_pages,
+            return_pandas=return_pandas
+        )
+    
+    # ==================== OBTENÇÃO ====================
+    
+    async def get(
+        self,
+        issue_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém uma issue específica por ID.
+        
+        Args:
+            issue_id: ID da issue.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+        
+        Returns:
+            Dados da issue ou DataFrame.
+        """
+        endpoint = f"{self._org_endpoint}/{issue_id}"
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            data = response.get('data', {})
+            return to_dataframe([data] if isinstance(data, dict) else data)
+        return response
+    
+    async def get_many(
+        self,
+        issue_ids: List[int],
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplas issues em paralelo.
+        
+        Args:
+            issue_ids: Lista de IDs de issues.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de dados de issues ou DataFrame.
+        """
+        async def fetch_issue(iid):
+            response = await self.get(iid, include)
+            return response.get('data', response)
+        
+        issues = await self._execute_parallel(
+            fetch_issue,
+            issue_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(issues)
+        return issues
+    
+    # ==================== EXCLUSÃO ====================
+    
+    async def delete(self, issue_id: int) -> Dict[str, Any]:
+        """Exclui uma issue.
+        
+        Args:
+            issue_id: ID da issue a excluir.
+        
+        Returns:
+            Resposta da API.
+        
+        Warning:
+            Esta ação é irreversível.
+        """
+        endpoint = f"{self._org_endpoint}/{issue_id}"
+        return await self._http_client.delete(endpoint)
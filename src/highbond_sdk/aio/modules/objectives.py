@@ -0,0 +1,123 @@
+"""
+Módulo assíncrono de Objetivos para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncObjectivesModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `ObjectivesModule` (operações de leitura e exclusão)."""
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    def _base_endpoint(self, project_id: int) -> str:
+        """Endpoint base para objetivos de um projeto."""
+        return f"/orgs/{self._org_id}/projects/{project_id}/objectives"
+    
+    async def list_by_project(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os objetivos de um projeto com paginação automática.
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de objetivos ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        objetivos = await self._collect(
+            self._base_endpoint(project_id), pagination, params
+        )
+        
+        if return_pandas:
+            return to_dataframe(objetivos)
+        return objetivos
+    
+    async def get(
+        self,
+        project_id: int,
+        objective_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém um objetivo específico.
+        
+        Args:
+            project_id: ID do projeto.
+            objective_id: ID do objetivo.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+        
+        Returns:
+            Dados do objetivo ou DataFrame.
+        """
+        endpoint = f"{self._base_endpoint(project_id)}/{objective_id}"
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            data = response.get('data', {})
+            return to_dataframe([data] if isinstance(data, dict) else data)
+        return response
+    
+    async def delete(self, project_id: int, objective_id: int) -> Dict[str, Any]:
+        """Exclui um objetivo.
+        
+        Args:
+            project_id: ID do projeto.
+            objective_id: ID do objetivo a excluir.
+        
+        Returns:
+            Resposta da API.
+        
+        Warning:
+            Esta ação é irreversível.
+        """
+        endpoint = f"{self._base_endpoint(project_id)}/{objective_id}"
+        return await self._http_client.delete(endpoint)
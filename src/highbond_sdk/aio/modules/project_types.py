@@ -0,0 +1,166 @@
+"""
+Módulo assíncrono de Tipos de Projeto para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncProjectTypesModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `ProjectTypesModule` (operações de leitura e exclusão)."""
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    @property
+    def _base_endpoint(self) -> str:
+        """Endpoint base para tipos de projeto."""
+        return f"/orgs/{self._org_id}/project_types"
+    
+    async def list_all(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os tipos de projeto com paginação automática.
+        
+        Args:
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de tipos de projeto ou DataFrame.
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        project_types = await self._collect(self._base_endpoint, pagination, params)
+        
+        if return_pandas:
+            return to_dataframe(project_types)
+        return project_types
+    
+    async def get(self, project_type_id: int, return_pandas: bool = False) -> Dict[str, Any]:
+        """Obtém um tipo de projeto específico por ID.
+        
+        Args:
+            project_type_id: ID do tipo de projeto.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Dados do tipo de projeto ou DataFrame.
+        """
+        endpoint = f"{self._base_endpoint}/{project_type_id}"
+        response = await self._http_client.get(endpoint, None)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def get_custom_attributes(
+        self,
+        project_type_id: int,
+        fields: Optional[List[str]] = None,
+        page_size: Optional[int] = None,
+        page_number: Optional[str] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém os atributos customizados de um tipo de projeto.
+        
+        Args:
+            project_type_id: ID do tipo de projeto.
+            fields: Lista de campos específicos a retornar dos atributos customizados.
+            page_size: Número de itens retornados por página (máximo: 100).
+            page_number: Número da página em formato Base64-encoded.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Resposta da API com os custom_attributes ou DataFrame.
+        """
+        endpoint = f"{self._base_endpoint}/{project_type_id}/custom_attributes"
+        params = {}
+        
+        if fields and isinstance(fields, list):
+            params['fields[custom_attributes]'] = ','.join(fields)
+        
+        if page_size is not None:
+            params['page[size]'] = str(page_size)
+        
+        if page_number is not None:
+            params['page[number]'] = page_number
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def get_many(
+        self,
+        project_type_ids: List[int],
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplos tipos de projeto em paralelo.
+        
+        Args:
+            project_type_ids: Lista de IDs de tipos de projeto.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+        
+        Returns:
+            Lista de dados de tipos de projeto ou DataFrame.
+        """
+        async def fetch_type(pid):
+            return await self.get(pid, return_pandas=False)
+        
+        project_types = await self._execute_parallel(
+            fetch_type,
+            project_type_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(project_types)
+        return project_types
+    
+    async def delete(self, project_type_id: int) -> Dict[str, Any]:
+        """Exclui um tipo de projeto.
+        
+        Args:
+            project_type_id: ID do tipo de projeto a excluir.
+        
+        Returns:
+            Resposta da API (geralmente vazia em sucesso).
+        
+        Warning:
+            Esta ação é irreversível e pode afetar projetos existentes.
+        """
+        endpoint = f"{self._base_endpoint}/{project_type_id}"
+        return await self._http_client.delete(endpoint)
@@ -0,0 +1,205 @@
+"""
+Módulo assíncrono de Projetos para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncProjectsModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `ProjectsModule` (operações de leitura e exclusão)."""
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    @property
+    def _base_endpoint(self) -> str:
+        """Endpoint base para projetos."""
+        return f"/orgs/{self._org_id}/projects"
+    
+    async def list(
+        self,
+        page: int = 1,
+        page_size: int = 50,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Lista projetos com paginação manual.
+        
+        Args:
+            page: Número da página (1-based).
+            page_size: Itens por página (máximo 100).
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Resposta completa da API com data, meta e links, ou DataFrame.
+        """
+        params = {
+            "page[number]": self._encode_page_number(page),
+            "page[size]": min(page_size, 100)
+        }
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        response = await self._http_client.get(self._base_endpoint, params)
+        
+        if return_pandas:
+            data = response["data"] if "data" in response else response
+            return to_dataframe(data)
+        return response
+    
+    async def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os projetos com paginação automática.
+        
+        Args:
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de projetos ou DataFrame.
+        
+        Example:
+            >>> projects = await client.projects.list_all()
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        projetos = await self._collect(self._base_endpoint, pagination, params)
+        
+        if return_pandas:
+            return to_dataframe(projetos)
+        return projetos
+    
+    async def get(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém um projeto específico por ID.
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Dados do projeto ou DataFrame.
+        """
+        endpoint = f"{self._base_endpoint}/{project_id}"
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def get_many(
+        self,
+        project_ids: List[int],
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplos projetos em paralelo.
+        
+        Args:
+            project_ids: Lista de IDs de projetos.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+        
+        Returns:
+            Lista de dados de projetos ou DataFrame.
+        """
+        async def fetch_project(pid):
+            return await self.get(pid, include, return_pandas=False)
+        
+        projetos = await self._execute_parallel(
+            fetch_project,
+            project_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(projetos)
+        return projetos
+    
+    async def delete(self, project_id: int) -> Dict[str, Any]:
+        """Exclui um projeto.
+        
+        Args:
+            project_id: ID do projeto a excluir.
+        
+        Returns:
+            Resposta da API (geralmente vazia em sucesso).
+        
+        Warning:
+            Esta ação é irreversível e remove todos os dados associados.
+        """
+        endpoint = f"{self._base_endpoint}/{project_id}"
+        return await self._http_client.delete(endpoint)
+    
+    async def delete_many(self, project_ids: List[int]) -> List[Dict[str, Any]]:
+        """Exclui múltiplos projetos em paralelo.
+        
+        Args:
+            project_ids: Lista de IDs de projetos a excluir.
+        
+        Returns:
+            Lista de respostas da API.
+        
+        Warning:
+            Esta ação é irreversível!
+        """
+        return await self._execute_parallel(
+            self.delete,
+            project_ids,
+            self._threading_config
+        )
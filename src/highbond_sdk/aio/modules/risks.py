@@ -0,0 +1,344 @@
+"""
+Módulo assíncrono de Riscos para o HighBond SDK.
+"""
+from typing import Optional, Dict, Any, List
+
+from ..http_client import (
+    AsyncHighBondHTTPClient,
+    AsyncPaginationMixin,
+    AsyncConcurrencyMixin,
+)
+from ...config import PaginationConfig, ThreadingConfig
+from ...utils import to_dataframe
+
+
+class AsyncRisksModule(AsyncPaginationMixin, AsyncConcurrencyMixin):
+    """Versão assíncrona de `RisksModule` (operações de leitura e exclusão).
+    
+    As travessias projeto → objetivo → risco disparam todas as requisições
+    de um nível de uma só vez com ``asyncio.gather``.
+    """
+    
+    def __init__(
+        self,
+        http_client: AsyncHighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP assíncrono configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+    
+    @property
+    def _org_endpoint(self) -> str:
+        """Endpoint base para riscos a nível de organização."""
+        return f"/orgs/{self._org_id}/risks"
+    
+    def _objective_endpoint(self, objective_id: int) -> str:
+        """Endpoint base para riscos de um objetivo."""
+        return f"/orgs/{self._org_id}/objectives/{objective_id}/risks"
+    
+    def _objectives_module(self):
+        """Cria um módulo de objetivos compartilhando o mesmo cliente HTTP."""
+        from .objectives import AsyncObjectivesModule
+        return AsyncObjectivesModule(
+            self._http_client,
+            self._org_id,
+            self._pagination_config,
+            self._threading_config
+        )
+    
+    # ==================== LISTAGEM ====================
+    
+    async def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os riscos da organização.
+        
+        Busca todos os projetos, depois os objetivos de todos os projetos
+        (concorrentemente) e então os riscos de todos os objetivos
+        (concorrentemente).
+        
+        Args:
+            include: Lista de relacionamentos para incluir nos resultados.
+                - 'objectives' adiciona o campo 'objective' em cada risco.
+                - 'projects' adiciona o campo 'project' em cada risco.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de riscos, cada um com o campo 'project_id'.
+        
+        Example:
+            >>> risks = await client.risks.list_all(include=['objectives'])
+        """
+        from .projects import AsyncProjectsModule
+        projects_module = AsyncProjectsModule(
+            self._http_client,
+            self._org_id,
+            self._pagination_config,
+            self._threading_config
+        )
+        objectives_module = self._objectives_module()
+        all_projects = await projects_module.list_all()
+        
+        objective_to_project = {}
+        
+        async def fetch_objectives(proj):
+            objetivos = await objectives_module.list_by_project(proj["id"])
+            for obj in objetivos:
+                objective_to_project[obj["id"]] = proj["id"]
+            return objetivos
+        all_objectives_nested = await self._execute_parallel(
+            fetch_objectives,
+            all_projects,
+            self._threading_config
+        )
+        all_objectives = [
+            obj for sublist in all_objectives_nested
+            if isinstance(sublist, list) for obj in sublist
+        ]
+        
+        async def fetch_risks(obj):
+            riscos = await self.list_all_by_objective(
+                objective_id=obj["id"],
+                include=include
+            )
+            for risco in riscos:
+                risco["project_id"] = objective_to_project.get(obj["id"])
+            return riscos
+        all_risks_nested = await self._execute_parallel(
+            fetch_risks,
+            all_objectives,
+            self._threading_config
+        )
+        all_risks = [
+            r for sublist in all_risks_nested
+            if isinstance(sublist, list) for r in sublist
+        ]
+        
+        objectives_dict = {obj["id"]: obj for obj in all_objectives}
+        projects_dict = {proj["id"]: proj for proj in all_projects}
+        
+        for risk in all_risks:
+            if include:
+                if "objectives" in include:
+                    obj_id = risk.get("objective_id") or risk.get("objective", {}).get("id")
+                    if obj_id and obj_id in objectives_dict:
+                        risk["objective"] = objectives_dict[obj_id]
+                if "projects" in include:
+                    proj_id = risk.get("project_id")
+                    if proj_id and proj_id in projects_dict:
+                        risk["project"] = projects_dict[proj_id]
+        
+        if return_pandas:
+            return to_dataframe(all_risks)
+        return all_risks
+    
+    async def list_by_project(
+        self,
+        project_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_pandas: bool = False,
+        with_parent_ids: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os riscos de um projeto (buscando todos os objetivos e seus riscos).
+        
+        Args:
+            project_id: ID do projeto.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+            with_parent_ids: Se True, adiciona 'objective_id' e 'project_id' em cada risco
+                (IDs JSON:API, como strings).
+        
+        Returns:
+            Lista de riscos do projeto ou DataFrame.
+        """
+        objetivos = await self._objectives_module().list_by_project(project_id)
+        
+        async def fetch_risks(obj):
+            riscos = await self.list_all_by_objective(
+                objective_id=obj["id"],
+                include=include,
+                filters=filters
+            )
+            if with_parent_ids:
+                for risco in riscos:
+                    risco["objective_id"] = obj["id"]
+                    risco["project_id"] = str(project_id)
+            return riscos
+        
+        nested = await self._execute_parallel(
+            fetch_risks,
+            objetivos,
+            self._threading_config
+        )
+        riscos = [r for sublist in nested if isinstance(sublist, list) for r in sublist]
+        
+        if return_pandas:
+            return to_dataframe(riscos)
+        return riscos
+    
+    async def list_by_objective(
+        self,
+        objective_id: int,
+        page: int = 1,
+        page_size: int = 50,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Lista uma página de riscos de um objetivo específico.
+        
+        Para percorrer todas as páginas, use `list_all_by_objective`.
+        
+        Args:
+            objective_id: ID do objetivo.
+            page: Número da página.
+            page_size: Itens por página.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Resposta completa da API ou DataFrame.
+        """
+        params = {
+            "page[number]": self._encode_page_number(page),
+            "page[size]": min(page_size, 100)
+        }
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(self._objective_endpoint(objective_id), params)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def list_all_by_objective(
+        self,
+        objective_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os riscos de um objetivo com paginação automática.
+        
+        Args:
+            objective_id: ID do objetivo.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+        
+        Returns:
+            Lista de riscos ou DataFrame.
+        
+        Example:
+            >>> riscos = await client.risks.list_all_by_objective(objective_id=789)
+        """
+        pagination = self._pagination_with(max_pages)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        riscos = await self._collect(
+            self._objective_endpoint(objective_id), pagination, params
+        )
+        
+        if return_pandas:
+            return to_dataframe(riscos)
+        return riscos
+    
+    # ==================== OBTENÇÃO ====================
+    
+    async def get(
+        self,
+        risk_id: int,
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> Dict[str, Any]:
+        """Obtém um risco específico por ID.
+        
+        Args:
+            risk_id: ID do risco.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+        
+        Returns:
+            Dados do risco ou DataFrame.
+        """
+        endpoint = f"{self._org_endpoint}/{risk_id}"
+        params = {}
+        
+        if include:
+            params["include"] = ",".join(include)
+        
+        response = await self._http_client.get(endpoint, params if params else None)
+        
+        if return_pandas:
+            return to_dataframe(response)
+        return response
+    
+    async def get_many(
+        self,
+        risk_ids: List[int],
+        include: Optional[List[str]] = None,
+        return_pandas: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Obtém múltiplos riscos em paralelo.
+        
+        Args:
+            risk_ids: Lista de IDs de riscos.
+            include: Relacionamentos para incluir.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+        
+        Returns:
+            Lista de dados de riscos ou DataFrame.
+        """
+        async def fetch_risk(rid):
+            return await self.get(rid, include)
+        
+        risks = await self._execute_parallel(
+            fetch_risk,
+            risk_ids,
+            self._threading_config
+        )
+        
+        if return_pandas:
+            return to_dataframe(risks)
+        return risks
+    
+    # ==================== EXCLUSÃO ====================
+    
+    async def delete(self, risk_id: int) -> Dict[str, Any]:
+        """Exclui um risco.
+        
+        Args:
+            risk_id: ID do risco a excluir.
+        
+        Returns:
+            Resposta da API.
+        
+        Warning:
+            Esta ação é irreversível.
+        """
+        endpoint = f"{self._org_endpoint}/{risk_id}"
+        return await self._http_client.delete(endpoint)
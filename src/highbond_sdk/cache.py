@@ -0,0 +1,691 @@
+"""
+Cache de respostas GET para o HighBond SDK.
+"""
+import hashlib
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from fnmatch import fnmatch
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+
+def cache_key(
+    endpoint: str,
+    params: Optional[Dict[str, Any]] = None,
+    namespace: Optional[str] = None
+) -> str:
+    """Monta a chave de cache de um GET: endpoint mais parâmetros normalizados.
+    
+    Os parâmetros são ordenados e convertidos para texto, de modo que
+    ``{"a": 1, "b": 2}`` e ``{"b": "2", "a": "1"}`` geram a mesma chave.
+    
+    Args:
+        endpoint: Endpoint da API (sem base URL).
+        params: Parâmetros de query string.
+        namespace: Prefixo que separa as respostas de contextos diferentes
+            (ver `cache_namespace`).
+    
+    Returns:
+        Chave do cache.
+    """
+    key = endpoint
+    if params:
+        normalized = sorted(
+            (str(name), ",".join(map(str, value)) if isinstance(value, (list, tuple)) else str(value))
+            for name, value in params.items()
+            if value is not None
+        )
+        key = f"{endpoint}?{urlencode(normalized)}"
+    if namespace:
+        return f"{namespace} {key}"
+    return key
+
+
+def cache_namespace(base_url: str, token: str) -> str:
+    """Monta o prefixo das chaves de cache de um cliente: base URL e impressão do token.
+    
+    Um cache persistente compartilhado entre regiões ou tokens nunca entrega
+    a um contexto as respostas de outro. O token não é gravado: apenas os
+    primeiros caracteres do seu SHA-256.
+    
+    Args:
+        base_url: URL base da API (região).
+        token: Token de autenticação.
+    
+    Returns:
+        Prefixo para `cache_key`.
+    """
+    fingerprint = hashlib.sha256(token.encode()).hexdigest()[:16]
+    return f"{base_url.rstrip('/')}#{fingerprint}"
+
+
+def affected_by_write(endpoint: str) -> Callable[[str], bool]:
+    """Retorna o predicado dos endpoints em cache invalidados por uma escrita.
+    
+    Uma escrita em ``.../risks/55`` invalida o próprio risco, seus
+    sub-recursos e todas as listagens de riscos em cache (por exemplo
+    ``/orgs/1/objectives/7/risks`` e ``/orgs/1/risks``). Uma escrita em uma
+    coleção (``POST .../objectives/7/risks``) invalida todas as listagens do
+    mesmo tipo.
+    
+    Args:
+        endpoint: Endpoint da escrita (POST, PATCH, PUT ou DELETE).
+    
+    Returns:
+        Função que recebe um endpoint em cache e indica se deve ser descartado.
+    """
+    path = endpoint.split("?", 1)[0].rstrip("/")
+    segments = path.split("/")
+    if len(segments) >= 2 and segments[-1].isdigit():
+        resource_type = segments[-2]
+    else:
+        resource_type = segments[-1]
+    
+    def predicate(cached_endpoint: str) -> bool:
+        cached_path = cached_endpoint.rstrip("/")
+        return (
+            cached_path == path
+            or cached_path.startswith(path + "/")
+            or cached_path.rsplit("/", 1)[-1] == resource_type
+        )
+    return predicate
+
+
+@dataclass
+class CacheStats:
+    """Contadores de um cache de respostas.
+    
+    Attributes:
+        hits: Consultas atendidas pelo cache.
+        misses: Consultas que precisaram ir à API.
+        evictions: Entradas descartadas por limite de tamanho.
+        invalidations: Entradas descartadas por escritas ou `invalidate()`.
+        revalidations: Consultas atendidas pelo cache após um 304 da API.
+        entries: Entradas atualmente em cache.
+        bytes: Tamanho atual das respostas em cache.
+    """
+    
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    revalidations: int = 0
+    entries: int = 0
+    bytes: int = 0
+    
+    @property
+    def hit_rate(self) -> float:
+        """Fração das consultas atendidas pelo cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class CacheEntry:
+    """Resposta em cache com seus validadores HTTP.
+    
+    Attributes:
+        body: Corpo JSON da resposta.
+        fresh: False se a entrada expirou e só pode ser usada após revalidação.
+        etag: Valor do cabeçalho ``ETag`` da resposta.
+        last_modified: Valor do cabeçalho ``Last-Modified`` da resposta.
+    """
+    
+    body: bytes
+    fresh: bool = True
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def validators(self) -> Dict[str, str]:
+        """Cabeçalhos condicionais para revalidar a entrada."""
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+class CacheBackend:
+    """Interface de armazenamento do cache de respostas do `HighBondHTTPClient`.
+    
+    As respostas são guardadas como o corpo JSON em bytes, de modo que cada
+    consulta devolve objetos novos que o chamador pode alterar livremente.
+    Implementações devem ser seguras para uso concorrente por várias threads.
+    
+    Entradas expiradas que têm ``ETag`` ou ``Last-Modified`` são mantidas
+    como não válidas (``fresh=False``) até serem revalidadas com uma
+    requisição condicional ou descartadas pelos limites de tamanho.
+    
+    O tempo de vida de cada entrada vem de ``endpoint_ttls`` (padrões glob
+    comparados com o endpoint, o mais específico vence) ou de ``ttl``.
+    """
+    
+    ttl: Optional[float] = None
+    endpoint_ttls: Optional[Dict[str, Optional[float]]] = None
+    
+    def ttl_for(self, endpoint: str) -> Optional[float]:
+        """Retorna o tempo de vida de uma resposta de ``endpoint`` (None = não expira).
+        
+        Example:
+            >>> cache = MemoryCache(ttl=300, endpoint_ttls={"*/project_types*": 86400})
+            >>> cache.ttl_for("/orgs/1/project_types/9")
+            86400
+        """
+        matches = [
+            pattern for pattern in (self.endpoint_ttls or {})
+            if fnmatch(endpoint, pattern)
+        ]
+        if not matches:
+            return self.ttl
+        return self.endpoint_ttls[max(matches, key=len)]
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        """Retorna a entrada de ``key``, válida ou expirada com validadores (None se ausente).
+        
+        Entradas válidas contam como acerto; as demais, como falha.
+        """
+        raise NotImplementedError
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """Retorna o corpo em cache para ``key`` (None se ausente ou expirado)."""
+        entry = self.lookup(key)
+        return entry.body if entry is not None and entry.fresh else None
+    
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        """Guarda ``value`` para ``key``.
+        
+        Args:
+            key: Chave do cache (ver `cache_key`).
+            endpoint: Endpoint da resposta, usado na invalidação.
+            value: Corpo JSON da resposta.
+            ttl: Tempo de vida em segundos (None = `ttl_for(endpoint)`).
+            etag: Cabeçalho ``ETag`` da resposta, se houver.
+            last_modified: Cabeçalho ``Last-Modified`` da resposta, se houver.
+        """
+        raise NotImplementedError
+    
+    def refresh(
+        self,
+        key: str,
+        endpoint: str,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[bytes]:
+        """Renova a validade de uma entrada após um 304 e conta uma revalidação.
+        
+        Args:
+            key: Chave do cache.
+            endpoint: Endpoint da resposta.
+            ttl: Novo tempo de vida (None = `ttl_for(endpoint)`).
+            etag: Novo ``ETag`` (None mantém o atual).
+            last_modified: Novo ``Last-Modified`` (None mantém o atual).
+        
+        Returns:
+            Corpo em cache, ou None se a entrada foi descartada nesse meio tempo.
+        """
+        raise NotImplementedError
+    
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        """Descarta as entradas cujo endpoint satisfaz ``predicate``.
+        
+        Returns:
+            Número de entradas descartadas.
+        """
+        raise NotImplementedError
+    
+    def clear(self):
+        """Descarta todas as entradas."""
+        raise NotImplementedError
+    
+    def close(self):
+        """Libera os recursos do backend (nada a fazer por padrão)."""
+    
+    @property
+    def stats(self) -> CacheStats:
+        """Contadores de acertos, falhas e tamanho do cache."""
+        raise NotImplementedError
+
+
+class MemoryCache(CacheBackend):
+    """Cache LRU em memória com expiração por tempo.
+    
+    Quando ``max_entries`` ou ``max_bytes`` é ultrapassado, as entradas usadas
+    há mais tempo são descartadas.
+    
+    Example:
+        >>> client = HighBondClient(token="...", org_id=123, cache=MemoryCache(ttl=600))
+        >>> client.projects.get(1); client.projects.get(1)  # segunda chamada vem do cache
+        >>> client.cache.stats.hits
+        1
+    """
+    
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl: Optional[float] = 300.0,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None
+    ):
+        """
+        Args:
+            max_entries: Número máximo de respostas em cache.
+            max_bytes: Tamanho máximo somado das respostas em cache.
+            ttl: Tempo de vida padrão das entradas em segundos (None = não expiram).
+            endpoint_ttls: Tempo de vida por padrão glob de endpoint, por exemplo
+                ``{"*/project_types*": 86400}``.
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries deve ser pelo menos 1")
+        if max_bytes < 1:
+            raise ValueError("max_bytes deve ser pelo menos 1")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        
+        self._lock = threading.Lock()
+        # chave -> (expira_em, endpoint, corpo, etag, last_modified)
+        self._entries: "OrderedDict[str, Tuple[Optional[float], str, bytes, Optional[str], Optional[str]]]" = OrderedDict()
+        self._stats = CacheStats()
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats.misses += 1
+                return None
+            expires, _, value, etag, last_modified = entry
+            fresh = expires is None or expires > time.monotonic()
+            if not fresh and not (etag or last_modified):
+                self._remove(key)
+                self._stats.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if fresh:
+                self._stats.hits += 1
+            else:
+                self._stats.misses += 1
+            return CacheEntry(value, fresh, etag, last_modified)
+    
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        if len(value) > self.max_bytes:
+            return
+        expires = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (expires, endpoint, value, etag, last_modified)
+            self._stats.entries += 1
+            self._stats.bytes += len(value)
+            while (len(self._entries) > self.max_entries
+                   or self._stats.bytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self._stats.evictions += 1
+    
+    def refresh(
+        self,
+        key: str,
+        endpoint: str,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[bytes]:
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, _, value, old_etag, old_last_modified = entry
+            self._entries[key] = (
+                time.monotonic() + ttl if ttl is not None else None,
+                endpoint,
+                value,
+                etag or old_etag,
+                last_modified or old_last_modified
+            )
+            self._entries.move_to_end(key)
+            self._stats.revalidations += 1
+            return value
+    
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        with self._lock:
+            keys = [key for key, entry in self._entries.items() if predicate(entry[1])]
+            for key in keys:
+                self._remove(key)
+            self._stats.invalidations += len(keys)
+            return len(keys)
+    
+    def clear(self):
+        with self._lock:
+            self._stats.invalidations += len(self._entries)
+            self._entries.clear()
+            self._stats.entries = 0
+            self._stats.bytes = 0
+    
+    def _remove(self, key: str):
+        """Remove uma entrada atualizando os contadores (chamado com o lock)."""
+        value = self._entries.pop(key)[2]
+        self._stats.entries -= 1
+        self._stats.bytes -= len(value)
+    
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(**vars(self._stats))
+    
+    def __repr__(self) -> str:
+        stats = self.stats
+        return (
+            f"MemoryCache(entries={stats.entries}, bytes={stats.bytes}, "
+            f"hits={stats.hits}, misses={stats.misses})"
+        )
+
+
+class SQLiteCache(CacheBackend):
+    """Cache persistente em um arquivo SQLite local.
+    
+    Os corpos JSON são comprimidos com zlib. Como o arquivo sobrevive ao
+    processo, execuções repetidas (notebooks, jobs agendados) começam com o
+    cache aquecido e só buscam na API o que expirou ou foi invalidado.
+    
+    - Expiração por tempo real (``time.time()``), com TTL por endpoint.
+    - Quando ``max_bytes`` (tamanho comprimido) ou ``max_entries`` é
+      ultrapassado, as entradas acessadas há mais tempo são descartadas até
+      sobrar ``EVICT_TO`` do limite, para que o descarte (que percorre a
+      tabela) não ocorra a cada gravação com o cache cheio. O
+      número de entradas e o total de bytes ficam em memória, de modo que
+      cada gravação não percorre a tabela; eles são recalculados a cada
+      descarte e a cada ``RECOUNT_INTERVAL`` gravações (para incluir o que
+      outros processos gravaram no mesmo arquivo).
+    - Uma conexão por instância, protegida por lock, para uso pelas threads do
+      pool; o modo WAL permite vários processos no mesmo arquivo.
+    
+    Example:
+        >>> cache = SQLiteCache(
+        ...     "~/.cache/highbond.db",
+        ...     ttl=3600,
+        ...     endpoint_ttls={"*/project_types*": 7 * 86400, "*/custom_attributes": 86400}
+        ... )
+        >>> client = HighBondClient(token="...", org_id=123, cache=cache)
+    """
+    
+    RECOUNT_INTERVAL = 1000
+    EVICT_TO = 0.9
+    
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = 3600.0,
+        endpoint_ttls: Optional[Dict[str, Optional[float]]] = None,
+        compression_level: int = 6
+    ):
+        """
+        Args:
+            path: Caminho do arquivo SQLite (criado se não existir).
+            max_bytes: Tamanho máximo somado das respostas comprimidas.
+            max_entries: Número máximo de respostas (None = sem limite).
+            ttl: Tempo de vida padrão das entradas em segundos (None = não expiram).
+            endpoint_ttls: Tempo de vida por padrão glob de endpoint.
+            compression_level: Nível de compressão zlib (0-9).
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes deve ser pelo menos 1")
+        if max_entries is not None and max_entries < 1:
+            raise ValueError("max_entries deve ser pelo menos 1")
+        self.path = os.path.expanduser(path)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.endpoint_ttls = dict(endpoint_ttls or {})
+        self.compression_level = compression_level
+        
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._invalidations = 0
+        self._revalidations = 0
+        self._entries = 0
+        self._bytes = 0
+        self._writes = 0
+        
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " endpoint TEXT NOT NULL,"
+                " body BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " expires_at REAL,"
+                " accessed_at REAL NOT NULL,"
+                " etag TEXT,"
+                " last_modified TEXT)"
+            )
+            # Arquivos criados antes dos validadores HTTP não têm essas colunas
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+            for column in ("etag", "last_modified"):
+                if column not in columns:
+                    self._conn.execute(f"ALTER TABLE responses ADD COLUMN {column} TEXT")
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+            self._recount()
+    
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, size, expires_at, etag, last_modified FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None:
+                self._misses += 1
+                return None
+            body, size, expires, etag, last_modified = row
+            fresh = expires is None or expires > now
+            if not fresh and not (etag or last_modified):
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._entries -= 1
+                self._bytes -= size
+                self._misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            if fresh:
+                self._hits += 1
+            else:
+                self._misses += 1
+        return CacheEntry(zlib.decompress(body), fresh, etag, last_modified)
+    
+    def set(
+        self,
+        key: str,
+        endpoint: str,
+        value: bytes,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ):
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        body = zlib.compress(value, self.compression_level)
+        if len(body) > self.max_bytes:
+            return
+        now = time.time()
+        expires = now + ttl if ttl is not None else None
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses"
+                " (key, endpoint, body, size, expires_at, accessed_at, etag, last_modified)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, len(body), expires, now, etag, last_modified)
+            )
+            if previous is None:
+                self._entries += 1
+            else:
+                self._bytes -= previous[0]
+            self._bytes += len(body)
+            self._writes += 1
+            if self._writes >= self.RECOUNT_INTERVAL:
+                self._recount()
+            if self._over_limit():
+                self._evict()
+    
+    def refresh(
+        self,
+        key: str,
+        endpoint: str,
+        ttl: Optional[float] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> Optional[bytes]:
+        ttl = self.ttl_for(endpoint) if ttl is None else ttl
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET expires_at = ?, accessed_at = ?,"
+                " etag = COALESCE(?, etag), last_modified = COALESCE(?, last_modified)"
+                " WHERE key = ?",
+                (now + ttl if ttl is not None else None, now, etag, last_modified, key)
+            )
+            self._revalidations += 1
+        return zlib.decompress(row[0])
+    
+    def _recount(self):
+        """Recalcula o número de entradas e o total de bytes a partir da tabela (chamado com o lock)."""
+        self._entries, self._bytes = self._conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+        ).fetchone()
+        self._writes = 0
+    
+    def _over_limit(self, fraction: float = 1.0) -> bool:
+        """Indica se ``fraction`` de ``max_bytes`` ou de ``max_entries`` foi ultrapassada (chamado com o lock)."""
+        return self._bytes > self.max_bytes * fraction or (
+            self.max_entries is not None and self._entries > self.max_entries * fraction
+        )
+    
+    def _evict(self):
+        """Descarta expiradas e, se preciso, as menos acessadas (chamado com o lock)."""
+        self._conn.execute(
+            "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),)
+        )
+        self._recount()
+        
+        victims = []
+        rows = self._conn.execute(
+            "SELECT key, size FROM responses ORDER BY accessed_at"
+        )
+        for key, entry_size in rows:
+            if not self._over_limit(self.EVICT_TO):
+                break
+            victims.append((key,))
+            self._bytes -= entry_size
+            self._entries -= 1
+        if victims:
+            self._conn.executemany("DELETE FROM responses WHERE key = ?", victims)
+            self._evictions += len(victims)
+    
+    def invalidate(self, predicate: Callable[[str], bool]) -> int:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT DISTINCT endpoint FROM responses"
+            ).fetchall()
+            endpoints = [(endpoint,) for (endpoint,) in rows if predicate(endpoint)]
+            if not endpoints:
+                return 0
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "DELETE FROM responses WHERE endpoint = ?", endpoints
+            )
+            removed = self._conn.total_changes - before
+            self._invalidations += removed
+            self._recount()
+            return removed
+    
+    def clear(self):
+        with self._lock:
+            removed = self._conn.execute("DELETE FROM responses").rowcount
+            self._invalidations += max(removed, 0)
+            self._recount()
+    
+    def purge_expired(self) -> int:
+        """Remove do arquivo as entradas expiradas.
+        
+        Returns:
+            Número de entradas removidas.
+        """
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?",
+                (time.time(),)
+            ).rowcount
+            self._recount()
+            return removed
+    
+    @property
+    def stats(self) -> CacheStats:
+        with self._lock:
+            self._recount()
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                revalidations=self._revalidations,
+                entries=self._entries,
+                bytes=self._bytes
+            )
+    
+    def close(self):
+        """Fecha a conexão com o arquivo SQLite."""
+        with self._lock:
+            self._conn.close()
+    
+    def __repr__(self) -> str:
+        return f"SQLiteCache(path={self.path!r}, ttl={self.ttl})"
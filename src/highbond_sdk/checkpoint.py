@@ -0,0 +1,159 @@
+"""
+Pontos de retomada (checkpoints) de listagens longas para o HighBond SDK.
+"""
+import json
+import os
+import threading
+import time
+from typing import Any, Dict, Optional, Set, Union
+
+
+class Checkpoint:
+    """Registra o progresso de listagens longas em um arquivo JSON local.
+    
+    Guarda, para cada paginação, o número de páginas já entregues e, para
+    cada fan-out, os IDs dos itens pai (issues, objetivos) cujos registros já
+    foram entregues. Se a listagem for interrompida (ex.:
+    `HighBondConnectionError` no meio de uma exportação), a mesma chamada com o
+    mesmo checkpoint continua da página ou do item pai seguinte, sem buscar
+    novamente o que já foi entregue.
+    
+    Uma página (ou item pai) só é marcada depois que todos os seus registros
+    foram consumidos pelo chamador. O arquivo é gravado de forma atômica a
+    cada ``flush_interval`` segundos e sempre que a listagem termina ou falha;
+    se o processo for morto, os registros entregues desde a última gravação
+    podem ser entregues de novo na retomada (nunca são perdidos).
+    
+    Como os registros já entregues não são repetidos, o chamador deve
+    persisti-los à medida que chegam: os métodos de listagem só aceitam
+    ``checkpoint`` com ``stream=True`` ou ``chunk_size`` (``ValueError``
+    caso contrário).
+    
+    Example:
+        >>> checkpoint = Checkpoint("export_riscos.ckpt")
+        >>> with open("riscos.jsonl", "a") as saida:
+        ...     for risco in client.risks.list_all(stream=True, checkpoint=checkpoint):
+        ...         saida.write(json.dumps(risco) + "\\n")
+        >>> checkpoint.clear()  # exportação concluída
+    """
+    
+    VERSION = 1
+    
+    def __init__(self, path: str, flush_interval: float = 1.0):
+        """
+        Args:
+            path: Caminho do arquivo de checkpoint (criado se não existir).
+            flush_interval: Intervalo mínimo, em segundos, entre gravações do
+                arquivo durante a listagem (0 = grava a cada página ou item pai).
+        """
+        self.path = os.path.expanduser(path)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._streams: Dict[str, Dict[str, Any]] = {}
+        self._parents: Dict[str, Set[str]] = {}
+        self._dirty = False
+        self._last_flush = 0.0
+        self._load()
+    
+    @classmethod
+    def resolve(cls, checkpoint: Union[str, "Checkpoint", None]) -> Optional["Checkpoint"]:
+        """Converte o parâmetro ``checkpoint`` dos métodos de listagem (caminho ou instância)."""
+        if checkpoint is None or isinstance(checkpoint, Checkpoint):
+            return checkpoint
+        return cls(checkpoint)
+    
+    def _load(self):
+        """Carrega o arquivo existente, se houver."""
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as f:
+            state = json.load(f)
+        if state.get("version") != self.VERSION:
+            raise ValueError(
+                f"Checkpoint {self.path} tem versão {state.get('version')!r}; "
+                f"esperado {self.VERSION}"
+            )
+        self._streams = state.get("streams", {})
+        self._parents = {key: set(ids) for key, ids in state.get("parents", {}).items()}
+    
+    # ==================== PAGINAÇÃO ====================
+    
+    def pages_done(self, key: str) -> int:
+        """Número de páginas já entregues da paginação ``key``."""
+        with self._lock:
+            return self._streams.get(key, {}).get("pages", 0)
+    
+    def mark_page(self, key: str, page: int):
+        """Registra que a página ``page`` (e as anteriores) de ``key`` foi entregue."""
+        with self._lock:
+            self._streams.setdefault(key, {})["pages"] = page
+            self._dirty = True
+        self._maybe_flush()
+    
+    # ==================== FAN-OUTS ====================
+    
+    def parent_done(self, key: str, parent_id: Any) -> bool:
+        """Indica se os registros do item pai ``parent_id`` em ``key`` já foram entregues."""
+        with self._lock:
+            return str(parent_id) in self._parents.get(key, ())
+    
+    def mark_parent(self, key: str, parent_id: Any):
+        """Registra que os registros do item pai ``parent_id`` em ``key`` foram entregues."""
+        with self._lock:
+            self._parents.setdefault(key, set()).add(str(parent_id))
+            self._dirty = True
+        self._maybe_flush()
+    
+    # ==================== CONCLUSÃO ====================
+    
+    def is_complete(self, key: str) -> bool:
+        """Indica se a listagem ``key`` (paginação ou fan-out) foi concluída."""
+        with self._lock:
+            return self._streams.get(key, {}).get("complete", False)
+    
+    def mark_complete(self, key: str):
+        """Registra que a listagem ``key`` foi concluída; os IDs pai deixam de ser necessários."""
+        with self._lock:
+            self._streams.setdefault(key, {})["complete"] = True
+            self._parents.pop(key, None)
+            self._dirty = True
+        self.flush()
+    
+    # ==================== ARQUIVO ====================
+    
+    def _maybe_flush(self):
+        """Grava o arquivo se o intervalo mínimo desde a última gravação já passou."""
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self):
+        """Grava o estado no arquivo (escrita atômica via arquivo temporário)."""
+        with self._lock:
+            if not self._dirty:
+                return
+            state = {
+                "version": self.VERSION,
+                "streams": self._streams,
+                "parents": {key: sorted(ids) for key, ids in self._parents.items()},
+            }
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.path}.tmp"
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(state, f, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+            self._dirty = False
+            self._last_flush = time.monotonic()
+    
+    def clear(self):
+        """Descarta todo o progresso e remove o arquivo."""
+        with self._lock:
+            self._streams.clear()
+            self._parents.clear()
+            self._dirty = False
+            if os.path.exists(self.path):
+                os.remove(self.path)
+    
+    def __repr__(self) -> str:
+        return f"Checkpoint(path={self.path!r})"
@@ -1,11 +1,17 @@
 """
 Cliente principal do HighBond SDK.
 """
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 from .config import APIConfig, PaginationConfig, ThreadingConfig, ClientConfig
 from .enums import Region
 from .http_client import HighBondHTTPClient
+from .concurrency import AdaptiveConcurrencyLimiter, WorkerPool
+from .hierarchy import HierarchyIndex
+from .cache import CacheBackend, MemoryCache, SQLiteCache
+from .sync import SyncResult, SyncStore, SQLiteSyncStore, Synchronizer
+from .export import Exporter
+from .snapshot import SnapshotEngine, SnapshotResult
 from .modules import (
     ProjectsModule,
     ProjectTypesModule,
@@ -65,6 +71,13 @@ class HighBondClient:
         max_pages: Optional[int] = None,
         max_workers: int = 5,
         threading_enabled: bool = True,
+        requests_per_second: Optional[float] = None,
+        adaptive_concurrency: bool = False,
+        prefetch_pages: int = 0,
+        parallel_pages: bool = False,
+        hierarchy_ttl: Optional[float] = 300.0,
+        cache: Union[bool, str, CacheBackend, None] = None,
+        coalesce_requests: bool = True,
         config: Optional[ClientConfig] = None
     ):
         """Inicializa o cliente HighBond.
@@ -80,6 +93,23 @@ class HighBondClient:
             max_pages: Máximo de páginas a buscar (None = todas).
             max_workers: Número máximo de workers para operações paralelas.
             threading_enabled: Se threading está habilitado.
+            requests_per_second: Limite de requisições por segundo compartilhado
+                por todas as threads (None = sem limite).
+            adaptive_concurrency: Se True, a concorrência é ajustada
+                automaticamente entre 1 e ``max_workers`` conforme a latência e
+                as respostas 429/5xx da API.
+            prefetch_pages: Páginas requisitadas antecipadamente em segundo
+                plano durante a paginação automática (0 = desligado).
+            parallel_pages: Se True, busca as páginas em paralelo quando a API
+                informa o total de páginas (padrão: False).
+            hierarchy_ttl: Tempo de vida, em segundos, do índice projeto →
+                objetivo compartilhado pelos módulos (None = não expira).
+            cache: Cache das respostas GET. True usa um `MemoryCache` com os
+                limites padrão; um caminho de arquivo usa um `SQLiteCache`
+                persistente; também aceita qualquer `CacheBackend`
+                (None/False = sem cache).
+            coalesce_requests: Se True, GETs idênticos feitos ao mesmo tempo
+                por várias threads compartilham uma única requisição.
             config: Configuração completa (sobrescreve outros parâmetros).
         
         Example:
@@ -106,31 +136,65 @@ class HighBondClient:
                 region=Region(region) if isinstance(region, str) else region,
                 timeout=timeout,
                 max_retries=max_retries,
-                retry_delay=retry_delay
+                retry_delay=retry_delay,
+                requests_per_second=requests_per_second,
+                coalesce_requests=coalesce_requests
             )
             pagination_config = PaginationConfig(
                 page_size=page_size,
-                max_pages=max_pages
+                max_pages=max_pages,
+                prefetch=prefetch_pages,
+                parallel=parallel_pages
             )
             threading_config = ThreadingConfig(
                 max_workers=max_workers,
-                enabled=threading_enabled
+                enabled=threading_enabled,
+                adaptive=adaptive_concurrency
             )
             self._config = ClientConfig(
                 api=api_config,
                 pagination=pagination_config,
-                threading=threading_config
+                threading=threading_config,
+                hierarchy_ttl=hierarchy_ttl
             )
         
         # Inicializa cliente HTTP
-        self._http_client = HighBondHTTPClient(self._config.api)
+        concurrency_limiter = None
+        if self._config.threading.adaptive:
+            concurrency_limiter = AdaptiveConcurrencyLimiter.from_config(
+                self._config.threading
+            )
+        # Pool de threads único, compartilhado por todos os módulos
+        self._worker_pool = WorkerPool(self._config.threading.max_workers)
+        # Caches criados aqui são fechados em close(); os recebidos prontos, não
+        self._owns_cache = cache is True or isinstance(cache, str)
+        if cache is True:
+            cache = MemoryCache()
+        elif isinstance(cache, str):
+            cache = SQLiteCache(cache)
+        self._http_client = HighBondHTTPClient(
+            self._config.api,
+            concurrency_limiter=concurrency_limiter,
+            worker_pool=self._worker_pool,
+            cache=cache or None
+        )
+        
+        # Índice projeto → objetivo compartilhado por projetos, objetivos, riscos e controles
+        self._hierarchy = HierarchyIndex(
+            self._http_client,
+            self._config.api.org_id,
+            self._config.pagination,
+            self._config.threading,
+            ttl=self._config.hierarchy_ttl
+        )
         
         # Inicializa módulos
         self._projects = ProjectsModule(
             self._http_client,
             self._config.api.org_id,
             self._config.pagination,
-            self._config.threading
+            self._config.threading,
+            hierarchy=self._hierarchy
         )
         self._project_types = ProjectTypesModule(
             self._http_client,
@@ -142,19 +206,22 @@ class HighBondClient:
             self._http_client,
             self._config.api.org_id,
             self._config.pagination,
-            self._config.threading
+            self._config.threading,
+            hierarchy=self._hierarchy
         )
         self._risks = RisksModule(
             self._http_client,
             self._config.api.org_id,
             self._config.pagination,
-            self._config.threading
+            self._config.threading,
+            hierarchy=self._hierarchy
         )
         self._controls = ControlsModule(
             self._http_client,
             self._config.api.org_id,
             self._config.pagination,
-            self._config.threading
+            self._config.threading,
+            hierarchy=self._hierarchy
         )
         self._issues = IssuesModule(
             self._http_client,
@@ -204,14 +271,125 @@ class HighBondClient:
         """Módulo de Ações."""
         return self._actions
     
+    @property
+    def export(self) -> Exporter:
+        """Exportação em streaming para Arrow/Parquet (requer ``pyarrow``).
+        
+        Example:
+            >>> client.export.to_parquet("risks", "riscos.parquet")
+        """
+        return Exporter(self)
+    
+    @property
+    def hierarchy(self) -> HierarchyIndex:
+        """Índice projeto → objetivo compartilhado pelos módulos.
+        
+        Example:
+            >>> client.hierarchy.project_of(789)
+            >>> client.hierarchy.refresh()
+        """
+        return self._hierarchy
+    
+    @property
+    def concurrency(self) -> Optional[AdaptiveConcurrencyLimiter]:
+        """Limitador adaptativo de concorrência (None se o modo adaptativo estiver desligado).
+        
+        Example:
+            >>> client.concurrency.limit
+            12
+            >>> client.concurrency.history[-3:]
+        """
+        return self._http_client.concurrency_limiter
+    
+    @property
+    def cache(self) -> Optional[CacheBackend]:
+        """Cache das respostas GET (None se desligado).
+        
+        Example:
+            >>> client.cache.stats.hit_rate
+            0.83
+            >>> client.cache.clear()
+        """
+        return self._http_client.cache
+    
     @property
     def config(self) -> ClientConfig:
         """Configuração do cliente."""
         return self._config
     
+    def sync(
+        self,
+        resources: Optional[List[str]] = None,
+        store: Union[str, SyncStore] = "highbond_sync.db",
+        full: bool = False,
+        reconcile_interval: Optional[float] = 7 * 86400
+    ) -> Dict[str, SyncResult]:
+        """Sincroniza recursos da organização com um store local (delta sync).
+        
+        A primeira execução lista tudo; as seguintes buscam apenas os registros
+        com ``updated_at`` posterior à última sincronização. Veja `Synchronizer`.
+        
+        Args:
+            resources: Recursos a sincronizar (padrão: projects, issues,
+                actions, risks e controls).
+            store: Caminho de um arquivo SQLite ou um `SyncStore`.
+            full: Se True, força listagem completa e reconciliação de exclusões.
+            reconcile_interval: Intervalo em segundos entre reconciliações
+                completas de IDs (None = apenas com ``full=True``).
+        
+        Returns:
+            Dicionário recurso → `SyncResult`.
+        
+        Example:
+            >>> results = client.sync(["issues", "actions"], store="hb.db")
+            >>> results["issues"].upserted
+            12
+        """
+        owns_store = isinstance(store, str)
+        if owns_store:
+            store = SQLiteSyncStore(store)
+        try:
+            synchronizer = Synchronizer(self, store, reconcile_interval=reconcile_interval)
+            return synchronizer.sync(resources, full=full)
+        finally:
+            if owns_store:
+                store.close()
+    
+    def snapshot(
+        self,
+        path: str = "highbond_snapshot.db",
+        backend: str = "sqlite",
+        resources: Optional[List[str]] = None,
+        batch_size: int = 1000
+    ) -> SnapshotResult:
+        """Grava um snapshot relacional da organização em um banco local.
+        
+        Projetos, objetivos, riscos, controles, issues e ações são listados ao
+        mesmo tempo e gravados em lotes em tabelas ligadas pelos IDs pai
+        (``project_id``, ``objective_id``, ``issue_id``). Veja `SnapshotEngine`.
+        
+        Args:
+            path: Caminho do banco (substituído ao final do snapshot).
+            backend: ``"sqlite"`` ou ``"duckdb"`` (requer o pacote ``duckdb``).
+            resources: Tabelas a preencher (padrão: todas).
+            batch_size: Registros por inserção em lote.
+        
+        Returns:
+            `SnapshotResult` com o número de registros por tabela.
+        
+        Example:
+            >>> client.snapshot("org.duckdb", backend="duckdb").counts
+            {'projects': 42, 'objectives': 310, 'risks': 2750, ...}
+        """
+        engine = SnapshotEngine(self, batch_size=batch_size)
+        return engine.run(path, backend=backend, resources=resources)
+    
     def close(self):
-        """Fecha conexões e libera recursos."""
+        """Fecha conexões, encerra o pool de threads e libera recursos."""
         self._http_client.close()
+        self._worker_pool.shutdown()
+        if self._owns_cache:
+            self._http_client.cache.close()
     
     def __enter__(self):
         """Suporte a context manager."""
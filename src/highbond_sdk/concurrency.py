@@ -0,0 +1,361 @@
+"""
+Controle de concorrência para o HighBond SDK.
+"""
+import time
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, Future, wait, FIRST_COMPLETED
+from typing import Optional, List, Tuple, Callable, Iterable, Iterator, Any
+
+from .config import ThreadingConfig
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limite de concorrência adaptativo no estilo AIMD.
+    
+    Aumenta o limite em ``increase_step`` a cada ``limit`` respostas
+    saudáveis (aumento aditivo) e o multiplica por ``decrease_factor``
+    quando recebe 429, 5xx ou erro de conexão (redução multiplicativa).
+    Respostas com latência acima de ``latency_tolerance`` vezes a menor
+    latência observada (mais ``latency_slack`` segundos) não aumentam o limite.
+    
+    O limitador é alimentado pelo `HighBondHTTPClient` a cada tentativa de
+    requisição e consultado por `ThreadingMixin._execute_parallel`.
+    
+    Example:
+        >>> client = HighBondClient(token="...", org_id=123,
+        ...                         max_workers=32, adaptive_concurrency=True)
+        >>> client.risks.list_all()
+        >>> client.concurrency.limit
+        14
+        >>> client.concurrency.history[-1]
+        (1718000000.0, 14, 'increase')
+    """
+    
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 5,
+        increase_step: int = 1,
+        decrease_factor: float = 0.5,
+        latency_tolerance: float = 2.0,
+        latency_slack: float = 0.05,
+        cooldown: float = 1.0,
+        history_size: int = 1000
+    ):
+        """
+        Args:
+            initial_limit: Limite inicial de concorrência.
+            min_limit: Limite mínimo.
+            max_limit: Limite máximo (teto de workers).
+            increase_step: Incremento aditivo aplicado a cada janela saudável.
+            decrease_factor: Fator multiplicativo aplicado em caso de erro (0 < f < 1).
+            latency_tolerance: Múltiplo da menor latência acima do qual a
+                resposta é considerada lenta.
+            latency_slack: Folga absoluta em segundos somada ao limiar de
+                latência, para que oscilações pequenas não contem como lentidão.
+            cooldown: Intervalo mínimo em segundos entre duas reduções, para
+                que uma rajada de erros conte como um único evento.
+            history_size: Quantidade de mudanças de limite mantidas no histórico.
+        """
+        if min_limit < 1:
+            raise ValueError("min_limit deve ser pelo menos 1")
+        if max_limit < min_limit:
+            raise ValueError("max_limit deve ser maior ou igual a min_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("decrease_factor deve estar entre 0 e 1")
+        
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.increase_step = increase_step
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.latency_slack = latency_slack
+        self.cooldown = cooldown
+        
+        self._limit = max(min_limit, min(max_limit, initial_limit))
+        self._successes = 0
+        self._min_latency: Optional[float] = None
+        self._last_decrease = 0.0
+        self._history = deque(maxlen=history_size)
+        self._lock = threading.Lock()
+        self._history.append((time.time(), self._limit, "initial"))
+    
+    @classmethod
+    def from_config(cls, config: ThreadingConfig) -> "AdaptiveConcurrencyLimiter":
+        """Cria um limitador a partir de uma `ThreadingConfig`."""
+        initial = config.initial_workers or max(config.min_workers, config.max_workers // 2)
+        return cls(
+            initial_limit=initial,
+            min_limit=config.min_workers,
+            max_limit=config.max_workers
+        )
+    
+    @property
+    def limit(self) -> int:
+        """Limite de concorrência atual."""
+        return self._limit
+    
+    @property
+    def history(self) -> List[Tuple[float, int, str]]:
+        """Mudanças de limite como tuplas ``(timestamp, limite, motivo)``."""
+        with self._lock:
+            return list(self._history)
+    
+    def _set_limit(self, limit: int, reason: str):
+        """Atualiza o limite e registra a mudança (chamado com o lock adquirido)."""
+        if limit != self._limit:
+            self._limit = limit
+            self._history.append((time.time(), limit, reason))
+    
+    def record(self, latency: float, status_code: Optional[int]):
+        """Registra o resultado de uma tentativa de requisição.
+        
+        Args:
+            latency: Duração da tentativa em segundos.
+            status_code: Status HTTP da resposta, ou None para erro de conexão.
+        """
+        with self._lock:
+            if status_code is None or status_code == 429 or status_code >= 500:
+                now = time.monotonic()
+                if now - self._last_decrease >= self.cooldown:
+                    self._last_decrease = now
+                    self._successes = 0
+                    self._set_limit(
+                        max(self.min_limit, int(self._limit * self.decrease_factor)),
+                        "decrease"
+                    )
+                return
+            
+            if self._min_latency is None or latency < self._min_latency:
+                self._min_latency = latency
+            if latency > self._min_latency * self.latency_tolerance + self.latency_slack:
+                return
+            
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._successes = 0
+                self._set_limit(
+                    min(self.max_limit, self._limit + self.increase_step),
+                    "increase"
+                )
+    
+    def __repr__(self) -> str:
+        return (
+            f"AdaptiveConcurrencyLimiter(limit={self._limit}, "
+            f"min={self.min_limit}, max={self.max_limit})"
+        )
+
+
+class WorkerPool:
+    """Pool de threads persistente, compartilhado por todos os módulos do cliente.
+    
+    Substitui o `ThreadPoolExecutor` criado a cada chamada de
+    `_execute_parallel`: as threads são criadas sob demanda na primeira
+    fan-out e vivem até `shutdown()` (chamado por `HighBondClient.close()`).
+    
+    Fan-outs aninhadas (projetos → objetivos → riscos) usam o mesmo orçamento
+    de ``max_workers`` threads. Para não haver deadlock quando todos os
+    workers estão esperando tarefas filhas, a thread que espera executa ela
+    mesma as tarefas que ainda não começaram.
+    
+    Example:
+        >>> with WorkerPool(max_workers=8) as pool:
+        ...     for item, future in pool.map(fetch, ids):
+        ...         print(item, future.result())
+    """
+    
+    _POLL_INTERVAL = 0.01
+    
+    def __init__(self, max_workers: int):
+        """
+        Args:
+            max_workers: Número máximo de threads do pool.
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers deve ser pelo menos 1")
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._closed = False
+        self._active = 0
+        self._lock = threading.Lock()
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Retorna o executor, criando-o na primeira utilização."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("WorkerPool já foi encerrado")
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="highbond"
+                )
+            return self._executor
+    
+    def _tracked(self, func: Callable, args: tuple, kwargs: dict) -> Any:
+        """Executa a tarefa contabilizando os workers ocupados."""
+        with self._lock:
+            self._active += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            with self._lock:
+                self._active -= 1
+    
+    @property
+    def saturated(self) -> bool:
+        """True se todos os workers estão ocupados."""
+        return self._active >= self.max_workers
+    
+    def submit(self, func: Callable, *args, **kwargs) -> Future:
+        """Submete uma tarefa ao pool."""
+        return self._get_executor().submit(self._tracked, func, args, kwargs)
+    
+    @staticmethod
+    def _run_inline(func: Callable, item: Any) -> Future:
+        """Executa a tarefa na thread atual e devolve um `Future` já resolvido."""
+        future = Future()
+        try:
+            future.set_result(func(item))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+    
+    def map(
+        self,
+        func: Callable,
+        items: Iterable[Any],
+        limit: Optional[Callable[[], int]] = None
+    ) -> Iterator[Tuple[Any, Future]]:
+        """Executa ``func`` para cada item, gerando ``(item, future)`` na ordem de conclusão.
+        
+        Args:
+            func: Função a ser executada para cada item.
+            items: Itens a processar.
+            limit: Função que retorna o número máximo de tarefas em execução
+                simultânea (None = todas submetidas de uma vez). Consultada a
+                cada submissão, permitindo limites adaptativos. Interromper a
+                iteração cancela as tarefas que ainda não começaram.
+        
+        Yields:
+            Tuplas ``(item, future)``; ``future.result()`` devolve o resultado
+            ou relança a exceção da tarefa.
+        """
+        pending = iter(items)
+        exhausted = False
+        in_flight = {}
+        stealable = deque()
+        
+        try:
+            while True:
+                while not exhausted and (limit is None or len(in_flight) < limit()):
+                    try:
+                        item = next(pending)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    future = self.submit(func, item)
+                    in_flight[future] = item
+                    stealable.append(future)
+                
+                if not in_flight:
+                    return
+                
+                done, _ = wait(
+                    in_flight,
+                    timeout=0 if self.saturated else self._POLL_INTERVAL,
+                    return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    # Com o pool ocupado, tarefas ainda na fila são executadas pela
+                    # própria thread que espera (evita deadlock em fan-outs aninhadas).
+                    stolen = None
+                    while stealable:
+                        future = stealable.pop()
+                        if future.cancel():
+                            stolen = future
+                            break
+                    if stolen is not None:
+                        item = in_flight.pop(stolen)
+                        yield item, self._run_inline(func, item)
+                        continue
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    yield in_flight.pop(future), future
+                
+                # Tarefas concluídas não podem mais ser roubadas; descartá-las
+                # (quando passam a maioria) mantém a memória proporcional às
+                # tarefas em voo, sem percorrer a fila a cada iteração
+                if len(stealable) > 2 * len(in_flight):
+                    stealable = deque(f for f in stealable if not f.done())
+        finally:
+            # Iteração interrompida: descarta as tarefas que ainda não começaram
+            for future in in_flight:
+                future.cancel()
+    
+    def map_ordered(
+        self,
+        func: Callable,
+        items: Iterable[Any],
+        window: int
+    ) -> Iterator[Tuple[Any, Future]]:
+        """Executa ``func`` com até ``window`` tarefas em voo, gerando ``(item, future)`` na ordem dos itens.
+        
+        ``items`` pode ser infinito: novos itens só são consumidos quando há
+        espaço na janela. Interromper a iteração cancela as tarefas que ainda
+        não começaram.
+        
+        Args:
+            func: Função a ser executada para cada item.
+            items: Itens a processar (consumidos sob demanda).
+            window: Número máximo de tarefas submetidas e ainda não entregues.
+        
+        Yields:
+            Tuplas ``(item, future)`` já resolvidas, na ordem de ``items``.
+        """
+        if window < 1:
+            raise ValueError("window deve ser pelo menos 1")
+        pending = iter(items)
+        queue = deque()
+        try:
+            while True:
+                while len(queue) < window:
+                    try:
+                        item = next(pending)
+                    except StopIteration:
+                        break
+                    queue.append((item, self.submit(func, item)))
+                if not queue:
+                    return
+                item, future = queue.popleft()
+                yield item, self._resolve(future, func, item)
+        finally:
+            for _, future in queue:
+                future.cancel()
+    
+    def _resolve(self, future: Future, func: Callable, item: Any) -> Future:
+        """Aguarda ``future``; se ainda estiver na fila com o pool ocupado, executa-o aqui."""
+        while not future.done():
+            if self.saturated and future.cancel():
+                return self._run_inline(func, item)
+            wait([future], timeout=self._POLL_INTERVAL)
+        return future
+    
+    def shutdown(self, wait: bool = True):
+        """Encerra o pool. Novas submissões passam a levantar RuntimeError."""
+        with self._lock:
+            self._closed = True
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+    
+    def __repr__(self) -> str:
+        return f"WorkerPool(max_workers={self.max_workers}, closed={self._closed})"
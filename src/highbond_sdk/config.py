@@ -18,6 +18,12 @@ class APIConfig:
         timeout: Timeout das requisições em segundos.
         max_retries: Número máximo de tentativas.
         retry_delay: Delay inicial entre tentativas em segundos.
+        requests_per_second: Limite de requisições por segundo compartilhado
+            por todas as threads (None = sem limite).
+        burst_size: Rajada máxima de requisições acima da taxa
+            (None = taxa arredondada para cima).
+        coalesce_requests: Se True, GETs idênticos simultâneos compartilham
+            uma única requisição em voo.
     """
     
     token: str
@@ -26,11 +32,18 @@ class APIConfig:
     timeout: int = 30
     max_retries: int = 3
     retry_delay: float = 1.0
+    requests_per_second: Optional[float] = None
+    burst_size: Optional[int] = None
+    coalesce_requests: bool = True
     
     def __post_init__(self):
         """Valida e normaliza os valores de configuração."""
         if isinstance(self.region, str):
             self.region = Region(self.region)
+        if self.requests_per_second is not None and self.requests_per_second <= 0:
+            raise ValueError("requests_per_second deve ser maior que zero")
+        if self.burst_size is not None and self.burst_size < 1:
+            raise ValueError("burst_size deve ser pelo menos 1")
     
     @property
     def base_url(self) -> str:
@@ -54,15 +67,25 @@ class PaginationConfig:
     Attributes:
         page_size: Número de itens por página (máximo 100).
         max_pages: Número máximo de páginas a buscar (None = todas).
+        prefetch: Número de páginas requisitadas antecipadamente em segundo
+            plano enquanto a página atual é consumida (0 = desligado,
+            máximo 10).
+        parallel: Se True, quando a primeira página informa o total de páginas
+            (``meta`` ou ``links.last``), as demais são buscadas em paralelo
+            (desligado por padrão: multiplica a carga instantânea na API).
     """
     
     page_size: int = 50
     max_pages: Optional[int] = None
+    prefetch: int = 0
+    parallel: bool = False
     
     def __post_init__(self):
         """Valida os valores de paginação."""
         if self.page_size < 1 or self.page_size > 100:
             raise ValueError("page_size deve estar entre 1 e 100")
+        if self.prefetch < 0 or self.prefetch > 10:
+            raise ValueError("prefetch deve estar entre 0 e 10")
 
 
 @dataclass
@@ -71,16 +94,31 @@ class ThreadingConfig:
     
     Attributes:
         max_workers: Número máximo de workers para operações paralelas.
+            No modo adaptativo é o teto da concorrência.
         enabled: Se threading está habilitado.
+        adaptive: Se True, a concorrência é ajustada automaticamente (AIMD)
+            conforme latência e respostas 429/5xx da API.
+        min_workers: Piso da concorrência no modo adaptativo.
+        initial_workers: Concorrência inicial no modo adaptativo
+            (None = metade de max_workers).
     """
     
     max_workers: int = 5
     enabled: bool = True
+    adaptive: bool = False
+    min_workers: int = 1
+    initial_workers: Optional[int] = None
     
     def __post_init__(self):
         """Valida os valores de threading."""
         if self.max_workers < 1:
             raise ValueError("max_workers deve ser pelo menos 1")
+        if self.min_workers < 1 or self.min_workers > self.max_workers:
+            raise ValueError("min_workers deve estar entre 1 e max_workers")
+        if self.initial_workers is not None and not (
+            self.min_workers <= self.initial_workers <= self.max_workers
+        ):
+            raise ValueError("initial_workers deve estar entre min_workers e max_workers")
 
 
 @dataclass
@@ -91,11 +129,14 @@ class ClientConfig:
         api: Configuração da API.
         pagination: Configuração de paginação.
         threading: Configuração de threading.
+        hierarchy_ttl: Tempo de vida, em segundos, do índice projeto → objetivo
+            compartilhado pelos módulos (None = não expira).
     """
     
     api: APIConfig
     pagination: PaginationConfig = field(default_factory=PaginationConfig)
     threading: ThreadingConfig = field(default_factory=ThreadingConfig)
+    hierarchy_ttl: Optional[float] = 300.0
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ClientConfig":
@@ -107,5 +148,6 @@ class ClientConfig:
         return cls(
             api=api_config,
             pagination=pagination_config,
-            threading=threading_config
+            threading=threading_config,
+            hierarchy_ttl=data.get("hierarchy_ttl", 300.0)
         )
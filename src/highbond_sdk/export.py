@@ -0,0 +1,504 @@
+"""
+Exportação em streaming para Arrow/Parquet no HighBond SDK.
+
+Requer o pacote opcional ``pyarrow`` (``pip install highbond-sdk[parquet]``).
+"""
+import itertools
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Generator, Iterable, List, Optional, Tuple
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - dependência opcional
+    pa = None
+    pq = None
+
+from .utils import _flatten_resources
+
+
+# Atributos customizados de cada recurso: chave nos registros → customizable_type
+CUSTOM_ATTRIBUTE_TYPES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    "projects": {"custom_attributes": ("CustomProjectPlanningAttribute", "CustomPlanningAttribute")},
+    "objectives": {"custom_attributes": ("CustomObjectiveAttribute",)},
+    "risks": {
+        "custom_attributes": ("CustomRiskAttribute",),
+        "custom_factors": ("CustomRiskFactor",),
+    },
+    "controls": {"custom_attributes": ("CustomControlAttribute",)},
+    "issues": {"custom_attributes": ("CustomFindingAttribute",)},
+    "actions": {"custom_attributes": ("CustomFindingActionAttribute",)},
+}
+
+
+@dataclass
+class ExportResult:
+    """Resultado de uma exportação.
+    
+    Attributes:
+        resource: Nome do recurso exportado.
+        path: Caminho do arquivo gerado.
+        rows: Registros gravados.
+        row_groups: Row groups gravados (um por lote).
+        columns: Colunas do arquivo, na ordem do esquema.
+        dropped_columns: Colunas que apareceram apenas depois do primeiro
+            lote e não cabiam no esquema (não gravadas).
+        coerced_columns: Colunas em que valores de lotes posteriores não
+            cabiam no tipo inferido do primeiro lote (ex.: um número com
+            casas decimais numa coluna ``int64``, um texto que não é data
+            numa coluna ``*_at``) e foram gravados como nulos.
+        duration: Duração em segundos.
+    """
+    
+    resource: str
+    path: str
+    rows: int = 0
+    row_groups: int = 0
+    columns: List[str] = field(default_factory=list)
+    dropped_columns: List[str] = field(default_factory=list)
+    coerced_columns: List[str] = field(default_factory=list)
+    duration: float = 0.0
+
+
+def _require_pyarrow():
+    """Garante que o ``pyarrow`` está instalado."""
+    if pa is None:
+        raise ImportError(
+            "A exportação para Parquet requer o pacote 'pyarrow'. "
+            "Instale com: pip install highbond-sdk[parquet]"
+        )
+
+
+def _parse_datetime(value: str) -> datetime:
+    """Converte um timestamp ISO-8601 da API (``...Z``) em datetime."""
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+def _parse_date(value: str) -> date:
+    """Converte uma data ISO-8601 (ou o início de um timestamp) em date."""
+    return date.fromisoformat(value[:10])
+
+
+def _try(parse: Callable[[Any], Any], value: Any) -> Any:
+    """Aplica ``parse``; valores que não podem ser convertidos viram None."""
+    try:
+        return parse(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _to_string(value: Any) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, default=str)
+
+
+def _to_string_list(value: Any) -> Optional[List[str]]:
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        value = [value]
+    return [_to_string(item) for item in value if item is not None]
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return None
+
+
+def _to_bool(value: Any) -> Optional[bool]:
+    return value if isinstance(value, bool) else None
+
+
+def _to_timestamp(value: Any) -> Optional[datetime]:
+    return _try(_parse_datetime, value) if isinstance(value, str) else None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    return _try(_parse_date, value) if isinstance(value, str) else None
+
+
+def _converter(arrow_type) -> Callable[[Any], Any]:
+    """Função que adapta um valor Python ao tipo Arrow da coluna."""
+    if pa.types.is_boolean(arrow_type):
+        return _to_bool
+    if pa.types.is_integer(arrow_type):
+        return _to_int
+    if pa.types.is_floating(arrow_type):
+        return _to_float
+    if pa.types.is_timestamp(arrow_type):
+        return _to_timestamp
+    if pa.types.is_date(arrow_type):
+        return _to_date
+    if pa.types.is_list(arrow_type):
+        return _to_string_list
+    return _to_string
+
+
+def _to_array(
+    values: List[Any],
+    arrow_type,
+    convert: Callable[[Any], Any]
+) -> Tuple["pa.Array", bool]:
+    """Monta a coluna Arrow, convertendo valor a valor só quando necessário.
+    
+    A conversão direta só é usada quando o tipo inferido pelo Arrow é o da
+    coluna ou pode ser convertido sem perda (``pa.array(values, type=...)``
+    truncaria ``1.5`` em ``1`` numa coluna inteira).
+    
+    Returns:
+        A coluna e se algum valor não nulo virou nulo por não caber no tipo.
+    """
+    if not (pa.types.is_timestamp(arrow_type) or pa.types.is_date(arrow_type)):
+        try:
+            array = pa.array(values)
+            return (array if array.type == arrow_type else array.cast(arrow_type)), False
+        except (TypeError, ValueError, pa.ArrowException):
+            pass
+    converted = [convert(value) for value in values]
+    coerced = any(new is None and old is not None for old, new in zip(values, converted))
+    return pa.array(converted, type=arrow_type), coerced
+
+
+def _infer_type(name: str, values: List[Any]):
+    """Infere o tipo Arrow de uma coluna a partir dos valores do primeiro lote.
+    
+    Colunas sem valores viram texto. Textos em colunas ``*_at``/``*_date`` que
+    são todos timestamps/datas ISO-8601 viram ``timestamp``/``date32``.
+    """
+    present = [value for value in values if value is not None]
+    if not present:
+        return pa.string()
+    kinds = set(map(type, present))
+    if kinds == {bool}:
+        return pa.bool_()
+    if kinds == {int}:
+        return pa.int64()
+    if kinds <= {int, float}:
+        return pa.float64()
+    if kinds == {str}:
+        if name.endswith("_at") and all(_try(_parse_datetime, value) for value in present):
+            return pa.timestamp("us", tz="UTC")
+        if name.endswith("_date") and all(_try(_parse_date, value) for value in present):
+            return pa.date32()
+        return pa.string()
+    if kinds == {list} and all(
+        isinstance(item, str) for value in present for item in value
+    ):
+        return pa.list_(pa.string())
+    return pa.string()
+
+
+def _custom_type(field_types: Iterable[str]):
+    """Tipo Arrow de um atributo customizado a partir do(s) ``field_type`` declarado(s)."""
+    field_types = set(field_types)
+    if "multiselect" in field_types:
+        return pa.list_(pa.string())
+    if field_types == {"date"}:
+        return pa.date32()
+    return pa.string()
+
+
+class Exporter:
+    """Exporta recursos da organização para Arrow/Parquet em streaming.
+    
+    Os registros chegam das listagens em streaming (``stream=True``) e são
+    convertidos em lotes (`pyarrow.RecordBatch`) de ``batch_size`` registros;
+    cada lote vira um row group gravado assim que fica pronto. A memória
+    depende do tamanho do lote, não do total de registros.
+    
+    O esquema é fixado no primeiro lote: ``id``, atributos sem prefixo,
+    relacionamentos como ``<nome>_id``/``<nome>_ids`` e atributos customizados
+    como ``<chave>.<termo>`` (ex.: ``custom_attributes.Nível``). Os tipos dos
+    atributos customizados vêm das definições dos tipos de projeto
+    (``select``/``text``/``paragraph`` → texto, ``multiselect`` → lista de
+    textos, ``date`` → data); os demais são inferidos do primeiro lote.
+    
+    Example:
+        >>> result = client.export.to_parquet("issues", "issues.parquet")
+        >>> result.rows, result.row_groups
+        (120000, 12)
+    """
+    
+    RESOURCES = ("projects", "objectives", "risks", "controls", "issues", "actions")
+    
+    def __init__(self, client):
+        """
+        Args:
+            client: `HighBondClient` usado nas requisições.
+        """
+        self.client = client
+    
+    def _records(
+        self,
+        resource: str,
+        filters: Optional[Dict[str, Any]]
+    ) -> Iterable[Dict[str, Any]]:
+        """Lista os registros de um recurso em streaming."""
+        if resource not in self.RESOURCES:
+            raise ValueError(
+                f"Recurso não suportado: {resource!r}. Use: {list(self.RESOURCES)}"
+            )
+        module = getattr(self.client, resource)
+        return module.list_all(filters=filters, stream=True)
+    
+    def custom_attribute_definitions(
+        self,
+        resource: str,
+        project_type_ids: Optional[List[Any]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """Definições dos atributos customizados de um recurso nos tipos de projeto.
+        
+        Args:
+            resource: Nome do recurso.
+            project_type_ids: Tipos de projeto consultados (None = todos os
+                tipos de projeto da organização).
+        
+        Returns:
+            Dicionário ``<chave>.<termo>`` → ``{"key", "term", "ids", "field_types"}``,
+            em que ``key`` é ``custom_attributes`` ou ``custom_factors``.
+        """
+        keys = CUSTOM_ATTRIBUTE_TYPES.get(resource, {})
+        if not keys:
+            return {}
+        if project_type_ids is None:
+            project_type_ids = [
+                project_type["id"]
+                for project_type in self.client.project_types.list_all(stream=True)
+            ]
+        
+        definitions: Dict[str, Dict[str, Any]] = {}
+        for project_type_id in project_type_ids:
+            attributes = self.client.project_types.list_all_custom_attributes(project_type_id)
+            for attr in attributes:
+                attrs = attr.get("attributes") or {}
+                for key, customizable_types in keys.items():
+                    if attrs.get("customizable_type") not in customizable_types:
+                        continue
+                    term = attrs.get("term")
+                    definition = definitions.setdefault(
+                        f"{key}.{term}",
+                        {"key": key, "term": term, "ids": set(), "field_types": set()}
+                    )
+                    definition["ids"].add(str(attr.get("id")))
+                    definition["field_types"].add(attrs.get("field_type"))
+        return definitions
+    
+    def iter_record_batches(
+        self,
+        resource: str,
+        batch_size: int = 10000,
+        filters: Optional[Dict[str, Any]] = None,
+        project_type_ids: Optional[List[Any]] = None,
+        custom_attribute_types: bool = True,
+        result: Optional[ExportResult] = None
+    ) -> Generator["pa.RecordBatch", None, None]:
+        """Gera os registros de um recurso como `pyarrow.RecordBatch`, um lote por vez.
+        
+        Todos os lotes têm o mesmo esquema, fixado no primeiro lote.
+        
+        Args:
+            resource: Recurso (projects, objectives, risks, controls, issues ou actions).
+            batch_size: Registros por lote.
+            filters: Filtros da listagem.
+            project_type_ids: Tipos de projeto cujas definições de atributos
+                customizados determinam os tipos das colunas (None = todos).
+            custom_attribute_types: Se False, não consulta os tipos de projeto e
+                infere os atributos customizados como listas de textos.
+            result: `ExportResult` a atualizar com as colunas, as colunas
+                descartadas e as colunas com valores gravados como nulos.
+        
+        Yields:
+            Um `pyarrow.RecordBatch` por lote.
+        
+        Raises:
+            ImportError: Se o pacote ``pyarrow`` não estiver instalado.
+            ValueError: Se o recurso não for suportado ou ``batch_size`` < 1.
+        """
+        _require_pyarrow()
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser pelo menos 1")
+        records = iter(self._records(resource, filters))
+        definitions = (
+            self.custom_attribute_definitions(resource, project_type_ids)
+            if custom_attribute_types else {}
+        )
+        custom_keys = tuple(CUSTOM_ATTRIBUTE_TYPES[resource])
+        
+        schema = None
+        converters: List[Callable[[Any], Any]] = []
+        dropped = set()
+        coerced = set()
+        while True:
+            batch = list(itertools.islice(records, batch_size))
+            if not batch:
+                break
+            columns = self._flatten(batch, custom_keys, definitions)
+            
+            if schema is None:
+                schema = self._schema(columns, definitions)
+                converters = [_converter(f.type) for f in schema]
+                if result is not None:
+                    result.columns = schema.names
+            dropped.update(name for name in columns if schema.get_field_index(name) < 0)
+            
+            arrays = []
+            for f, convert in zip(schema, converters):
+                values = columns.get(f.name)
+                if values is None:
+                    arrays.append(pa.nulls(len(batch), type=f.type))
+                else:
+                    array, lossy = _to_array(values, f.type, convert)
+                    arrays.append(array)
+                    if lossy:
+                        coerced.add(f.name)
+            if result is not None:
+                result.dropped_columns = sorted(dropped)
+                result.coerced_columns = sorted(coerced)
+            yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+    
+    @staticmethod
+    def _flatten(
+        batch: List[Dict[str, Any]],
+        custom_keys: Tuple[str, ...],
+        definitions: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, List[Any]]:
+        """Achata um lote em colunas, expandindo os atributos customizados por termo."""
+        columns: Dict[str, List[Any]] = {}
+        _flatten_resources(batch, "", columns)
+        columns.pop("type", None)
+        
+        ids = {
+            (definition["key"], attr_id): name
+            for name, definition in definitions.items()
+            for attr_id in definition["ids"]
+        }
+        for key in custom_keys:
+            entries = columns.pop(key, None)
+            if entries is None:
+                continue
+            expanded: Dict[str, List[Any]] = {}
+            for row, values in enumerate(entries):
+                for entry in values or ():
+                    if not isinstance(entry, dict):
+                        continue
+                    name = ids.get((key, str(entry.get("id")))) or f"{key}.{entry.get('term')}"
+                    value = entry.get("value")
+                    definition = definitions.get(name)
+                    # ``value`` vem como lista; só multiselect mantém a lista
+                    if definition and "multiselect" not in definition["field_types"] \
+                            and isinstance(value, list):
+                        value = value[0] if value else None
+                    column = expanded.get(name)
+                    if column is None:
+                        column = expanded[name] = [None] * len(batch)
+                    column[row] = value
+            columns.update(expanded)
+        return columns
+    
+    @staticmethod
+    def _schema(
+        columns: Dict[str, List[Any]],
+        definitions: Dict[str, Dict[str, Any]]
+    ) -> "pa.Schema":
+        """Monta o esquema: ``id``, colunas do primeiro lote e atributos customizados declarados."""
+        fields = [pa.field("id", pa.string())]
+        for name, values in columns.items():
+            if name == "id" or name in definitions:
+                continue
+            fields.append(pa.field(name, _infer_type(name, values)))
+        for name, definition in definitions.items():
+            fields.append(pa.field(name, _custom_type(definition["field_types"])))
+        return pa.schema(fields)
+    
+    def to_parquet(
+        self,
+        resource: str,
+        path: str,
+        batch_size: int = 10000,
+        filters: Optional[Dict[str, Any]] = None,
+        project_type_ids: Optional[List[Any]] = None,
+        custom_attribute_types: bool = True,
+        compression: str = "snappy"
+    ) -> ExportResult:
+        """Exporta um recurso para um arquivo Parquet, um row group por lote.
+        
+        O arquivo é gravado em ``<path>.tmp`` e movido para ``path`` apenas
+        quando a exportação termina, de modo que uma exportação interrompida
+        não deixa um Parquet incompleto no destino.
+        
+        Args:
+            resource: Recurso (projects, objectives, risks, controls, issues ou actions).
+            path: Caminho do arquivo Parquet.
+            batch_size: Registros por lote (e por row group).
+            filters: Filtros da listagem.
+            project_type_ids: Tipos de projeto cujas definições de atributos
+                customizados determinam os tipos das colunas (None = todos).
+            custom_attribute_types: Se False, não consulta os tipos de projeto.
+            compression: Compressão do Parquet (snappy, zstd, gzip, none...).
+        
+        Returns:
+            `ExportResult` com o número de registros e de row groups.
+        
+        Raises:
+            ImportError: Se o pacote ``pyarrow`` não estiver instalado.
+        """
+        _require_pyarrow()
+        started = time.time()
+        path = os.path.expanduser(path)
+        result = ExportResult(resource, path)
+        
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        
+        writer = None
+        try:
+            batches = self.iter_record_batches(
+                resource, batch_size, filters, project_type_ids,
+                custom_attribute_types, result
+            )
+            for batch in batches:
+                if writer is None:
+                    writer = pq.ParquetWriter(temp_path, batch.schema, compression=compression)
+                writer.write_table(pa.Table.from_batches([batch]))
+                result.rows += batch.num_rows
+                result.row_groups += 1
+            if writer is None:
+                # Nenhum registro: arquivo vazio apenas com a coluna id
+                writer = pq.ParquetWriter(
+                    temp_path, pa.schema([pa.field("id", pa.string())]), compression=compression
+                )
+                result.columns = ["id"]
+            writer.close()
+            writer = None
+            os.replace(temp_path, path)
+        finally:
+            if writer is not None:
+                writer.close()
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        
+        result.duration = time.time() - started
+        return result
+    
+    def __repr__(self) -> str:
+        return f"Exporter(client={self.client!r})"
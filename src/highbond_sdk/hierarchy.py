@@ -0,0 +1,215 @@
+"""
+Índice da hierarquia projeto → objetivo para o HighBond SDK.
+"""
+import copy
+import time
+import threading
+from typing import Optional, Dict, Any, Generator, List, Tuple
+
+from .http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
+from .config import PaginationConfig, ThreadingConfig
+
+
+class HierarchyIndex(PaginationMixin, ThreadingMixin):
+    """Índice compartilhado de projetos e objetivos da organização.
+    
+    Mapeia projeto → objetivos e objetivo → projeto. É montado sob demanda
+    (na primeira travessia) e reutilizado pelos módulos de objetivos, riscos
+    e controles do mesmo cliente, de modo que travessias repetidas da
+    organização viram consultas em memória.
+    
+    Cada entrada expira após ``ttl`` segundos; `refresh()` e `invalidate()`
+    forçam uma nova busca (as escritas de `ProjectsModule` e
+    `ObjectivesModule` do cliente invalidam as entradas afetadas). As chaves são os IDs como string (formato JSON:API),
+    de modo que ``objectives(123)`` e ``objectives("123")`` usam a mesma
+    entrada. As consultas devolvem cópias profundas dos registros indexados:
+    alterar um registro recebido (inclusive ``attributes`` e
+    ``relationships``) não altera o índice.
+    
+    Example:
+        >>> client.risks.list_all()          # monta o índice
+        >>> client.controls.list_by_project(123)  # reutiliza os objetivos
+        >>> client.hierarchy.project_of(789)
+        '123'
+        >>> client.hierarchy.refresh()
+    """
+    
+    def __init__(
+        self,
+        http_client: HighBondHTTPClient,
+        org_id: int,
+        pagination_config: PaginationConfig,
+        threading_config: ThreadingConfig,
+        ttl: Optional[float] = 300.0
+    ):
+        """
+        Args:
+            http_client: Cliente HTTP configurado.
+            org_id: ID da organização.
+            pagination_config: Configuração de paginação.
+            threading_config: Configuração de threading.
+            ttl: Tempo de vida das entradas em segundos (None = não expiram).
+        """
+        self._http_client = http_client
+        self._org_id = org_id
+        self._pagination_config = pagination_config
+        self._threading_config = threading_config
+        self.ttl = ttl
+        
+        self._lock = threading.Lock()
+        self._projects: Optional[Tuple[float, List[Dict[str, Any]]]] = None
+        self._projects_by_id: Dict[str, Dict[str, Any]] = {}
+        self._objectives: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+        self._objective_to_project: Dict[str, str] = {}
+        self._objectives_by_id: Dict[str, Dict[str, Any]] = {}
+    
+    @classmethod
+    def of(cls, module) -> "HierarchyIndex":
+        """Retorna o índice compartilhado de um módulo ou um índice descartável.
+        
+        Módulos criados fora do `HighBondClient` não têm índice compartilhado;
+        nesse caso é criado um índice válido apenas para a chamada atual.
+        """
+        hierarchy = getattr(module, "_hierarchy", None)
+        if hierarchy is not None:
+            return hierarchy
+        return cls(
+            module._http_client,
+            module._org_id,
+            module._pagination_config,
+            module._threading_config
+        )
+    
+    def _fresh(self, entry: Optional[Tuple[float, Any]]) -> bool:
+        """Indica se uma entrada existe e ainda não expirou."""
+        if entry is None:
+            return False
+        return self.ttl is None or time.monotonic() - entry[0] < self.ttl
+    
+    # ==================== CONSULTAS ====================
+    
+    def projects(self) -> List[Dict[str, Any]]:
+        """Lista os projetos da organização (do índice ou da API).
+        
+        Returns:
+            Lista de projetos.
+        """
+        return list(self.iter_projects())
+    
+    def iter_projects(self) -> Generator[Dict[str, Any], None, None]:
+        """Itera sobre os projetos, entregando-os conforme as páginas chegam.
+        
+        Com o índice válido, os projetos vêm da memória; caso contrário são
+        paginados e indexados ao final da iteração.
+        
+        Yields:
+            Cada projeto da organização.
+        """
+        entry = self._projects
+        if self._fresh(entry):
+            yield from [copy.deepcopy(projeto) for projeto in entry[1]]
+            return
+        
+        projetos = []
+        for projeto in self._paginate(
+            f"/orgs/{self._org_id}/projects",
+            self._pagination_with()
+        ):
+            projetos.append(projeto)
+            yield copy.deepcopy(projeto)
+        with self._lock:
+            self._projects = (time.monotonic(), projetos)
+            self._projects_by_id = {str(projeto["id"]): projeto for projeto in projetos}
+    
+    def objectives(self, project_id: Any) -> List[Dict[str, Any]]:
+        """Lista os objetivos de um projeto (do índice ou da API).
+        
+        Args:
+            project_id: ID do projeto.
+        
+        Returns:
+            Lista de objetivos do projeto.
+        """
+        project_id = str(project_id)
+        entry = self._objectives.get(project_id)
+        if not self._fresh(entry):
+            objetivos = list(self._paginate(
+                f"/orgs/{self._org_id}/projects/{project_id}/objectives",
+                self._pagination_with()
+            ))
+            entry = (time.monotonic(), objetivos)
+            with self._lock:
+                self._objectives[project_id] = entry
+                for obj in objetivos:
+                    self._objective_to_project[str(obj["id"])] = project_id
+                    self._objectives_by_id[str(obj["id"])] = obj
+        return [copy.deepcopy(obj) for obj in entry[1]]
+    
+    def all_objectives(self) -> List[Dict[str, Any]]:
+        """Lista os objetivos de todos os projetos, buscando em paralelo os que faltam.
+        
+        As buscas de objetivos começam conforme as páginas de projetos chegam.
+        
+        Returns:
+            Lista de objetivos de toda a organização.
+        """
+        return list(self._iter_pipeline(
+            self.iter_projects(),
+            [lambda proj: self.objectives(proj["id"])],
+            self._threading_config
+        ))
+    
+    def project(self, project_id: Any) -> Optional[Dict[str, Any]]:
+        """Retorna uma cópia de um projeto (do índice ou da API; None se desconhecido).
+        
+        Args:
+            project_id: ID do projeto.
+        """
+        if not self._fresh(self._projects):
+            self.projects()
+        project = self._projects_by_id.get(str(project_id))
+        return copy.deepcopy(project) if project is not None else None
+    
+    def project_of(self, objective_id: Any) -> Optional[Any]:
+        """Retorna o ID do projeto de um objetivo já indexado (None se desconhecido)."""
+        return self._objective_to_project.get(str(objective_id))
+    
+    def objective(self, objective_id: Any) -> Optional[Dict[str, Any]]:
+        """Retorna uma cópia de um objetivo já indexado (None se desconhecido)."""
+        objective = self._objectives_by_id.get(str(objective_id))
+        return copy.deepcopy(objective) if objective is not None else None
+    
+    # ==================== INVALIDAÇÃO ====================
+    
+    def invalidate(self, project_id: Optional[Any] = None):
+        """Descarta entradas do índice.
+        
+        Args:
+            project_id: Projeto cujos objetivos devem ser descartados. Se None,
+                descarta apenas a lista de projetos.
+        """
+        with self._lock:
+            if project_id is None:
+                self._projects = None
+                self._projects_by_id = {}
+                return
+            entry = self._objectives.pop(str(project_id), None)
+            if entry is not None:
+                for obj in entry[1]:
+                    self._objective_to_project.pop(str(obj["id"]), None)
+                    self._objectives_by_id.pop(str(obj["id"]), None)
+    
+    def refresh(self):
+        """Descarta o índice inteiro; a próxima consulta busca tudo novamente."""
+        with self._lock:
+            self._projects = None
+            self._projects_by_id = {}
+            self._objectives.clear()
+            self._objective_to_project.clear()
+            self._objectives_by_id.clear()
+    
+    def __repr__(self) -> str:
+        return (
+            f"HierarchyIndex(projects={len(self._projects[1]) if self._projects else 0}, "
+            f"objectives={len(self._objectives_by_id)}, ttl={self.ttl})"
+        )
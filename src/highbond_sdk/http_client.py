@@ -1,14 +1,27 @@
 """
 Cliente HTTP para o HighBond SDK.
 """
+import copy
 import time
+import json
 import base64
-from typing import Optional, Dict, Any, Generator, List
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import itertools
+import asyncio
+import threading
+from dataclasses import replace
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse, parse_qs
+from typing import Optional, Dict, Any, Callable, Generator, Iterable, List, Tuple, Union
 
 import requests
 
 from .config import APIConfig, PaginationConfig, ThreadingConfig
+from .concurrency import AdaptiveConcurrencyLimiter, WorkerPool
+from .cache import CacheBackend, cache_key, cache_namespace, affected_by_write
+from .checkpoint import Checkpoint
+from .included import IncludedIndex
+from .pipeline import TraversalPipeline
+from .utils import iter_dataframes, to_dataframe
 from .exceptions import (
     HighBondAPIError,
     HighBondAuthError,
@@ -20,26 +33,136 @@ from .exceptions import (
 )
 
 
-class HighBondHTTPClient:
-    """Cliente HTTP de baixo nível para a API HighBond.
+def _parse_retry_after(value: Optional[str], default: float = 5.0) -> float:
+    """Converte o header ``Retry-After`` (segundos ou data HTTP) em segundos.
     
-    Gerencia requisições HTTP, retry, tratamento de erros e sessão.
+    Args:
+        value: Valor do header (pode ser None).
+        default: Valor usado quando o header está ausente ou é inválido.
+        
+    Returns:
+        Segundos a aguardar (nunca negativo).
     """
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return default
+    if retry_at is None:
+        return default
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+class RateLimiter:
+    """Token bucket compartilhado por todas as threads de um cliente HTTP.
+    
+    Limita a taxa de requisições a ``requests_per_second`` (com rajadas de
+    até ``burst`` requisições) e permite pausar todas as threads até um
+    prazo comum, como o indicado pelo header ``Retry-After`` de um 429.
     
-    def __init__(self, config: APIConfig):
+    Sem ``requests_per_second`` o limitador não restringe a taxa, mas as
+    pausas continuam valendo para todas as threads.
+    """
+    
+    def __init__(
+        self,
+        requests_per_second: Optional[float] = None,
+        burst: Optional[int] = None
+    ):
         """
         Args:
-            config: Configuração da API.
+            requests_per_second: Taxa máxima sustentada (None = sem limite).
+            burst: Tamanho máximo de rajada (padrão: taxa arredondada para cima).
         """
-        self.config = config
-        self._session = requests.Session()
-        self._session.headers.update(config.headers)
+        if requests_per_second is not None and requests_per_second <= 0:
+            raise ValueError("requests_per_second deve ser maior que zero")
+        self.requests_per_second = requests_per_second
+        if requests_per_second is None:
+            self.burst = None
+        else:
+            self.burst = burst or max(1, int(requests_per_second + 0.999))
+        self._tokens = float(self.burst or 0)
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
     
-    def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
+    @property
+    def paused_until(self) -> float:
+        """Prazo (em ``time.monotonic()``) da pausa atual."""
+        return self._paused_until
+    
+    def reserve(self) -> float:
+        """Reserva um token e retorna quantos segundos aguardar antes de usá-lo."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._paused_until)
+            if self.requests_per_second is None:
+                return start - now
+            
+            elapsed = start - self._updated_at
+            if elapsed > 0:
+                self._tokens = min(
+                    float(self.burst),
+                    self._tokens + elapsed * self.requests_per_second
+                )
+                self._updated_at = start
+            
+            self._tokens -= 1
+            wait = start - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.requests_per_second
+            return wait
+    
+    def pause(self, seconds: float):
+        """Pausa todas as threads por ``seconds`` segundos a partir de agora.
+        
+        Pausas sobrepostas não se acumulam: vale o prazo mais distante.
+        Ao fim da pausa o balde recomeça vazio para evitar uma nova rajada.
+        """
+        with self._lock:
+            deadline = time.monotonic() + seconds
+            if deadline > self._paused_until:
+                self._paused_until = deadline
+                self._tokens = min(self._tokens, 0.0)
+                self._updated_at = max(self._updated_at, deadline)
+    
+    def _remaining_pause(self) -> float:
+        """Segundos restantes da pausa atual."""
+        return max(0.0, self._paused_until - time.monotonic())
+    
+    def acquire(self):
+        """Bloqueia a thread atual até que ela possa fazer uma requisição."""
+        wait = self.reserve()
+        while wait > 0:
+            time.sleep(wait)
+            # Uma pausa pode ter sido estendida enquanto dormíamos
+            wait = self._remaining_pause()
+    
+    async def acquire_async(self):
+        """Versão assíncrona de `acquire`."""
+        wait = self.reserve()
+        while wait > 0:
+            await asyncio.sleep(wait)
+            wait = self._remaining_pause()
+
+
+class ResponseHandlerMixin:
+    """Mixin com o mapeamento de respostas HTTP para exceções do SDK.
+    
+    Compartilhado pelos clientes síncrono e assíncrono para que ambos
+    tratem erros da API exatamente da mesma forma.
+    """
+    
+    def _handle_response(self, response: Any) -> Dict[str, Any]:
         """Processa a resposta e lança exceções apropriadas.
         
         Args:
-            response: Resposta da requisição.
+            response: Resposta da requisição (requests ou httpx).
             
         Returns:
             Dados JSON da resposta.
@@ -74,7 +197,7 @@ class HighBondHTTPClient:
         return data
     
     def _extract_error_message(
-        self, data: Dict[str, Any], response: requests.Response
+        self, data: Dict[str, Any], response: Any
     ) -> str:
         """Extrai mensagem de erro da resposta.
         
@@ -98,7 +221,65 @@ class HighBondHTTPClient:
                         messages.append(title or detail or str(error))
                 return " | ".join(messages)
         
-        return f"HTTP Error {response.status_code}: {response.reason}"
+        reason = getattr(response, "reason", None) or getattr(
+            response, "reason_phrase", ""
+        )
+        return f"HTTP Error {response.status_code}: {reason}"
+
+
+class _InFlightGet:
+    """GET em voo compartilhado por chamadas simultâneas idênticas."""
+    
+    __slots__ = ("done", "followers", "result", "error")
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.followers = 0
+        self.result: Optional[Dict[str, Any]] = None
+        self.error: Optional[BaseException] = None
+
+
+class HighBondHTTPClient(ResponseHandlerMixin):
+    """Cliente HTTP de baixo nível para a API HighBond.
+    
+    Gerencia requisições HTTP, retry, tratamento de erros e sessão.
+    """
+    
+    def __init__(
+        self,
+        config: APIConfig,
+        concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+        worker_pool: Optional[WorkerPool] = None,
+        cache: Optional[CacheBackend] = None
+    ):
+        """
+        Args:
+            config: Configuração da API.
+            concurrency_limiter: Limitador adaptativo alimentado com a latência
+                e o status de cada tentativa (opcional).
+            worker_pool: Pool de threads compartilhado pelos módulos que usam
+                este cliente (opcional).
+            cache: Cache das respostas GET (opcional). Escritas invalidam o
+                recurso afetado e as listagens do mesmo tipo.
+        """
+        self.config = config
+        self.rate_limiter = RateLimiter(
+            config.requests_per_second, config.burst_size
+        )
+        self.concurrency_limiter = concurrency_limiter
+        self.worker_pool = worker_pool
+        self.cache = cache
+        # Separa no cache as respostas de outras regiões e de outros tokens
+        self._cache_namespace = cache_namespace(config.base_url, config.token)
+        # Incrementado a cada invalidação: respostas buscadas durante uma
+        # escrita concorrente não são guardadas
+        self._cache_generation = 0
+        # GETs em voo por chave (endpoint + parâmetros normalizados)
+        self._in_flight: Dict[str, _InFlightGet] = {}
+        self._in_flight_lock = threading.Lock()
+        self.coalesced_requests = 0
+        self._session = requests.Session()
+        self._session.headers.update(config.headers)
     
     def _request_with_retry(
         self,
@@ -108,6 +289,11 @@ class HighBondHTTPClient:
     ) -> requests.Response:
         """Executa requisição com retry automático.
         
+        Cada tentativa passa pelo `RateLimiter` compartilhado. Um 429 pausa
+        todas as threads do cliente até o prazo do ``Retry-After``. Se houver
+        um `AdaptiveConcurrencyLimiter`, a latência e o status de cada
+        tentativa são repassados a ele.
+        
         Args:
             method: Método HTTP (GET, POST, etc).
             url: URL completa da requisição.
@@ -123,13 +309,17 @@ class HighBondHTTPClient:
         last_exception = None
         
         for attempt in range(self.config.max_retries):
+            self.rate_limiter.acquire()
+            started = time.monotonic()
             try:
                 response = self._session.request(method, url, **kwargs)
+                self._record_attempt(started, response.status_code)
                 
                 # Retry apenas em erros 5xx e 429
                 if response.status_code == 429:
-                    retry_after = int(response.headers.get("Retry-After", 5))
-                    time.sleep(retry_after)
+                    self.rate_limiter.pause(
+                        _parse_retry_after(response.headers.get("Retry-After"))
+                    )
                     continue
                     
                 if response.status_code >= 500:
@@ -140,6 +330,7 @@ class HighBondHTTPClient:
                 return response
                 
             except requests.exceptions.RequestException as e:
+                self._record_attempt(started, None)
                 last_exception = e
                 delay = self.config.retry_delay * (2 ** attempt)
                 time.sleep(delay)
@@ -148,6 +339,11 @@ class HighBondHTTPClient:
             f"Falha ao conectar após {self.config.max_retries} tentativas: {last_exception}"
         )
     
+    def _record_attempt(self, started: float, status_code: Optional[int]):
+        """Repassa o resultado de uma tentativa ao limitador adaptativo, se houver."""
+        if self.concurrency_limiter is not None:
+            self.concurrency_limiter.record(time.monotonic() - started, status_code)
+    
     def get(
         self,
         endpoint: str,
@@ -155,6 +351,19 @@ class HighBondHTTPClient:
     ) -> Dict[str, Any]:
         """Executa requisição GET.
         
+        Chamadas simultâneas para o mesmo endpoint e parâmetros compartilham
+        uma única requisição em voo (``APIConfig.coalesce_requests``): quem
+        chega depois espera o resultado da primeira e recebe uma cópia própria.
+        
+        Com um `CacheBackend` configurado, respostas de sucesso são guardadas
+        pela chave endpoint + parâmetros normalizados, prefixada pela base URL
+        e por uma impressão do token (`cache_namespace`), e servidas do cache
+        enquanto válidas.
+        
+        Entradas expiradas com ``ETag``/``Last-Modified`` são revalidadas com
+        ``If-None-Match``/``If-Modified-Since``; um 304 renova a entrada e
+        devolve o corpo em cache.
+        
         Args:
             endpoint: Endpoint da API (sem base URL).
             params: Parâmetros de query string.
@@ -162,9 +371,94 @@ class HighBondHTTPClient:
         Returns:
             Dados JSON da resposta.
         """
+        if not self.config.coalesce_requests:
+            return self._get(endpoint, params)
+        
+        key = cache_key(endpoint, params)
+        with self._in_flight_lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _InFlightGet()
+            else:
+                call.followers += 1
+                self.coalesced_requests += 1
+        
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+        
+        try:
+            data = self._get(endpoint, params)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+                followers = call.followers
+            if call.error is None and followers:
+                # Cópia intacta para os seguidores: o chamador pode alterar ``data``
+                call.result = copy.deepcopy(data)
+            call.done.set()
+        return data
+    
+    def _get(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Executa o GET (com cache e revalidação), sem coalescência."""
+        key = entry = None
+        headers = {}
+        if self.cache is not None:
+            key = cache_key(endpoint, params, self._cache_namespace)
+            entry = self.cache.lookup(key)
+            if entry is not None and entry.fresh:
+                return json.loads(entry.body)
+            if entry is not None:
+                # Entrada expirada com ETag/Last-Modified: revalida com GET condicional
+                headers = entry.validators
+            generation = self._cache_generation
+        
         url = f"{self.config.base_url}{endpoint}"
-        response = self._request_with_retry("GET", url, params=params)
-        return self._handle_response(response)
+        response = self._request_with_retry(
+            "GET", url, params=params, headers=headers or None
+        )
+        
+        if response.status_code == 304 and entry is not None:
+            body = self.cache.refresh(
+                key,
+                endpoint,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+            if body is None:
+                # Entrada invalidada durante a revalidação: busca sem condição
+                response = self._request_with_retry("GET", url, params=params)
+            else:
+                return json.loads(body)
+        
+        data = self._handle_response(response)
+        
+        if (key is not None and response.status_code == 200 and response.content
+                and generation == self._cache_generation):
+            self.cache.set(
+                key,
+                endpoint,
+                response.content,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+        return data
+    
+    def _invalidate_cache(self, endpoint: str):
+        """Descarta do cache o recurso escrito em ``endpoint`` e as listagens do mesmo tipo."""
+        if self.cache is not None:
+            self._cache_generation += 1
+            self.cache.invalidate(affected_by_write(endpoint))
     
     def post(
         self,
@@ -182,6 +476,7 @@ class HighBondHTTPClient:
         """
         url = f"{self.config.base_url}{endpoint}"
         response = self._request_with_retry("POST", url, json=data)
+        self._invalidate_cache(endpoint)
         return self._handle_response(response)
     
     def patch(
@@ -200,6 +495,7 @@ class HighBondHTTPClient:
         """
         url = f"{self.config.base_url}{endpoint}"
         response = self._request_with_retry("PATCH", url, json=data)
+        self._invalidate_cache(endpoint)
         return self._handle_response(response)
     
     def put(
@@ -218,6 +514,7 @@ class HighBondHTTPClient:
         """
         url = f"{self.config.base_url}{endpoint}"
         response = self._request_with_retry("PUT", url, json=data)
+        self._invalidate_cache(endpoint)
         return self._handle_response(response)
     
     def delete(self, endpoint: str) -> Dict[str, Any]:
@@ -231,6 +528,7 @@ class HighBondHTTPClient:
         """
         url = f"{self.config.base_url}{endpoint}"
         response = self._request_with_retry("DELETE", url)
+        self._invalidate_cache(endpoint)
         return self._handle_response(response)
     
     def close(self):
@@ -244,6 +542,13 @@ class HighBondHTTPClient:
         self.close()
 
 
+def _checkpoint_id(item: Any) -> Any:
+    """ID de um item pai no checkpoint: o ``id`` de recursos JSON:API ou o próprio item."""
+    if isinstance(item, dict) and "id" in item:
+        return item["id"]
+    return item
+
+
 class PaginationMixin:
     """Mixin para adicionar funcionalidade de paginação."""
     
@@ -258,53 +563,322 @@ class PaginationMixin:
         """
         return base64.b64encode(str(page).encode()).decode()
     
-    def _paginate(
+    def _pagination_with(
+        self,
+        max_pages: Optional[int] = None,
+        **overrides
+    ) -> PaginationConfig:
+        """Copia a configuração de paginação do módulo, sobrescrevendo ``max_pages``.
+        
+        Args:
+            max_pages: Máximo de páginas (None = mantém o valor configurado).
+            **overrides: Outros campos de `PaginationConfig` a sobrescrever
+                (valores None são ignorados).
+            
+        Returns:
+            Nova `PaginationConfig` com os demais campos preservados.
+        """
+        overrides = {key: value for key, value in overrides.items() if value is not None}
+        return replace(
+            self._pagination_config,
+            max_pages=max_pages or self._pagination_config.max_pages,
+            **overrides
+        )
+    
+    def _iter_pages(
         self,
         endpoint: str,
         pagination_config: PaginationConfig,
-        params: Optional[Dict[str, Any]] = None
+        params: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[Checkpoint] = None
     ) -> Generator[Dict[str, Any], None, None]:
-        """Itera sobre todas as páginas de um endpoint.
+        """Itera sobre as respostas completas de cada página de um endpoint.
+        
+        A primeira página é sempre buscada sozinha. Se ela informar o total de
+        páginas (``meta`` ou ``links.last``) e ``pagination_config.parallel``
+        estiver ativo, as páginas restantes são buscadas concorrentemente no
+        `WorkerPool` do cliente e entregues em ordem.
+        
+        Caso contrário, a iteração segue ``links.next``; com
+        ``pagination_config.prefetch > 0``, até ``prefetch`` páginas à frente
+        ficam em voo enquanto a atual é consumida. Nenhuma página além do total
+        informado pela primeira resposta, ou de uma página já recebida sem
+        ``links.next``, é requisitada; se o total estiver desatualizado, a
+        iteração continua seguindo ``links.next``.
+        
+        Com ``checkpoint``, cada página é registrada depois de consumida e a
+        iteração começa na página seguinte à última registrada.
         
         Args:
             endpoint: Endpoint da API.
             pagination_config: Configuração de paginação.
             params: Parâmetros adicionais de query string.
+            checkpoint: Checkpoint para retomar a paginação (None = desligado).
             
         Yields:
-            Cada item da resposta paginada.
+            Resposta JSON de cada página, em ordem.
         """
         http_client: HighBondHTTPClient = self._http_client
-        params = params or {}
-        params["page[size]"] = pagination_config.page_size
+        base_params = dict(params or {})
+        base_params["page[size]"] = pagination_config.page_size
+        
+        def fetch(page: int) -> Dict[str, Any]:
+            page_params = dict(base_params)
+            page_params["page[number]"] = self._encode_page_number(page)
+            return http_client.get(endpoint, page_params)
+        
+        if checkpoint is None:
+            for _, response in self._iter_numbered_pages(fetch, pagination_config):
+                yield response
+            return
+        
+        key = cache_key(endpoint, base_params)
+        if checkpoint.is_complete(key):
+            return
+        pages = self._iter_numbered_pages(
+            fetch, pagination_config, start=checkpoint.pages_done(key) + 1
+        )
+        try:
+            for page, response in pages:
+                yield response
+                checkpoint.mark_page(key, page)
+            checkpoint.mark_complete(key)
+        finally:
+            checkpoint.flush()
+    
+    def _iter_numbered_pages(
+        self,
+        fetch,
+        pagination_config: PaginationConfig,
+        start: int = 1
+    ) -> Generator[Tuple[int, Dict[str, Any]], None, None]:
+        """Busca as páginas a partir de ``start``, entregando pares (número, resposta)."""
+        max_pages = pagination_config.max_pages
+        if max_pages and start > max_pages:
+            return
+        
+        response = fetch(start)
+        yield start, response
+        if self._is_last_page(response) or start == max_pages:
+            return
+        
+        next_page = start + 1
+        window = self._parallel_page_window(pagination_config)
+        prefetch = pagination_config.prefetch
+        total = None
+        if window > 1 or prefetch:
+            total = self._total_pages(response, pagination_config.page_size)
+        if total and window > 1:
+            last = min(total, max_pages) if max_pages else total
+            responses = self._fetch_pages(fetch, range(next_page, last + 1), window)
+            for page, response in enumerate(responses, next_page):
+                yield page, response
+                if self._is_last_page(response):
+                    return
+            next_page = max(last + 1, next_page)
         
-        page = 1
-        pages_fetched = 0
+        # Segue links.next; com prefetch, até ``prefetch`` páginas ficam em voo,
+        # mas nunca além do total conhecido nem de uma página já recebida sem
+        # links.next (a menor delas fica em ``last_pages``)
+        last_pages = []
+        
+        def fetch_tracked(page: int) -> Dict[str, Any]:
+            page_response = fetch(page)
+            if self._is_last_page(page_response):
+                last_pages.append(page)
+            return page_response
+        
+        def numbers(first: int, stop: Optional[int]):
+            pages = range(first, stop + 1) if stop else itertools.count(first)
+            for page in pages:
+                if last_pages and page > min(last_pages):
+                    return
+                yield page
         
         while True:
-            params["page[number]"] = self._encode_page_number(page)
-            response = http_client.get(endpoint, params)
-            
-            data = response.get("data", [])
-            if isinstance(data, list):
-                for item in data:
-                    yield item
-            else:
-                yield data
+            if total and next_page > total:
+                # Total desatualizado (a página do total ainda tinha links.next)
+                total = None
+            if max_pages and next_page > max_pages:
                 return
+            stop = min(total, max_pages) if total and max_pages else total or max_pages
+            responses = self._fetch_pages(
+                fetch_tracked, numbers(next_page, stop), prefetch + 1
+            )
+            page = next_page - 1
+            for page, response in enumerate(responses, next_page):
+                yield page, response
+                if self._is_last_page(response):
+                    return
+            next_page = page + 1
+    
+    @staticmethod
+    def _is_last_page(response: Dict[str, Any]) -> bool:
+        """Indica se a resposta encerra a paginação (objeto único ou sem ``links.next``)."""
+        if not isinstance(response.get("data", []), list):
+            return True
+        return not (response.get("links") or {}).get("next")
+    
+    def _decode_page_number(self, value: str) -> Optional[int]:
+        """Decodifica um número de página em Base64 (None se inválido)."""
+        try:
+            return int(base64.b64decode(value).decode())
+        except (ValueError, TypeError):
+            return None
+    
+    def _total_pages(self, response: Dict[str, Any], page_size: int) -> Optional[int]:
+        """Obtém o total de páginas a partir de ``meta`` ou de ``links.last``.
+        
+        Args:
+            response: Resposta da primeira página.
+            page_size: Itens por página usados na requisição.
             
-            pages_fetched += 1
+        Returns:
+            Total de páginas, ou None se a resposta não o informar.
+        """
+        meta = response.get("meta") or {}
+        for key in ("page_count", "total_pages"):
+            if isinstance(meta.get(key), int):
+                return meta[key]
+        for key in ("total_count", "record_count"):
+            if isinstance(meta.get(key), int):
+                return max(1, -(-meta[key] // page_size))
+        
+        last = (response.get("links") or {}).get("last")
+        if last:
+            query = parse_qs(urlparse(last).query)
+            if query.get("page[number]"):
+                return self._decode_page_number(query["page[number]"][0])
+        return None
+    
+    def _parallel_page_window(self, pagination_config: PaginationConfig) -> int:
+        """Número de páginas buscadas simultaneamente quando o total é conhecido."""
+        threading_config = getattr(self, "_threading_config", None)
+        if (
+            not pagination_config.parallel
+            or threading_config is None
+            or not threading_config.enabled
+        ):
+            return 1
+        return threading_config.max_workers
+    
+    def _fetch_pages(
+        self,
+        fetch,
+        pages,
+        window: int
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Busca páginas com até ``window`` requisições em voo, entregando-as em ordem."""
+        if window <= 1:
+            for page in pages:
+                yield fetch(page)
+            return
+        
+        pool = getattr(self._http_client, "worker_pool", None)
+        owned = pool is None
+        if owned:
+            pool = WorkerPool(window)
+        
+        results = pool.map_ordered(fetch, pages, window)
+        try:
+            for _, future in results:
+                yield future.result()
+        finally:
+            results.close()
+            if owned:
+                pool.shutdown()
+    
+    @staticmethod
+    def _shape_result(
+        records: Iterable[Dict[str, Any]],
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        model: Optional[type] = None,
+        checkpoint: Optional[Checkpoint] = None
+    ):
+        """Entrega os registros de um método de listagem no formato pedido.
+        
+        Args:
+            records: Registros (normalmente um gerador ainda não consumido).
+            return_pandas: Se True, retorna um DataFrame; ``"jsonapi"`` monta o
+                DataFrame com `jsonapi_to_dataframe` (colunas ``id``, ``type``,
+                atributos e ``<relacionamento>_id``).
+            stream: Se True, retorna o próprio gerador, sem materializar a lista.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada (tem precedência sobre
+                ``return_pandas`` e ``stream``).
+            model: Classe de `models` em que cada registro é convertido
+                (``as_models=True`` nos módulos; None = dicionários).
+            checkpoint: Checkpoint da listagem, se houver. Só é aceito com
+                ``stream`` ou ``chunk_size``: o progresso é registrado conforme
+                os registros são consumidos, e uma lista montada em memória
+                se perderia numa falha enquanto o checkpoint já os daria como
+                entregues.
             
-            # Verifica limite de páginas
-            if pagination_config.max_pages and pages_fetched >= pagination_config.max_pages:
-                return
+        Returns:
+            Gerador, DataFrame, gerador de DataFrames ou lista de registros.
             
-            # Verifica se há próxima página
-            links = response.get("links", {})
-            if not links.get("next"):
-                return
+        Raises:
+            ValueError: Se ``stream`` e ``return_pandas`` forem usados juntos,
+                se ``chunk_size`` for menor que 1, se ``model`` for
+                combinado com ``return_pandas`` ou ``chunk_size``, ou se
+                ``checkpoint`` for usado sem ``stream`` nem ``chunk_size``.
+        """
+        if checkpoint is not None and not stream and chunk_size is None:
+            raise ValueError("checkpoint exige stream=True ou chunk_size")
+        if model is not None:
+            if return_pandas or chunk_size is not None:
+                raise ValueError(
+                    "as_models=True não pode ser combinado com return_pandas ou chunk_size"
+                )
+            records = (model.from_resource(record) for record in records)
+        jsonapi = return_pandas == "jsonapi"
+        if chunk_size is not None:
+            return iter_dataframes(records, chunk_size, jsonapi=jsonapi)
+        if stream:
+            if return_pandas:
+                raise ValueError("stream=True não pode ser combinado com return_pandas=True")
+            return records
+        records = list(records)
+        if return_pandas:
+            return to_dataframe(records, jsonapi=jsonapi)
+        return records
+    
+    def _paginate(
+        self,
+        endpoint: str,
+        pagination_config: PaginationConfig,
+        params: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        embed_included: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Itera sobre todas as páginas de um endpoint.
+        
+        Args:
+            endpoint: Endpoint da API.
+            pagination_config: Configuração de paginação.
+            params: Parâmetros adicionais de query string.
+            checkpoint: Checkpoint para retomar a paginação (None = desligado).
+            embed_included: Se True, os recursos de ``included`` de cada página
+                são indexados (`IncludedIndex`) e embutidos nos itens conforme
+                os caminhos de ``params["include"]``.
             
-            page += 1
+        Yields:
+            Cada item da resposta paginada.
+        """
+        paths = None
+        if embed_included:
+            paths = [path for path in str((params or {}).get("include") or "").split(",") if path]
+        for response in self._iter_pages(endpoint, pagination_config, params, checkpoint):
+            data = response.get("data", [])
+            items = data if isinstance(data, list) else [data]
+            if paths and response.get("included"):
+                index = IncludedIndex(response)
+                for item in items:
+                    index.embed(item, paths)
+            for item in items:
+                yield item
 
 
 class ThreadingMixin:
@@ -318,26 +892,250 @@ class ThreadingMixin:
     ) -> List[Any]:
         """Executa função em paralelo para múltiplos itens.
         
+        Usa o `WorkerPool` do cliente, compartilhado por todos os módulos e
+        pelas fan-outs aninhadas. Sem pool (módulo criado isoladamente), um
+        pool temporário é criado para a chamada.
+        
         Args:
             func: Função a ser executada para cada item.
             items: Lista de itens para processar.
             threading_config: Configuração de threading.
             
         Returns:
-            Lista de resultados.
+            Lista de resultados (na ordem de conclusão).
         """
         if not threading_config.enabled or len(items) <= 1:
             return [func(item) for item in items]
+        return list(self._iter_parallel(func, items, threading_config))
+    
+    def _iter_parallel(
+        self,
+        func,
+        items: Iterable[Any],
+        threading_config: ThreadingConfig
+    ) -> Generator[Any, None, None]:
+        """Versão em streaming de `_execute_parallel`.
         
-        results = []
-        with ThreadPoolExecutor(max_workers=threading_config.max_workers) as executor:
-            futures = {executor.submit(func, item): item for item in items}
+        Os itens são consumidos sob demanda e no máximo ``max_workers`` (ou o
+        limite adaptativo atual) tarefas ficam pendentes, de modo que a memória
+        não cresce com o número de itens. Falhas viram ``{"error", "item"}``.
+        
+        Args:
+            func: Função a ser executada para cada item.
+            items: Itens a processar (lista ou gerador).
+            threading_config: Configuração de threading.
             
-            for future in as_completed(futures):
+        Yields:
+            Resultado de cada item, na ordem de conclusão.
+        """
+        if not threading_config.enabled:
+            for item in items:
+                yield func(item)
+            return
+        
+        if threading_config.adaptive:
+            limiter = self._concurrency_limiter(threading_config)
+            limit = lambda: limiter.limit
+        else:
+            limit = lambda: threading_config.max_workers
+        
+        pool = getattr(self._http_client, "worker_pool", None)
+        owned = pool is None
+        if owned:
+            pool = WorkerPool(threading_config.max_workers)
+        
+        results = pool.map(func, items, limit=limit)
+        try:
+            for item, future in results:
                 try:
                     result = future.result()
-                    results.append(result)
                 except Exception as e:
-                    results.append({"error": str(e), "item": futures[future]})
+                    result = {"error": str(e), "item": item}
+                yield result
+        finally:
+            results.close()
+            if owned:
+                pool.shutdown()
+    
+    def _iter_fanout(
+        self,
+        func,
+        items: Iterable[Any],
+        threading_config: ThreadingConfig,
+        checkpoint: Optional[Checkpoint] = None,
+        checkpoint_key: Optional[str] = None,
+        item_id: Callable[[Any], Any] = None,
+        skip_errors: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Executa ``func`` (que retorna listas) em paralelo e entrega os registros achatados.
+        
+        Uma falha não interrompe os demais itens: depois que todos são
+        processados, a primeira exceção é relançada, a menos que
+        ``skip_errors`` seja True (itens com erro são então descartados). Com
+        ``checkpoint``, itens cujos registros já foram entregues são pulados e
+        cada item é registrado depois que seus registros são consumidos (veja
+        `_checkpoint_id`); a fan-out só é marcada como concluída sem falhas.
+        """
+        if checkpoint is not None:
+            key = checkpoint_key or func.__qualname__
+            item_id = item_id or _checkpoint_id
+            if checkpoint.is_complete(key):
+                return
+            items = (item for item in items if not checkpoint.parent_done(key, item_id(item)))
+        
+        def run(item):
+            # Devolve a exceção em vez de relançá-la para preservar seu tipo
+            try:
+                return item, func(item), None
+            except Exception as e:
+                return item, None, e
+        
+        error = None
+        try:
+            for item, records, exc in self._iter_parallel(run, items, threading_config):
+                if exc is not None:
+                    error = error or exc
+                    continue
+                if isinstance(records, list):
+                    yield from records
+                    if checkpoint is not None:
+                        checkpoint.mark_parent(key, item_id(item))
+            if error is None:
+                if checkpoint is not None:
+                    checkpoint.mark_complete(key)
+            elif not skip_errors:
+                raise error
+        finally:
+            if checkpoint is not None:
+                checkpoint.flush()
+    
+    def _iter_pipeline(
+        self,
+        source: Iterable[Any],
+        stages: List[Any],
+        threading_config: ThreadingConfig,
+        checkpoint: Optional[Checkpoint] = None,
+        checkpoint_key: Optional[str] = None,
+        item_id: Callable[[Any], Any] = None,
+        skip_errors: bool = False,
+        fail_fast: bool = False
+    ) -> Generator[Any, None, None]:
+        """Percorre uma hierarquia em pipeline com `TraversalPipeline`.
+        
+        Cada nível começa assim que o item pai chega, em vez de esperar o nível
+        anterior inteiro. Usa o `WorkerPool` do cliente e o mesmo limite de
+        tarefas em voo de `_iter_parallel`; com threading desativado, a
+        travessia é sequencial.
         
-        return results
+        A falha de um item não interrompe os demais: quando a fonte se esgota,
+        a primeira exceção registrada em `TraversalPipeline.errors` é
+        relançada, de modo que o chamador nunca recebe um resultado parcial
+        sem aviso. Com ``skip_errors=True``, os itens com erro são descartados;
+        com ``fail_fast=True``, a primeira falha é propagada imediatamente, como
+        em um laço sequencial.
+        
+        Com ``checkpoint``, os itens do último nível (os pais dos registros,
+        ex.: objetivos) cujos registros já foram entregues são pulados, e cada
+        um é registrado depois que seus registros são consumidos. Os níveis
+        anteriores são percorridos novamente na retomada.
+        
+        Args:
+            source: Itens do primeiro nível (lista ou gerador).
+            stages: Funções de expansão de cada nível; a última devolve os registros.
+            threading_config: Configuração de threading.
+            checkpoint: Checkpoint para retomar a travessia (None = desligado).
+            checkpoint_key: Chave da travessia no checkpoint (padrão: nome da
+                função do último nível).
+            item_id: Função que extrai o ID de um item do último nível
+                (padrão: `_checkpoint_id`).
+            skip_errors: Se True, descarta os itens com erro em vez de relançar
+                a primeira falha ao final.
+            fail_fast: Se True, propaga a primeira falha assim que ela ocorre e
+                cancela as tarefas que ainda não começaram.
+        
+        Yields:
+            Registros do último nível, na ordem de conclusão.
+        
+        Raises:
+            Exception: A primeira falha de um item, depois de entregues os
+                registros dos demais (exceto com ``skip_errors``).
+        """
+        if checkpoint is None:
+            pipeline, records = self._run_pipeline(
+                source, stages, threading_config, fail_fast
+            )
+            yield from records
+            if pipeline.errors and not skip_errors:
+                raise pipeline.errors[0][1]
+            return
+        
+        key = checkpoint_key or stages[-1].__qualname__
+        item_id = item_id or _checkpoint_id
+        if checkpoint.is_complete(key):
+            return
+        
+        last_stage = stages[-1]
+        
+        def expand_last(item):
+            # Devolve o item junto com os registros para registrá-lo após o consumo
+            if checkpoint.parent_done(key, item_id(item)):
+                return []
+            return [(item, list(last_stage(item)))]
+        
+        pipeline, results = self._run_pipeline(
+            source, list(stages[:-1]) + [expand_last], threading_config, fail_fast
+        )
+        try:
+            for item, records in results:
+                yield from records
+                checkpoint.mark_parent(key, item_id(item))
+            if not pipeline.errors:
+                checkpoint.mark_complete(key)
+            elif not skip_errors:
+                raise pipeline.errors[0][1]
+        finally:
+            checkpoint.flush()
+    
+    def _run_pipeline(
+        self,
+        source: Iterable[Any],
+        stages: List[Any],
+        threading_config: ThreadingConfig,
+        fail_fast: bool = False
+    ) -> Tuple[TraversalPipeline, Generator[Any, None, None]]:
+        """Cria o `TraversalPipeline` conforme a configuração e devolve (pipeline, registros)."""
+        if not threading_config.enabled:
+            pipeline = TraversalPipeline(None, fail_fast=fail_fast)
+            return pipeline, pipeline.run(source, stages)
+        
+        if threading_config.adaptive:
+            limiter = self._concurrency_limiter(threading_config)
+            limit = lambda: limiter.limit
+        else:
+            limit = lambda: threading_config.max_workers
+        
+        pool = getattr(self._http_client, "worker_pool", None)
+        owned = pool is None
+        if owned:
+            pool = WorkerPool(threading_config.max_workers)
+        
+        def run():
+            try:
+                yield from pipeline.run(source, stages)
+            finally:
+                if owned:
+                    pool.shutdown()
+        
+        pipeline = TraversalPipeline(pool, limit=limit, fail_fast=fail_fast)
+        return pipeline, run()
+    
+    def _concurrency_limiter(
+        self,
+        threading_config: ThreadingConfig
+    ) -> AdaptiveConcurrencyLimiter:
+        """Retorna o limitador adaptativo do cliente HTTP, criando-o se necessário."""
+        limiter = getattr(self._http_client, "concurrency_limiter", None)
+        if limiter is None:
+            limiter = AdaptiveConcurrencyLimiter.from_config(threading_config)
+            self._http_client.concurrency_limiter = limiter
+        return limiter
@@ -0,0 +1,142 @@
+"""
+Índice de recursos incluídos (``included``) de respostas JSON:API para o HighBond SDK.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+
+class IncludedIndex:
+    """Índice em hash dos recursos de ``included`` por ``(type, id)``.
+    
+    Com ``include=[...]`` a API devolve os recursos relacionados uma única vez
+    por página, em ``included``. O índice permite resolver cada relacionamento
+    de um registro em O(1), sem requisições extras, e embuti-lo no registro.
+    
+    Recursos embutidos são compartilhados (não copiados) entre os registros
+    que apontam para eles.
+    
+    Example:
+        >>> response = http_client.get(endpoint, {"include": "objective,objective.project"})
+        >>> index = IncludedIndex(response)
+        >>> for risk in response["data"]:
+        ...     index.embed(risk, ["objective", "objective.project"])
+        ...     print(risk["objective"]["project"]["attributes"]["name"])
+    """
+    
+    def __init__(self, source: Union[Dict[str, Any], Iterable[Dict[str, Any]], None] = None):
+        """
+        Args:
+            source: Resposta da API (usa a chave ``included``) ou lista de
+                recursos a indexar.
+        """
+        self._resources: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        if source is not None:
+            self.add(source)
+    
+    def add(self, source: Union[Dict[str, Any], Iterable[Dict[str, Any]]]) -> "IncludedIndex":
+        """Indexa os recursos de uma resposta (chave ``included``) ou de uma lista.
+        
+        Args:
+            source: Resposta da API ou lista de recursos.
+        
+        Returns:
+            O próprio índice.
+        """
+        if isinstance(source, dict):
+            source = source.get("included") or []
+        for resource in source:
+            if isinstance(resource, dict) and "type" in resource and "id" in resource:
+                self._resources[(resource["type"], str(resource["id"]))] = resource
+        return self
+    
+    def get(self, type_: str, id_: Any, default: Any = None) -> Optional[Dict[str, Any]]:
+        """Retorna o recurso ``(type_, id_)``, ou ``default`` se não estiver no índice."""
+        if id_ is None:
+            return default
+        return self._resources.get((type_, str(id_)), default)
+    
+    def resolve(self, identifier: Any) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Resolve um identificador (``{"type", "id"}``) ou uma lista deles.
+        
+        Identificadores ausentes do índice são ignorados nas listas e viram
+        None nos relacionamentos um-para-um.
+        """
+        if isinstance(identifier, list):
+            resolved = (self.resolve(item) for item in identifier)
+            return [resource for resource in resolved if resource is not None]
+        if isinstance(identifier, dict):
+            return self.get(identifier.get("type"), identifier.get("id"))
+        return None
+    
+    def related(
+        self,
+        record: Dict[str, Any],
+        relationship: str
+    ) -> Union[Dict[str, Any], List[Dict[str, Any]], None]:
+        """Retorna o(s) recurso(s) do relacionamento ``relationship`` de um registro.
+        
+        Args:
+            record: Recurso JSON:API.
+            relationship: Nome do relacionamento (ex.: ``"objective"``).
+        
+        Returns:
+            Recurso, lista de recursos ou None se o relacionamento não existir.
+        """
+        relationships = record.get("relationships") or {}
+        data = (relationships.get(relationship) or {}).get("data")
+        return self.resolve(data)
+    
+    def embed(
+        self,
+        record: Dict[str, Any],
+        paths: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """Embute no registro os recursos relacionados presentes no índice.
+        
+        Cada relacionamento resolvido vira uma chave do registro com o nome do
+        relacionamento (``record["objective"]``). Caminhos com ponto, como no
+        parâmetro ``include`` da API (``"objective.project"``), embutem também
+        nos recursos já embutidos.
+        
+        Args:
+            record: Recurso JSON:API (alterado no lugar).
+            paths: Caminhos a embutir (padrão: todos os relacionamentos do
+                registro, um nível).
+        
+        Returns:
+            O próprio registro.
+        """
+        if paths is None:
+            paths = list((record.get("relationships") or {}).keys())
+        for path in sorted(paths, key=lambda p: p.count(".")):
+            *parents, name = path.split(".")
+            targets = [record]
+            for parent in parents:
+                targets = [
+                    child
+                    for target in targets
+                    for child in _as_list(target.get(parent))
+                ]
+            for target in targets:
+                resolved = self.related(target, name)
+                if resolved is not None and resolved != []:
+                    target[name] = resolved
+        return record
+    
+    def __contains__(self, key: Tuple[str, Any]) -> bool:
+        type_, id_ = key
+        return (type_, str(id_)) in self._resources
+    
+    def __len__(self) -> int:
+        return len(self._resources)
+    
+    def __repr__(self) -> str:
+        return f"IncludedIndex(resources={len(self._resources)})"
+
+
+def _as_list(value: Any) -> List[Dict[str, Any]]:
+    """Normaliza um recurso embutido (ou lista deles) em lista."""
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    if isinstance(value, dict):
+        return [value]
+    return []
@@ -0,0 +1,296 @@
+"""
+Modelos compactos (``__slots__``) de registros JSON:API para o HighBond SDK.
+"""
+import sys
+from typing import Any, Dict, FrozenSet, Iterable, Optional, Tuple
+
+from .included import IncludedIndex
+
+_intern = sys.intern
+
+# Chaves de primeiro nível do formato JSON:API (as demais são anexadas pelo SDK)
+_RESOURCE_KEYS = frozenset(("id", "type", "attributes", "relationships", "links", "meta"))
+
+
+class Record:
+    """Registro JSON:API compacto, com os campos mais usados em ``__slots__``.
+    
+    Cada subclasse declara em ``FIELDS`` os atributos mais consultados, que
+    viram slots (``issue.title``); os demais atributos não nulos ficam em um
+    dicionário auxiliar e continuam acessíveis como atributos
+    (``issue.cause``) ou por `get`, que devolve None para atributos nulos
+    (não guardados). Os valores de ``ENUM_FIELDS`` (status,
+    severidade etc.) são internados com `sys.intern`, de modo que registros
+    com o mesmo valor compartilham a mesma string. ``links`` é descartado.
+    
+    Relacionamentos um-para-um listados em ``RELATIONSHIPS`` viram slots
+    ``<nome>_id`` (``risk.objective_id``); os demais são guardados como vieram.
+    Recursos anexados pelo SDK (``objective``, ``project``) viram modelos.
+    
+    Example:
+        >>> issues = client.issues.list_all(as_models=True)
+        >>> issues[0].title, issues[0].severity, issues[0].project_id
+        >>> issues[0].to_dict()  # volta ao formato JSON:API
+    """
+    
+    __slots__ = ("id", "_extra", "_related")
+    
+    TYPE: str = ""
+    FIELDS: Tuple[str, ...] = ()
+    ENUM_FIELDS: FrozenSet[str] = frozenset()
+    RELATIONSHIPS: Dict[str, str] = {}
+    PARENT_FIELDS: Tuple[str, ...] = ()
+    _FIELD_SET: FrozenSet[str] = frozenset()
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._FIELD_SET = frozenset(cls.FIELDS)
+    
+    @classmethod
+    def from_resource(cls, resource: Dict[str, Any]) -> "Record":
+        """Cria o modelo a partir de um recurso JSON:API (``{"id", "attributes", ...}``)."""
+        record = cls.__new__(cls)
+        record.id = resource.get("id")
+        
+        attributes = resource.get("attributes") or {}
+        fields = cls._FIELD_SET
+        enum_fields = cls.ENUM_FIELDS
+        extra = {}
+        for key, value in attributes.items():
+            if value is None:
+                continue
+            if value.__class__ is str and key in enum_fields:
+                value = _intern(value)
+            if key in fields:
+                setattr(record, key, value)
+            else:
+                extra[_intern(key)] = value
+        for name in cls.FIELDS:
+            if attributes.get(name) is None:
+                setattr(record, name, None)
+        record._extra = extra or None
+        
+        for name in cls.RELATIONSHIPS:
+            setattr(record, f"{name}_id", None)
+        for name in cls.PARENT_FIELDS:
+            setattr(record, name, None)
+        
+        related = {}
+        for name, relationship in (resource.get("relationships") or {}).items():
+            data = (relationship or {}).get("data")
+            if name in cls.RELATIONSHIPS:
+                if isinstance(data, dict):
+                    setattr(record, f"{name}_id", data.get("id"))
+            elif data is not None and data != []:
+                related[_intern(name)] = data
+        
+        # Chaves anexadas pelo SDK (project_id, objective, project, ...)
+        for key, value in resource.items():
+            if key in _RESOURCE_KEYS:
+                continue
+            if key in cls.PARENT_FIELDS or key.endswith("_id") and key[:-3] in cls.RELATIONSHIPS:
+                setattr(record, key, value)
+            elif value is not None:
+                related[_intern(key)] = to_model(value)
+        record._related = related or None
+        return record
+    
+    @classmethod
+    def from_response(
+        cls,
+        response: Dict[str, Any],
+        include: Optional[Iterable[str]] = None
+    ) -> "Record":
+        """Cria o modelo a partir de uma resposta de ``get`` (``{"data": ..., "included": ...}``).
+        
+        Args:
+            response: Resposta da API.
+            include: Relacionamentos pedidos; os recursos correspondentes de
+                ``included`` são embutidos no modelo.
+        """
+        resource = response.get("data") or {}
+        if include and response.get("included"):
+            IncludedIndex(response).embed(resource, include)
+        return cls.from_resource(resource)
+    
+    @property
+    def type(self) -> str:
+        """Tipo JSON:API do registro."""
+        return self.TYPE
+    
+    @property
+    def attributes(self) -> Dict[str, Any]:
+        """Atributos do registro (campos em slots + atributos auxiliares)."""
+        attributes = {name: getattr(self, name) for name in self.FIELDS}
+        if self._extra:
+            attributes.update(self._extra)
+        return attributes
+    
+    def get(self, name: str, default: Any = None) -> Any:
+        """Retorna um atributo, relacionamento ou recurso anexado pelo nome."""
+        try:
+            value = getattr(self, name)
+        except AttributeError:
+            return default
+        return default if value is None else value
+    
+    def __getattr__(self, name: str) -> Any:
+        # Chamado apenas para nomes que não são slots: atributos pouco usados
+        if not name.startswith("__"):
+            extra = object.__getattribute__(self, "_extra")
+            if extra and name in extra:
+                return extra[name]
+            related = object.__getattribute__(self, "_related")
+            if related and name in related:
+                return related[name]
+        raise AttributeError(f"{type(self).__name__!r} não tem o atributo {name!r}")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Converte o registro de volta ao formato JSON:API (sem ``links``)."""
+        relationships = {}
+        for name, type_ in self.RELATIONSHIPS.items():
+            related_id = getattr(self, f"{name}_id")
+            if related_id is not None:
+                relationships[name] = {"data": {"type": type_, "id": related_id}}
+        
+        resource = {"id": self.id, "type": self.TYPE, "attributes": self.attributes}
+        for name in self.PARENT_FIELDS:
+            value = getattr(self, name)
+            if value is not None:
+                resource[name] = value
+        for name, value in (self._related or {}).items():
+            if _is_identifier(value):
+                relationships[name] = {"data": value}
+            else:
+                resource[name] = _to_plain(value)
+        if relationships:
+            resource["relationships"] = relationships
+        return resource
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Record):
+            return NotImplemented
+        return self.TYPE == other.TYPE and self.id == other.id
+    
+    def __hash__(self) -> int:
+        return hash((self.TYPE, self.id))
+    
+    def __repr__(self) -> str:
+        label = next(
+            (getattr(self, name) for name in ("title", "name") if name in self.FIELDS),
+            None
+        )
+        return f"{type(self).__name__}(id={self.id!r}, {label!r})"
+
+
+class Project(Record):
+    """Projeto (``projects``)."""
+    
+    TYPE = "projects"
+    FIELDS = ("name", "state", "status", "start_date", "target_date", "created_at", "updated_at")
+    ENUM_FIELDS = frozenset(("state", "status"))
+    RELATIONSHIPS = {"project_type": "project_types"}
+    __slots__ = FIELDS + ("project_type_id",)
+
+
+class Objective(Record):
+    """Objetivo (``objectives``)."""
+    
+    TYPE = "objectives"
+    FIELDS = ("title", "reference", "division_department", "owner", "created_at", "updated_at")
+    ENUM_FIELDS = frozenset(("division_department", "owner"))
+    RELATIONSHIPS = {"project": "projects"}
+    __slots__ = FIELDS + ("project_id",)
+
+
+class Risk(Record):
+    """Risco (``risks``)."""
+    
+    TYPE = "risks"
+    FIELDS = ("title", "risk_id", "owner", "impact", "likelihood", "created_at", "updated_at")
+    ENUM_FIELDS = frozenset(("owner", "impact", "likelihood"))
+    RELATIONSHIPS = {"objective": "objectives"}
+    PARENT_FIELDS = ("project_id",)
+    __slots__ = FIELDS + ("objective_id",) + PARENT_FIELDS
+
+
+class Control(Record):
+    """Controle (``controls``)."""
+    
+    TYPE = "controls"
+    FIELDS = (
+        "title", "control_id", "owner", "frequency", "control_type",
+        "prevent_detect", "method", "status", "created_at", "updated_at"
+    )
+    ENUM_FIELDS = frozenset((
+        "owner", "frequency", "control_type", "prevent_detect", "method", "status"
+    ))
+    RELATIONSHIPS = {"objective": "objectives"}
+    PARENT_FIELDS = ("project_id",)
+    __slots__ = FIELDS + ("objective_id",) + PARENT_FIELDS
+
+
+class Issue(Record):
+    """Issue (``issues``)."""
+    
+    TYPE = "issues"
+    FIELDS = (
+        "title", "severity", "published", "closed", "remediation_status",
+        "remediation_date", "created_at", "updated_at"
+    )
+    ENUM_FIELDS = frozenset((
+        "severity", "remediation_status", "deficiency_type", "scope",
+        "escalation", "creator_name", "reference_prefix"
+    ))
+    RELATIONSHIPS = {"project": "projects"}
+    __slots__ = FIELDS + ("project_id",)
+
+
+class Action(Record):
+    """Ação (``actions``)."""
+    
+    TYPE = "actions"
+    FIELDS = (
+        "title", "status", "priority", "closed", "due_date", "completed_date",
+        "owner_name", "owner_email", "created_at", "updated_at"
+    )
+    ENUM_FIELDS = frozenset(("status", "priority", "owner_name", "owner_email"))
+    RELATIONSHIPS = {"issue": "issues"}
+    __slots__ = FIELDS + ("issue_id",)
+
+
+MODELS: Dict[str, type] = {
+    model.TYPE: model
+    for model in (Project, Objective, Risk, Control, Issue, Action)
+}
+
+
+def to_model(resource: Any) -> Any:
+    """Converte um recurso JSON:API (ou lista deles) no modelo do seu ``type``.
+    
+    Recursos de tipos sem modelo (ex.: ``users``) e valores que não são
+    recursos são devolvidos sem alteração.
+    """
+    if isinstance(resource, list):
+        return [to_model(item) for item in resource]
+    if isinstance(resource, dict):
+        model = MODELS.get(resource.get("type"))
+        if model is not None and "id" in resource:
+            return model.from_resource(resource)
+    return resource
+
+
+def _is_identifier(value: Any) -> bool:
+    """Indica se o valor é o ``data`` de um relacionamento (identificador ou lista deles)."""
+    if isinstance(value, list):
+        return all(_is_identifier(item) for item in value)
+    return isinstance(value, dict) and "id" in value and "attributes" not in value
+
+
+def _to_plain(value: Any) -> Any:
+    """Converte modelos anexados (ou listas deles) de volta em dicionários."""
+    if isinstance(value, Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_to_plain(item) for item in value]
+    return value
@@ -1,10 +1,16 @@
 """
 Módulo de Actions (Ações) para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List
+import itertools
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..cache import cache_key
+from ..checkpoint import Checkpoint
+from ..exceptions import HighBondAPIError, HighBondValidationError
+from ..included import IncludedIndex
+from ..models import Action
 from ..utils import to_dataframe
 
 
@@ -61,65 +67,57 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        checkpoint: Union[str, Checkpoint, None] = None,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todas as ações da organização com paginação automática.
         
-        Busca todas as issues da organização e depois todas as ações de cada issue,
-        utilizando multithreading para otimização.
+        As páginas de issues da organização são buscadas com ``include=actions``
+        e as ações vêm dos recursos incluídos em cada página. Apenas as issues
+        cujo relacionamento ``actions`` lista mais ações do que as incluídas
+        geram uma chamada a `list_by_issue` (em paralelo).
+        
+        Com ``filters``, que se aplicam às ações, ou se o servidor rejeitar
+        ``include=actions`` (400/422), a listagem volta a buscar as ações de
+        cada issue individualmente.
         
         Args:
-            include: Relacionamentos para incluir.
+            include: Relacionamentos das ações para incluir.
             filters: Filtros adicionais.
-            max_pages: Máximo de páginas a buscar (None = todas).
+            max_pages: Máximo de páginas de issues a buscar (None = todas).
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            checkpoint: Caminho ou `Checkpoint` para retomar uma listagem
+                interrompida a partir da última issue entregue (None = desligado).
+                Exige ``stream=True`` ou ``chunk_size``.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Action`) em vez de dicionários.
             
         Returns:
-            Lista de ações ou DataFrame.
+            Lista de ações, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> actions = client.actions.list_all()
             >>> print(f"Total de ações na org: {len(actions)}")
         """
-        # Buscar todas as issues da organização
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
+        checkpoint = Checkpoint.resolve(checkpoint)
+        actions = self._iter_issue_actions(
+            self._org_endpoint, include, filters, max_pages, checkpoint,
+            embed_included=embed_included
         )
-        
-        params = {}
-        if include:
-            params["include"] = ",".join(include)
-        if filters:
-            for key, value in filters.items():
-                params[f"filter[{key}]"] = value
-        
-        issues = list(self._paginate(self._org_endpoint, pagination, params))
-        issue_ids = [issue['id'] for issue in issues]
-        
-        if not issue_ids:
-            # Se não houver issues, retornar vazio
-            return [] if not return_pandas else to_dataframe([])
-        
-        # Buscar ações de todas as issues em paralelo
-        def fetch_actions_for_issue(issue_id):
-            return self.list_by_issue(issue_id, include=include, filters=filters, return_pandas=False)
-        
-        all_actions = self._execute_parallel(
-            fetch_actions_for_issue,
-            issue_ids,
-            self._threading_config
+        return self._shape_result(
+            actions, return_pandas, stream, chunk_size, Action if as_models else None,
+            checkpoint
         )
-        
-        # Flatten lista de listas
-        actions = []
-        for action_list in all_actions:
-            if isinstance(action_list, list):
-                actions.extend(action_list)
-        
-        if return_pandas:
-            return to_dataframe(actions)
-        return actions
     
     def list_by_project(
         self,
@@ -127,7 +125,11 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todas as ações de um projeto com paginação automática.
         
@@ -140,55 +142,146 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar (None = todas).
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Action`) em vez de dicionários.
             
         Returns:
-            Lista de ações ou DataFrame.
+            Lista de ações, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> actions = client.actions.list_by_project(project_id=546355)
             >>> print(f"Total de ações no projeto: {len(actions)}")
         """
-        # Buscar todas as issues do projeto
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
+        actions = self._iter_issue_actions(
+            self._project_endpoint(project_id), include, filters, max_pages,
+            embed_included=embed_included
         )
+        return self._shape_result(
+            actions, return_pandas, stream, chunk_size, Action if as_models else None
+        )
+    
+    def _iter_issue_actions(
+        self,
+        issues_endpoint: str,
+        include: Optional[List[str]],
+        filters: Optional[Dict[str, Any]],
+        max_pages: Optional[int],
+        checkpoint: Optional[Checkpoint] = None,
+        embed_included: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Itera sobre as ações das issues de um endpoint de listagem de issues.
+        
+        Sem ``filters``, as ações vêm de ``include=actions`` nas páginas de
+        issues; issues com ações faltando em ``included`` (ou sem o
+        relacionamento) são completadas com `list_by_issue`, em pipeline com
+        a paginação das issues.
+        Se o servidor rejeitar o ``include`` (400/422), todas as issues são
+        completadas com `list_by_issue`.
         
-        params = {}
-        if include:
-            params["include"] = ",".join(include)
-        if filters:
-            for key, value in filters.items():
-                params[f"filter[{key}]"] = value
-        
-        issues = list(self._paginate(
-            self._project_endpoint(project_id), pagination, params
-        ))
-        issue_ids = [issue['id'] for issue in issues]
-        
-        if not issue_ids:
-            # Se não houver issues, retornar vazio
-            return [] if not return_pandas else to_dataframe([])
+        Args:
+            issues_endpoint: Endpoint de listagem de issues.
+            include: Relacionamentos das ações para incluir.
+            filters: Filtros das ações.
+            max_pages: Máximo de páginas de issues a buscar.
+            checkpoint: Checkpoint em que cada issue é registrada depois que
+                suas ações são entregues (None = desligado).
+            embed_included: Se True, embute nas ações os relacionamentos de
+                ``include`` presentes em ``included``.
+        
+        Yields:
+            Cada ação encontrada.
+        """
+        pagination = self._pagination_with(max_pages)
         
-        # Buscar ações de todas as issues em paralelo
         def fetch_actions_for_issue(issue_id):
-            return self.list_by_issue(issue_id, include=include, filters=filters, return_pandas=False)
+            return self.list_by_issue(
+                issue_id, include=include, filters=filters, return_pandas=False,
+                embed_included=embed_included
+            )
+        
+        def iter_per_issue(params):
+            issue_ids = (
+                issue['id'] for issue in self._paginate(issues_endpoint, pagination, params)
+            )
+            return self._iter_pipeline(
+                issue_ids,
+                [fetch_actions_for_issue],
+                self._threading_config,
+                checkpoint=checkpoint,
+                checkpoint_key=cache_key(f"{issues_endpoint}#actions", params)
+            )
         
-        all_actions = self._execute_parallel(
-            fetch_actions_for_issue,
-            issue_ids,
-            self._threading_config
+        if filters:
+            # Filtros não se aplicam às ações incluídas: busca por issue
+            params = {f"filter[{key}]": value for key, value in filters.items()}
+            if include:
+                params["include"] = ",".join(include)
+            yield from iter_per_issue(params)
+            return
+        
+        params = {
+            "include": ",".join(["actions"] + [f"actions.{rel}" for rel in include or []])
+        }
+        pages = self._iter_pages(issues_endpoint, pagination, params)
+        try:
+            first = next(pages, None)
+        except HighBondAPIError as e:
+            if not isinstance(e, HighBondValidationError) and e.status_code != 400:
+                raise
+            # Servidor rejeitou include=actions: busca as ações de cada issue
+            yield from iter_per_issue({})
+            return
+        if first is None:
+            return
+        
+        def iter_work():
+            # Para cada issue: ("included", id, ações) se todas vieram na
+            # página, ou ("issue", id, None) se é preciso buscá-las
+            for response in itertools.chain([first], pages):
+                included = IncludedIndex(response)
+                for issue in response.get("data", []):
+                    relationship = (issue.get("relationships") or {}).get("actions") or {}
+                    refs = relationship.get("data")
+                    if not isinstance(refs, list):
+                        # Relacionamento ausente: não há como saber quantas ações existem
+                        yield ("issue", issue["id"], None)
+                        continue
+                    acoes = [
+                        included.get("actions", ref.get("id"))
+                        for ref in refs
+                        if ("actions", ref.get("id")) in included
+                    ]
+                    if embed_included and include:
+                        for acao in acoes:
+                            included.embed(acao, include)
+                    total = (relationship.get("meta") or {}).get("count", len(refs))
+                    if len(acoes) < max(total, len(refs)):
+                        yield ("issue", issue["id"], None)
+                    elif acoes:
+                        yield ("included", issue["id"], acoes)
+        
+        def resolve(work):
+            kind, issue_id, acoes = work
+            if kind == "included":
+                return acoes
+            return fetch_actions_for_issue(issue_id)
+        
+        # Issues com mais ações do que as incluídas são buscadas em paralelo
+        # enquanto as páginas de issues seguintes ainda estão chegando
+        yield from self._iter_pipeline(
+            iter_work(),
+            [resolve],
+            self._threading_config,
+            checkpoint=checkpoint,
+            checkpoint_key=cache_key(f"{issues_endpoint}#actions", params),
+            item_id=lambda work: work[1]
         )
-        
-        # Flatten lista de listas
-        actions = []
-        for action_list in all_actions:
-            if isinstance(action_list, list):
-                actions.extend(action_list)
-        
-        if return_pandas:
-            return to_dataframe(actions)
-        return actions
     
     def list_by_issue(
         self,
@@ -196,7 +289,11 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todas as ações de uma issue com paginação automática.
         
@@ -206,18 +303,23 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar (None = todas).
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Action`) em vez de dicionários.
             
         Returns:
-            Lista de ações ou DataFrame.
+            Lista de ações, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> actions = client.actions.list_by_issue(issue_id=999)
             >>> print(f"Total de ações: {len(actions)}")
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -226,13 +328,13 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        actions = list(self._paginate(
-            self._issue_actions_endpoint(issue_id), pagination, params
-        ))
-        
-        if return_pandas:
-            return to_dataframe(actions)
-        return actions
+        actions = self._paginate(
+            self._issue_actions_endpoint(issue_id), pagination, params,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            actions, return_pandas, stream, chunk_size, Action if as_models else None
+        )
     
     # ==================== OBTENÇÃO ====================
     
@@ -240,7 +342,8 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         self,
         action_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém uma ação específica por ID.
         
@@ -248,6 +351,8 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             action_id: ID da ação.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Action`) do registro.
             
         Returns:
             Dados da ação ou DataFrame.
@@ -264,16 +369,21 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         
         response = self._http_client.get(endpoint, params if params else None)
         
+        if as_models:
+            return Action.from_response(response, include)
         if return_pandas:
             data = response.get('data', {})
-            return to_dataframe([data] if isinstance(data, dict) else data)
+            return to_dataframe(
+                [data] if isinstance(data, dict) else data,
+                jsonapi=return_pandas == "jsonapi"
+            )
         return response
     
     def get_many(
         self,
         action_ids: List[int],
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplas ações em paralelo.
         
@@ -281,6 +391,7 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             action_ids: Lista de IDs de ações.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de ações ou DataFrame.
@@ -300,7 +411,7 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(actions)
+            return to_dataframe(actions, jsonapi=return_pandas == "jsonapi")
         return actions
     
     def get_many_by_issue(
@@ -308,7 +419,7 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         issue_id: int,
         max_actions: Optional[int] = None,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplas ações de uma issue em paralelo.
         
@@ -320,6 +431,7 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
             max_actions: Número máximo de ações a buscar (None = todas).
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de ações ou DataFrame.
@@ -351,7 +463,7 @@ class ActionsModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(detailed_actions)
+            return to_dataframe(detailed_actions, jsonapi=return_pandas == "jsonapi")
         return detailed_actions
     
     
@@ -1,10 +1,13 @@
 """
 Módulo de Controles para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..checkpoint import Checkpoint
+from ..hierarchy import HierarchyIndex
+from ..models import Control
 from ..utils import to_dataframe
 
 
@@ -20,7 +23,8 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         http_client: HighBondHTTPClient,
         org_id: int,
         pagination_config: PaginationConfig,
-        threading_config: ThreadingConfig
+        threading_config: ThreadingConfig,
+        hierarchy: Optional[HierarchyIndex] = None
     ):
         """
         Args:
@@ -28,11 +32,13 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             org_id: ID da organização.
             pagination_config: Configuração de paginação.
             threading_config: Configuração de threading.
+            hierarchy: Índice projeto → objetivo compartilhado pelo cliente (opcional).
         """
         self._http_client = http_client
         self._org_id = org_id
         self._pagination_config = pagination_config
         self._threading_config = threading_config
+        self._hierarchy = hierarchy
     
     @property
     def _org_endpoint(self) -> str:
@@ -50,7 +56,12 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        checkpoint: Union[str, Checkpoint, None] = None,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todos os controles da organização com paginação automática.
         
@@ -59,18 +70,26 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            checkpoint: Caminho ou `Checkpoint` para retomar uma listagem
+                interrompida de onde parou (None = desligado).
+                Exige ``stream=True`` ou ``chunk_size``.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Control`) em vez de dicionários.
             
         Returns:
-            Lista de todos os controles ou DataFrame.
+            Lista de todos os controles, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> for control in client.controls.list_all():
             ...     print(control['attributes']['title'])
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -79,11 +98,15 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        controles = list(self._paginate(self._org_endpoint, pagination, params))
-        
-        if return_pandas:
-            return to_dataframe(controles)
-        return controles
+        checkpoint = Checkpoint.resolve(checkpoint)
+        controles = self._paginate(
+            self._org_endpoint, pagination, params, checkpoint,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            controles, return_pandas, stream, chunk_size, Control if as_models else None,
+            checkpoint
+        )
     
     
     def list_by_project(
@@ -91,38 +114,61 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         project_id: int,
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        with_parent_ids: bool = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todos os controles de um projeto (buscando todos os objetivos e seus controles).
         
+        Os controles de cada objetivo são buscados em paralelo, conforme a
+        configuração de threading do cliente. A falha de um objetivo é
+        propagada e cancela as buscas que ainda não começaram.
+        
         Args:
             project_id: ID do projeto.
             include: Relacionamentos para incluir.
             filters: Filtros adicionais.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            with_parent_ids: Se True, adiciona 'objective_id' e 'project_id' em cada controle
+                (IDs JSON:API, como strings).
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Control`) em vez de dicionários.
             
         Returns:
-            Lista de controles do projeto ou DataFrame.
+            Lista de controles do projeto, DataFrame ou gerador (``stream=True``).
         """
-        from .objectives import ObjectivesModule
-        objectives_module = ObjectivesModule(
-            self._http_client,
-            self._org_id,
-            self._pagination_config,
-            self._threading_config
-        )
-        objetivos = list(objectives_module.list_by_project(project_id))
-        controles = []
-        for obj in objetivos:
-            controles_obj = self.list_by_objective(
+        def fetch_controls(obj):
+            controles = self.list_all_by_objective(
                 objective_id=obj["id"],
-                include=include
+                include=include,
+                filters=filters,
+                embed_included=embed_included
             )
-            if isinstance(controles_obj, dict) and "data" in controles_obj:
-                controles.extend(controles_obj["data"])
-        if return_pandas:
-            return to_dataframe(controles)
-        return controles
+            if with_parent_ids:
+                for controle in controles:
+                    controle["objective_id"] = obj["id"]
+                    controle["project_id"] = str(project_id)
+            return controles
+        
+        # Como no laço sequencial original, a falha de um objetivo interrompe a listagem
+        controles = self._iter_pipeline(
+            HierarchyIndex.of(self).objectives(project_id),
+            [fetch_controls],
+            self._threading_config,
+            fail_fast=True
+        )
+        return self._shape_result(
+            controles, return_pandas, stream, chunk_size, Control if as_models else None
+        )
     
     def list_by_objective(
         self,
@@ -130,9 +176,11 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         page: int = 1,
         page_size: int = 50,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
-        """Lista controles de um objetivo específico.
+        """Lista uma página de controles de um objetivo específico.
+        
+        Para percorrer todas as páginas, use `list_all_by_objective`.
         
         Args:
             objective_id: ID do objetivo.
@@ -140,6 +188,7 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             page_size: Itens por página.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Resposta completa da API ou DataFrame.
@@ -158,16 +207,75 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         
         # Adiciona informações do objetivo se necessário
         if return_pandas:
-            return to_dataframe(data)
+            return to_dataframe(data, jsonapi=return_pandas == "jsonapi")
         return response
     
+    def list_all_by_objective(
+        self,
+        objective_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        parallel: Optional[bool] = None,
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os controles de um objetivo com paginação automática.
+        
+        Ao contrário de `list_by_objective`, que retorna uma única página,
+        percorre todas as páginas do objetivo.
+        
+        Args:
+            objective_id: ID do objetivo.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            parallel: Se True/False, força ou desativa a busca das páginas em
+                paralelo (None = usa `PaginationConfig.parallel`).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Control`) em vez de dicionários.
+            
+        Returns:
+            Lista de controles, DataFrame ou gerador (``stream=True``).
+            
+        Example:
+            >>> controles = client.controls.list_all_by_objective(objective_id=789)
+        """
+        pagination = self._pagination_with(max_pages, parallel=parallel)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        controles = self._paginate(
+            self._objective_endpoint(objective_id), pagination, params,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            controles, return_pandas, stream, chunk_size, Control if as_models else None
+        )
+    
     # ==================== OBTENÇÃO ====================
     
     def get(
         self,
         control_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém um controle específico por ID.
         
@@ -175,6 +283,8 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             control_id: ID do controle.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Control`) do registro.
             
         Returns:
             Dados do controle ou DataFrame.
@@ -191,15 +301,17 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         
         response = self._http_client.get(endpoint, params if params else None)
         
+        if as_models:
+            return Control.from_response(response, include)
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     def get_many(
         self,
         control_ids: List[int],
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplos controles em paralelo.
         
@@ -207,6 +319,7 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
             control_ids: Lista de IDs de controles.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de dados de controles ou DataFrame.
@@ -221,7 +334,7 @@ class ControlsModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(controls)
+            return to_dataframe(controls, jsonapi=return_pandas == "jsonapi")
         return controls
     
     # ==================== CRIAÇÃO ====================
@@ -1,10 +1,12 @@
 """
 Módulo de Issues para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..checkpoint import Checkpoint
+from ..models import Issue
 from ..utils import to_dataframe
 
 
@@ -52,7 +54,12 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        checkpoint: Union[str, Checkpoint, None] = None,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todas as issues da organização com paginação automática.
         
@@ -61,18 +68,26 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            checkpoint: Caminho ou `Checkpoint` para retomar uma listagem
+                interrompida de onde parou (None = desligado).
+                Exige ``stream=True`` ou ``chunk_size``.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Issue`) em vez de dicionários.
             
         Returns:
-            Lista de issues ou DataFrame.
+            Lista de issues, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> for issue in client.issues.list_all():
             ...     print(issue['attributes']['title'])
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -81,11 +96,15 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        issues = list(self._paginate(self._org_endpoint, pagination, params))
-        
-        if return_pandas:
-            return to_dataframe(issues)
-        return issues
+        checkpoint = Checkpoint.resolve(checkpoint)
+        issues = self._paginate(
+            self._org_endpoint, pagination, params, checkpoint,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            issues, return_pandas, stream, chunk_size, Issue if as_models else None,
+            checkpoint
+        )
     
     
     def list_by_project(
@@ -94,7 +113,11 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todas as issues de um projeto com paginação automática.
         
@@ -104,14 +127,19 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Issue`) em vez de dicionários.
             
         Returns:
-            Lista de issues ou DataFrame.
+            Lista de issues, DataFrame ou gerador (``stream=True``).
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -120,42 +148,56 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        issues = list(self._paginate(
-            self._project_endpoint(project_id), pagination, params
-        ))
-        
-        if return_pandas:
-            return to_dataframe(issues)
-        return issues
+        issues = self._paginate(
+            self._project_endpoint(project_id), pagination, params,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            issues, return_pandas, stream, chunk_size, Issue if as_models else None
+        )
 
     
     def list_open(
         self,
         include: Optional[List[str]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> Generator[Dict[str, Any], None, None]:
         """Lista todas as issues abertas (status = open).
         
         Args:
             include: Relacionamentos para incluir.
             max_pages: Máximo de páginas.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Issue`) em vez de dicionários.
             
         Yields:
             Cada issue aberta.
             
         Example:
-            >>> open_issues = list(client.issues.list_open())
-            >>> print(f"Issues abertas: {len(open_issues)}")
+            >>> for issue in client.issues.list_open(stream=True):
+            ...     print(issue['id'])
         """
-
-        if return_pandas:
-            return to_dataframe(self.list_all(include=include,filters={"closed": "false"}))
-        
         return self.list_all(
             include=include,
             filters={"closed": "false"},
-            max_pages=max_pages
+            max_pages=max_pages,
+            return_pandas=return_pandas,
+            stream=stream,
+            chunk_size=chunk_size,
+            embed_included=embed_included,
+            as_models=as_models
         )
     
     # ==================== OBTENÇÃO ====================
@@ -164,7 +206,8 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
         self,
         issue_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém uma issue específica por ID.
         
@@ -172,6 +215,8 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             issue_id: ID da issue.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Issue`) do registro.
             
         Returns:
             Dados da issue ou DataFrame.
@@ -188,16 +233,21 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
         
         response = self._http_client.get(endpoint, params if params else None)
         
+        if as_models:
+            return Issue.from_response(response, include)
         if return_pandas:
             data = response.get('data', {})
-            return to_dataframe([data] if isinstance(data, dict) else data)
+            return to_dataframe(
+                [data] if isinstance(data, dict) else data,
+                jsonapi=return_pandas == "jsonapi"
+            )
         return response
     
     def get_many(
         self,
         issue_ids: List[int],
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplas issues em paralelo.
         
@@ -205,6 +255,7 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
             issue_ids: Lista de IDs de issues.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de dados de issues ou DataFrame.
@@ -220,7 +271,7 @@ class IssuesModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(issues)
+            return to_dataframe(issues, jsonapi=return_pandas == "jsonapi")
         return issues
     
     # ==================== CRIAÇÃO ====================
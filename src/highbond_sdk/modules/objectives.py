@@ -1,11 +1,13 @@
 """
 Módulo de Objetivos para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..hierarchy import HierarchyIndex
 from ..enums import ObjectiveType
+from ..models import Objective
 from ..utils import to_dataframe
 
 
@@ -21,7 +23,8 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
         http_client: HighBondHTTPClient,
         org_id: int,
         pagination_config: PaginationConfig,
-        threading_config: ThreadingConfig
+        threading_config: ThreadingConfig,
+        hierarchy: Optional[HierarchyIndex] = None
     ):
         """
         Args:
@@ -29,16 +32,75 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
             org_id: ID da organização.
             pagination_config: Configuração de paginação.
             threading_config: Configuração de threading.
+            hierarchy: Índice projeto → objetivo compartilhado pelo cliente (opcional).
         """
         self._http_client = http_client
         self._org_id = org_id
         self._pagination_config = pagination_config
         self._threading_config = threading_config
+        self._hierarchy = hierarchy
     
     def _base_endpoint(self, project_id: int) -> str:
         """Endpoint base para objetivos de um projeto."""
         return f"/orgs/{self._org_id}/projects/{project_id}/objectives"
     
+    def list_all(
+        self,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista os objetivos de todos os projetos da organização.
+        
+        Os objetivos de cada projeto são buscados em paralelo assim que sua
+        página de projetos chega. A listagem não usa nem preenche o índice de
+        hierarquia: com ``stream=True``, a memória depende dos objetivos de um
+        projeto por vez, não da organização inteira.
+        
+        Args:
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais, aplicados à listagem de cada projeto.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme os projetos são concluídos, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Objective`) em vez de dicionários.
+        
+        Returns:
+            Lista de objetivos, DataFrame ou gerador (``stream=True``).
+        
+        Example:
+            >>> for obj in client.objectives.list_all(stream=True):
+            ...     print(obj['attributes']['title'])
+        """
+        pagination = self._pagination_with()
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        def fetch_objectives(proj):
+            return list(self._paginate(
+                self._base_endpoint(proj["id"]), pagination, params,
+                embed_included=embed_included
+            ))
+        
+        projetos = self._paginate(f"/orgs/{self._org_id}/projects", pagination)
+        objetivos = self._iter_pipeline(projetos, [fetch_objectives], self._threading_config)
+        return self._shape_result(
+            objetivos, return_pandas, stream, chunk_size, Objective if as_models else None
+        )
     
     def list_by_project(
         self,
@@ -46,28 +108,46 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todos os objetivos de um projeto com paginação automática.
         
+        Sem ``include``, ``filters`` e ``max_pages``, o resultado vem do índice
+        de hierarquia do cliente (`client.hierarchy`) quando disponível.
+        
         Args:
             project_id: ID do projeto.
             include: Relacionamentos para incluir.
             filters: Filtros adicionais.
             max_pages: Máximo de páginas.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Objective`) em vez de dicionários.
             
         Returns:
-            Lista de objetivos ou DataFrame.
+            Lista de objetivos, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> for obj in client.objectives.list_all_by_project(123):
             ...     print(obj['attributes']['title'])
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        if self._hierarchy is not None and not (include or filters or max_pages):
+            objetivos = iter(self._hierarchy.objectives(project_id))
+            return self._shape_result(
+                objetivos, return_pandas, stream, chunk_size, Objective if as_models else None
+            )
+        
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -76,20 +156,26 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        objetivos = list(self._paginate(
-            self._base_endpoint(project_id), pagination, params
-        ))
-        
-        if return_pandas:
-            return to_dataframe(objetivos)
-        return objetivos
+        objetivos = self._paginate(
+            self._base_endpoint(project_id), pagination, params,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            objetivos, return_pandas, stream, chunk_size, Objective if as_models else None
+        )
+    
+    def _invalidate_hierarchy(self, project_id: int):
+        """Descarta os objetivos do projeto no índice de hierarquia, se houver."""
+        if self._hierarchy is not None:
+            self._hierarchy.invalidate(project_id)
     
     def get(
         self,
         project_id: int,
         objective_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém um objetivo específico.
         
@@ -98,6 +184,8 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
             objective_id: ID do objetivo.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna um dict.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Objective`) do registro.
             
         Returns:
             Dados do objetivo ou DataFrame.
@@ -114,9 +202,14 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
         
         response = self._http_client.get(endpoint, params if params else None)
         
+        if as_models:
+            return Objective.from_response(response, include)
         if return_pandas:
             data = response.get('data', {})
-            return to_dataframe([data] if isinstance(data, dict) else data)
+            return to_dataframe(
+                [data] if isinstance(data, dict) else data,
+                jsonapi=return_pandas == "jsonapi"
+            )
         return response
     
     def create(
@@ -198,7 +291,9 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
                 }
             }
         
-        return self._http_client.post(self._base_endpoint(project_id), payload)
+        response = self._http_client.post(self._base_endpoint(project_id), payload)
+        self._invalidate_hierarchy(project_id)
+        return response
     
     def update(
         self,
@@ -284,7 +379,9 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
             }
         
         endpoint = f"{self._base_endpoint(project_id)}/{objective_id}"
-        return self._http_client.patch(endpoint, payload)
+        response = self._http_client.patch(endpoint, payload)
+        self._invalidate_hierarchy(project_id)
+        return response
     
     def delete(self, project_id: int, objective_id: int) -> Dict[str, Any]:
         """Exclui um objetivo.
@@ -300,4 +397,6 @@ class ObjectivesModule(PaginationMixin, ThreadingMixin):
             Esta ação é irreversível.
         """
         endpoint = f"{self._base_endpoint(project_id)}/{objective_id}"
-        return self._http_client.delete(endpoint)
+        response = self._http_client.delete(endpoint)
+        self._invalidate_hierarchy(project_id)
+        return response
@@ -1,7 +1,7 @@
 """
 Módulo de Tipos de Projeto para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig, APIConfig
@@ -42,7 +42,9 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         self,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Lista todos os tipos de projeto com paginação automática.
         
@@ -50,36 +52,36 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar (None = todas).
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
             
         Returns:
-            Lista de tipos de projeto ou DataFrame.
+            Lista de tipos de projeto, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> for pt in client.project_types.list_all():
             ...     print(pt['attributes']['name'])
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if filters:
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        project_types = list(self._paginate(self._base_endpoint, pagination, params))
-        
-        if return_pandas:
-            return to_dataframe(project_types)
-        return project_types
+        project_types = self._paginate(self._base_endpoint, pagination, params)
+        return self._shape_result(project_types, return_pandas, stream, chunk_size)
     
-    def get(self, project_type_id: int, return_pandas: bool = False) -> Dict[str, Any]:
+    def get(self, project_type_id: int, return_pandas: Union[bool, str] = False) -> Dict[str, Any]:
         """Obtém um tipo de projeto específico por ID.
         
         Args:
             project_type_id: ID do tipo de projeto.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Dados do tipo de projeto ou DataFrame.
@@ -92,7 +94,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         response = self._http_client.get(endpoint, None)
         
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     def get_custom_attributes(
@@ -101,7 +103,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         fields: Optional[List[str]] = None,
         page_size: Optional[int] = None,
         page_number: Optional[str] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Obtém os atributos customizados de um tipo de projeto.
         
@@ -116,6 +118,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             page_size: Número de itens retornados por página (padrão: 50, máximo: 100).
             page_number: Número da página em formato Base64-encoded (para paginação).
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Resposta da API com os custom_attributes ou DataFrame.
@@ -158,19 +161,51 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         response = self._http_client.get(endpoint, params if params else None)
         
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
+    def list_all_custom_attributes(
+        self,
+        project_type_id: int,
+        customizable_types: Optional[List[str]] = None,
+        return_pandas: Union[bool, str] = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os atributos customizados de um tipo de projeto com paginação automática.
+        
+        Args:
+            project_type_id: ID do tipo de projeto.
+            customizable_types: Se informado, retorna apenas os atributos desses
+                tipos (ex.: ``["CustomFindingAttribute"]``).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            
+        Returns:
+            Lista de atributos customizados ou DataFrame.
+            
+        Example:
+            >>> for attr in client.project_types.list_all_custom_attributes(123):
+            ...     print(attr['attributes']['term'], attr['attributes']['field_type'])
+        """
+        endpoint = f"{self._base_endpoint}/{project_type_id}/custom_attributes"
+        attributes = self._paginate(endpoint, self._pagination_config, {})
+        if customizable_types:
+            attributes = (
+                attr for attr in attributes
+                if (attr.get("attributes") or {}).get("customizable_type") in customizable_types
+            )
+        return self._shape_result(attributes, return_pandas)
+    
     def get_many(
         self,
         project_type_ids: List[int],
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplos tipos de projeto em paralelo.
         
         Args:
             project_type_ids: Lista de IDs de tipos de projeto.
             return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de dados de tipos de projeto ou DataFrame.
@@ -190,7 +225,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(project_types)
+            return to_dataframe(project_types, jsonapi=return_pandas == "jsonapi")
         return project_types
     
     def create_custom_attribute(
@@ -203,7 +238,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         weight: Optional[int] = None,
         required: bool = False,
         default_values: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Cria um novo atributo customizado em um tipo de projeto.
         
@@ -238,6 +273,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             required: Se o atributo é obrigatório (padrão: False).
             default_values: Valores padrão para o atributo.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Dados do atributo customizado criado ou DataFrame.
@@ -324,7 +360,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         response = self._http_client.post(endpoint, payload)
         
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     def copy_project_type(
@@ -333,7 +369,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         name: str,
         description: Optional[str] = None,
         enable_creating_projects: bool = True,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Copia um tipo de projeto para a mesma organização.
         
@@ -347,6 +383,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             enable_creating_projects: Se True, permite criar projetos com este tipo;
                                      se False, mantém em modo rascunho (padrão: True).
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Dados do novo tipo de projeto criado ou DataFrame.
@@ -381,7 +418,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         response = self._http_client.post(self._base_endpoint, payload)
         
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     def copy_to_organization(
@@ -392,7 +429,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         description: Optional[str] = None,
         enable_creating_projects: bool = True,
         target_region: Optional[str] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Copia um tipo de projeto para outra organização com sincronização completa.
         
@@ -414,6 +451,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             target_region: Região da organização destino ("us", "eu", "au", "ca" ou "sa"). 
                           Se não fornecido, usa a região atual do cliente (opcional).
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Dados do novo tipo de projeto criado na org destino ou DataFrame.
@@ -618,7 +656,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
             print(f"⚠ Erro ao copiar custom_attributes: {str(e)}")
         
         if return_pandas:
-            return to_dataframe(new_type)
+            return to_dataframe(new_type, jsonapi=return_pandas == "jsonapi")
         return new_type
     
     def update(
@@ -629,7 +667,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         enable_creating_projects: Optional[bool] = None,
         attributes: Optional[Dict[str, Any]] = None,
         project_type_data: Optional[Dict[str, Any]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Atualiza um tipo de projeto existente.
         
@@ -651,6 +689,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
                               específicos (name, description, etc) sobrescrevem os valores
                               deste dicionário (opcional).
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Dados do tipo de projeto atualizado ou DataFrame.
@@ -738,7 +777,7 @@ class ProjectTypesModule(PaginationMixin, ThreadingMixin):
         response = self._http_client.patch(endpoint, payload)
         
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     
@@ -1,12 +1,15 @@
 """
 Módulo de Projetos para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..checkpoint import Checkpoint
+from ..hierarchy import HierarchyIndex
 from ..enums import ProjectState, ProjectStatus
 
+from ..models import Project
 from ..utils import to_dataframe
 
 class ProjectsModule(PaginationMixin, ThreadingMixin):
@@ -21,7 +24,8 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         http_client: HighBondHTTPClient,
         org_id: int,
         pagination_config: PaginationConfig,
-        threading_config: ThreadingConfig
+        threading_config: ThreadingConfig,
+        hierarchy: Optional[HierarchyIndex] = None
     ):
         """
         Args:
@@ -29,24 +33,33 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             org_id: ID da organização.
             pagination_config: Configuração de paginação.
             threading_config: Configuração de threading.
+            hierarchy: Índice projeto → objetivo compartilhado pelo cliente (opcional).
         """
         self._http_client = http_client
         self._org_id = org_id
         self._pagination_config = pagination_config
         self._threading_config = threading_config
+        self._hierarchy = hierarchy
     
     @property
     def _base_endpoint(self) -> str:
         """Endpoint base para projetos."""
         return f"/orgs/{self._org_id}/projects"
     
+    def _invalidate_hierarchy(self, project_id: Optional[int] = None):
+        """Descarta a lista de projetos (e os objetivos de ``project_id``) no índice de hierarquia, se houver."""
+        if self._hierarchy is not None:
+            self._hierarchy.invalidate()
+            if project_id is not None:
+                self._hierarchy.invalidate(project_id)
+    
     def list(
         self,
         page: int = 1,
         page_size: int = 50,
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
         """Lista projetos com paginação manual.
         
@@ -56,6 +69,7 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             include: Relacionamentos para incluir (ex: ['objectives', 'owner']).
             filters: Filtros adicionais.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Resposta completa da API com data, meta e links, ou DataFrame.
@@ -81,7 +95,7 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         
         if return_pandas:
             data = response["data"] if "data" in response else response
-            return to_dataframe(data)
+            return to_dataframe(data, jsonapi=return_pandas == "jsonapi")
         return response
     
     def list_all(
@@ -89,7 +103,12 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
         max_pages: Optional[int] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        checkpoint: Union[str, Checkpoint, None] = None,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """Lista todos os projetos com paginação automática.
         
@@ -98,18 +117,26 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             filters: Filtros adicionais.
             max_pages: Máximo de páginas a buscar (None = todas).
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            checkpoint: Caminho ou `Checkpoint` para retomar uma listagem
+                interrompida de onde parou (None = desligado).
+                Exige ``stream=True`` ou ``chunk_size``.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Project`) em vez de dicionários.
             
         Returns:
-            Lista de projetos ou DataFrame.
+            Lista de projetos, DataFrame ou gerador (``stream=True``).
             
         Example:
             >>> for project in client.projects.list_all():
             ...     print(project['attributes']['title'])
         """
-        pagination = PaginationConfig(
-            page_size=self._pagination_config.page_size,
-            max_pages=max_pages or self._pagination_config.max_pages
-        )
+        pagination = self._pagination_with(max_pages)
         
         params = {}
         if include:
@@ -118,11 +145,15 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             for key, value in filters.items():
                 params[f"filter[{key}]"] = value
         
-        projetos = list(self._paginate(self._base_endpoint, pagination, params))
-        
-        if return_pandas:
-            return to_dataframe(projetos)
-        return projetos
+        checkpoint = Checkpoint.resolve(checkpoint)
+        projetos = self._paginate(
+            self._base_endpoint, pagination, params, checkpoint,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            projetos, return_pandas, stream, chunk_size, Project if as_models else None,
+            checkpoint
+        )
 
     def list_project_types(self) -> List[Dict[str, Any]]:
         """Lista os tipos de projeto disponíveis na organização.
@@ -155,7 +186,8 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         self,
         project_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém um projeto específico por ID.
         
@@ -163,6 +195,8 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             project_id: ID do projeto.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Project`) do registro.
             
         Returns:
             Dados do projeto ou DataFrame.
@@ -179,15 +213,17 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         
         response = self._http_client.get(endpoint, params if params else None)
         
+        if as_models:
+            return Project.from_response(response, include)
         if return_pandas:
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return response
     
     def get_many(
         self,
         project_ids: List[int],
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplos projetos em paralelo.
         
@@ -195,6 +231,7 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             project_ids: Lista de IDs de projetos.
             include: Relacionamentos para incluir.
             return_pandas: Se True, retorna um DataFrame; se False, retorna lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
             
         Returns:
             Lista de dados de projetos ou DataFrame.
@@ -214,7 +251,7 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         )
         
         if return_pandas:
-            return to_dataframe(projetos)
+            return to_dataframe(projetos, jsonapi=return_pandas == "jsonapi")
         return projetos
     
     def create(
@@ -326,7 +363,9 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         }
         
         try:
-            return self._http_client.post(self._base_endpoint, payload)
+            response = self._http_client.post(self._base_endpoint, payload)
+            self._invalidate_hierarchy()
+            return response
         except Exception as exc:
             from ..exceptions import HighBondValidationError
 
@@ -516,7 +555,9 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
         }
         
         endpoint = f"{self._base_endpoint}/{project_id}"
-        return self._http_client.patch(endpoint, payload)
+        response = self._http_client.patch(endpoint, payload)
+        self._invalidate_hierarchy()
+        return response
     
     def delete(self, project_id: int) -> Dict[str, Any]:
         """Exclui um projeto.
@@ -534,7 +575,9 @@ class ProjectsModule(PaginationMixin, ThreadingMixin):
             >>> client.projects.delete(123)
         """
         endpoint = f"{self._base_endpoint}/{project_id}"
-        return self._http_client.delete(endpoint)
+        response = self._http_client.delete(endpoint)
+        self._invalidate_hierarchy(project_id)
+        return response
     
     def delete_many(self, project_ids: List[int]) -> List[Dict[str, Any]]:
         """Exclui múltiplos projetos em paralelo.
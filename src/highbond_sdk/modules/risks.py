@@ -1,11 +1,23 @@
 """
 Módulo de Riscos para o HighBond SDK.
 """
-from typing import Optional, Dict, Any, List, Generator
+import itertools
+from typing import Optional, Dict, Any, List, Generator, Union
 
 from ..http_client import HighBondHTTPClient, PaginationMixin, ThreadingMixin
 from ..config import PaginationConfig, ThreadingConfig
+from ..cache import cache_key
+from ..checkpoint import Checkpoint
+from ..hierarchy import HierarchyIndex
+from ..included import IncludedIndex
+from ..exceptions import (
+    HighBondAPIError,
+    HighBondNotFoundError,
+    HighBondForbiddenError,
+    HighBondValidationError
+)
 
+from ..models import Risk
 from ..utils import to_dataframe
 
 class RisksModule(PaginationMixin, ThreadingMixin):
@@ -20,7 +32,8 @@ class RisksModule(PaginationMixin, ThreadingMixin):
         http_client: HighBondHTTPClient,
         org_id: int,
         pagination_config: PaginationConfig,
-        threading_config: ThreadingConfig
+        threading_config: ThreadingConfig,
+        hierarchy: Optional[HierarchyIndex] = None
     ):
         """
         Args:
@@ -28,11 +41,13 @@ class RisksModule(PaginationMixin, ThreadingMixin):
             org_id: ID da organização.
             pagination_config: Configuração de paginação.
             threading_config: Configuração de threading.
+            hierarchy: Índice projeto → objetivo compartilhado pelo cliente (opcional).
         """
         self._http_client = http_client
         self._org_id = org_id
         self._pagination_config = pagination_config
         self._threading_config = threading_config
+        self._hierarchy = hierarchy
     
     @property
     def _org_endpoint(self) -> str:
@@ -51,131 +66,261 @@ class RisksModule(PaginationMixin, ThreadingMixin):
     def list_all(
         self,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        use_org_endpoint: bool = True,
+        filters: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
+        checkpoint: Union[str, Checkpoint, None] = None,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Lista todos os riscos da organização: busca todos os projetos, depois todos os objetivos de cada projeto (em paralelo), e então todos os riscos de cada objetivo (em paralelo).
-
+        Lista todos os riscos da organização.
+        
+        Por padrão pagina o endpoint de riscos da organização (``/orgs/{org_id}/risks``)
+        pedindo ao servidor o objetivo e o projeto de cada risco (``include=objective,objective.project``),
+        o que custa uma requisição por página em vez de uma por projeto e por objetivo.
+        Se o servidor rejeitar esse ``include`` (400/422), pagina o mesmo endpoint sem ele e resolve objetivo e projeto pelo índice de hierarquia.
+        Se o endpoint não estiver disponível (404/403), ou com ``use_org_endpoint=False``, busca todos os projetos,
+        depois todos os objetivos de cada projeto (em paralelo), e então todos os riscos de cada objetivo (em paralelo).
+        Projetos e objetivos vêm do índice de hierarquia do cliente (`client.hierarchy`), buscado apenas na primeira travessia.
+        
         Args:
             include: Lista de relacionamentos para incluir nos resultados. 
                 - Se incluir 'objectives', cada risco retornado terá um campo 'objective' com os dados completos do objetivo relacionado.
                 - Se incluir 'projects', cada risco retornado terá um campo 'project' com os dados completos do projeto relacionado.
                 - Exemplo: include=['objectives', 'projects'] retorna riscos já enriquecidos com os dados de objetivo e projeto.
             return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista de dicionários.
-
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            use_org_endpoint: Se True (padrão), usa o endpoint de riscos da organização,
+                recorrendo à travessia projeto → objetivo → risco apenas se ele falhar.
+            filters: Filtros adicionais (ex.: ``{"updated_at": ...}``).
+            stream: Se True, retorna um gerador que entrega os riscos conforme as páginas
+                (ou objetivos) são concluídas.
+            checkpoint: Caminho ou `Checkpoint` para retomar uma listagem interrompida a
+                partir da última página (ou do último objetivo) entregue (None = desligado).
+                Exige ``stream=True`` ou ``chunk_size``.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Risk`) em vez de dicionários.
+        
         Returns:
-            Lista de riscos, cada um podendo conter os dados de objetivo e projeto conforme o parâmetro include.
-
+            Lista de riscos, cada um com o campo 'project_id' e, conforme o parâmetro include,
+            os dados de objetivo e projeto.
+        
         Example:
             >>> risks = client.risks.list_all(include=['objectives', 'projects'])
             >>> for risk in risks:
-            ...     print(risk['attributes']['title'], risk['objective']['attributes']['name'], risk['project']['attributes']['name'])
+            ...     print(risk['attributes']['title'], risk['objective']['attributes']['title'], risk['project']['attributes']['name'])
         """
-        from .projects import ProjectsModule
-        from .objectives import ObjectivesModule
-        # 1. Buscar todos os projetos
-        projects_module = ProjectsModule(
-            self._http_client,
-            self._org_id,
-            self._pagination_config,
-            self._threading_config
-        )
-        all_projects = list(projects_module.list_all())
-
-        # Criar um mapa de objetivo_id para project_id
-        objective_to_project = {}
-
-        # 2. Buscar todos os objetivos de todos os projetos em paralelo
-        objectives_module = ObjectivesModule(
-            self._http_client,
-            self._org_id,
-            self._pagination_config,
-            self._threading_config
+        include = include or []
+        checkpoint = Checkpoint.resolve(checkpoint)
+        
+        def iter_risks():
+            if use_org_endpoint:
+                for include_parents in (True, False):
+                    pages = self._iter_org_pages(include, filters, checkpoint, include_parents)
+                    try:
+                        first = next(pages, None)
+                    except (HighBondNotFoundError, HighBondForbiddenError):
+                        break
+                    except HighBondAPIError as e:
+                        rejected = isinstance(e, HighBondValidationError) or e.status_code == 400
+                        if include_parents and rejected:
+                            # Include rejeitado (400/422): tenta de novo sem ele; objetivo e
+                            # projeto vêm do índice de hierarquia
+                            continue
+                        raise
+                    if first is not None:
+                        yield from self._risks_from_org_pages(
+                            itertools.chain([first], pages), include, embed_included
+                        )
+                    return
+            yield from self._iter_tree_risks(include, filters, checkpoint, embed_included)
+        
+        return self._shape_result(
+            iter_risks(), return_pandas, stream, chunk_size, Risk if as_models else None,
+            checkpoint
         )
+    
+    def _iter_org_pages(
+        self,
+        include: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        include_parents: bool = True
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Itera sobre as páginas do endpoint de riscos da organização.
+        
+        Com ``include_parents``, pede também o objetivo e o projeto de cada
+        risco (``include=objective,objective.project``).
+        """
+        server_include = ["objective", "objective.project"] if include_parents else []
+        server_include += [rel for rel in include if rel not in ("objectives", "projects")]
+        params = {"include": ",".join(server_include)} if server_include else {}
+        for key, value in (filters or {}).items():
+            params[f"filter[{key}]"] = value
+        return self._iter_pages(self._org_endpoint, self._pagination_with(), params, checkpoint)
+    
+    def _risks_from_org_pages(
+        self,
+        pages,
+        include: List[str],
+        embed_included: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Preenche 'project_id', 'objective' e 'project' a partir dos recursos incluídos em cada página.
+        
+        Riscos cujo objetivo (ou projeto) não veio em ``included`` são resolvidos pelo índice de hierarquia.
+        Com ``embed_included``, os demais relacionamentos pedidos em ``include`` são embutidos.
+        """
+        hierarchy = HierarchyIndex.of(self)
+        hierarchy_loaded = False
+        extra_paths = [rel for rel in include if rel not in ("objectives", "projects")]
+        
+        for response in pages:
+            included = IncludedIndex(response)
+            for risk in response.get("data", []):
+                obj_ref = (risk.get("relationships", {}).get("objective") or {}).get("data") or {}
+                obj_id = obj_ref.get("id")
+                objective = included.related(risk, "objective")
+                
+                if objective is not None:
+                    proj_ref = (objective.get("relationships", {}).get("project") or {}).get("data") or {}
+                    proj_id = proj_ref.get("id")
+                else:
+                    # Objetivo ausente em included: recorre ao índice (montado uma única vez)
+                    if obj_id is not None and not hierarchy_loaded and hierarchy.project_of(obj_id) is None:
+                        hierarchy.all_objectives()
+                        hierarchy_loaded = True
+                    objective = hierarchy.objective(obj_id)
+                    proj_id = hierarchy.project_of(obj_id)
+                
+                risk["project_id"] = proj_id
+                if "objectives" in include and objective is not None:
+                    risk["objective"] = objective
+                if "projects" in include:
+                    project = included.get("projects", proj_id)
+                    if project is None and proj_id is not None:
+                        # Objetivo resolvido pelo índice: o projeto também vem dele
+                        project = hierarchy.project(proj_id)
+                    if project is not None:
+                        risk["project"] = project
+                if embed_included and extra_paths:
+                    included.embed(risk, extra_paths)
+                yield risk
+    
+    def _iter_tree_risks(
+        self,
+        include: List[str],
+        filters: Optional[Dict[str, Any]] = None,
+        checkpoint: Optional[Checkpoint] = None,
+        embed_included: bool = False
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Travessia projeto → objetivo → risco usada quando o endpoint da organização não está disponível.
+        
+        Executada em pipeline: os objetivos de um projeto são buscados assim
+        que sua página de projetos chega, e os riscos de um objetivo assim que
+        ele chega, em vez de esperar cada nível inteiro.
+        """
+        hierarchy = HierarchyIndex.of(self)
+        
         def fetch_objectives(proj):
-            objetivos = list(objectives_module.list_by_project(proj["id"]))
-            for obj in objetivos:
-                objective_to_project[obj["id"]] = proj["id"]
-            return objetivos
-        all_objectives_nested = self._execute_parallel(
-            fetch_objectives,
-            all_projects,
-            self._threading_config
-        )
-        all_objectives = [obj for sublist in all_objectives_nested for obj in sublist]
-
-        # 3. Buscar todos os riscos de todos os objetivos em paralelo
-        def fetch_risks(obj):
-            riscos_obj = self.list_by_objective(
+            return [(proj, obj) for obj in hierarchy.objectives(proj["id"])]
+        
+        def fetch_risks(pair):
+            proj, obj = pair
+            riscos = self.list_all_by_objective(
                 objective_id=obj["id"],
-                include=include
+                include=include or None,
+                filters=filters,
+                embed_included=embed_included
             )
-            if isinstance(riscos_obj, dict) and "data" in riscos_obj:
-                for risco in riscos_obj["data"]:
-                    risco["project_id"] = objective_to_project.get(obj["id"])
-                return riscos_obj["data"]
-            return []
-        all_risks_nested = self._execute_parallel(
-            fetch_risks,
-            all_objectives,
-            self._threading_config
-        )
-        all_risks = [r for sublist in all_risks_nested for r in sublist]
-
-        # Criar dicionários para lookup rápido
-        objectives_dict = {obj["id"]: obj for obj in all_objectives}
-        projects_dict = {proj["id"]: proj for proj in all_projects}
-        
-        # Merge dos dados conforme include
-        for risk in all_risks:
-            if include:
+            for risco in riscos:
+                risco["project_id"] = proj["id"]
                 if "objectives" in include:
-                    obj_id = risk.get("objective_id") or risk.get("objective", {}).get("id")
-                    if obj_id and obj_id in objectives_dict:
-                        risk["objective"] = objectives_dict[obj_id]
+                    risco["objective"] = obj
                 if "projects" in include:
-                    proj_id = risk.get("project_id")
-                    if proj_id and proj_id in projects_dict:
-                        risk["project"] = projects_dict[proj_id]
-
-        if return_pandas:
-            return to_dataframe(all_risks)
-        return all_risks
-
+                    risco["project"] = proj
+            return riscos
+        
+        # No checkpoint, cada objetivo é registrado depois que seus riscos são entregues
+        params = {"include": ",".join(include)}
+        for key, value in (filters or {}).items():
+            params[f"filter[{key}]"] = value
+        return self._iter_pipeline(
+            hierarchy.iter_projects(),
+            [fetch_objectives, fetch_risks],
+            self._threading_config,
+            checkpoint=checkpoint,
+            checkpoint_key=cache_key(f"{self._org_endpoint}#objectives", params),
+            item_id=lambda pair: pair[1]["id"]
+        )
     
     def list_by_project(
         self,
         project_id: int,
         include: Optional[List[str]] = None,
         filters: Optional[Dict[str, Any]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        with_parent_ids: bool = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
     ) -> List[Dict[str, Any]]:
         """
-        Lista todos os riscos de um projeto (buscando todos os objetivos e seus riscos).
-
+        Lista todos os riscos de um projeto: busca os objetivos do projeto e então os riscos de cada objetivo (em paralelo).
+        A falha de um objetivo é propagada e cancela as buscas que ainda não começaram.
+        
         Args:
             project_id: ID do projeto.
             include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            with_parent_ids: Se True, adiciona 'objective_id' e 'project_id' em cada risco
+                (IDs JSON:API, como strings).
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Risk`) em vez de dicionários.
+        
+        Returns:
+            Lista de riscos do projeto, DataFrame ou gerador (``stream=True``).
+        
+        Example:
+            >>> risks = client.risks.list_by_project(123, with_parent_ids=True)
+            >>> risks[0]['objective_id'], risks[0]['project_id']
         """
-        from .objectives import ObjectivesModule
-        objectives_module = ObjectivesModule(
-            self._http_client,
-            self._org_id,
-            self._pagination_config,
-            self._threading_config
-        )
-        objetivos = list(objectives_module.list_by_project(project_id))
-        riscos = []
-        for obj in objetivos:
-            riscos_obj = self.list_by_objective(
+        def fetch_risks(obj):
+            riscos = self.list_all_by_objective(
                 objective_id=obj["id"],
-                include=include
+                include=include,
+                filters=filters,
+                embed_included=embed_included
             )
-            if isinstance(riscos_obj, dict) and "data" in riscos_obj:
-                riscos.extend(riscos_obj["data"])
-        if return_pandas:
-            return to_dataframe(riscos)
-        return riscos
+            if with_parent_ids:
+                for risco in riscos:
+                    risco["objective_id"] = obj["id"]
+                    risco["project_id"] = str(project_id)
+            return riscos
+        
+        # Como no laço sequencial original, a falha de um objetivo interrompe a listagem
+        riscos = self._iter_pipeline(
+            HierarchyIndex.of(self).objectives(project_id),
+            [fetch_risks],
+            self._threading_config,
+            fail_fast=True
+        )
+        return self._shape_result(
+            riscos, return_pandas, stream, chunk_size, Risk if as_models else None
+        )
     
     # ==================== LISTAGEM POR OBJETIVO ====================
     
@@ -185,16 +330,18 @@ class RisksModule(PaginationMixin, ThreadingMixin):
         page: int = 1,
         page_size: int = 50,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> Dict[str, Any]:
-        """Lista riscos de um objetivo específico.
+        """Lista uma página de riscos de um objetivo específico.
+        
+        Para percorrer todas as páginas, use `list_all_by_objective`.
         
         Args:
             objective_id: ID do objetivo.
             page: Número da página.
             page_size: Itens por página.
             include: Relacionamentos para incluir.
-            
+        
         Returns:
             Resposta completa da API.
         """
@@ -209,26 +356,88 @@ class RisksModule(PaginationMixin, ThreadingMixin):
         endpoint = self._objective_endpoint(objective_id)
         if return_pandas:
             response = self._http_client.get(endpoint, params)
-            return to_dataframe(response)
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
         return self._http_client.get(endpoint, params)
     
+    def list_all_by_objective(
+        self,
+        objective_id: int,
+        include: Optional[List[str]] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        parallel: Optional[bool] = None,
+        return_pandas: Union[bool, str] = False,
+        stream: bool = False,
+        chunk_size: Optional[int] = None,
+        embed_included: bool = False,
+        as_models: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Lista todos os riscos de um objetivo com paginação automática.
+        
+        Ao contrário de `list_by_objective`, que retorna uma única página,
+        percorre todas as páginas do objetivo.
+        
+        Args:
+            objective_id: ID do objetivo.
+            include: Relacionamentos para incluir.
+            filters: Filtros adicionais.
+            max_pages: Máximo de páginas a buscar (None = todas).
+            parallel: Se True/False, força ou desativa a busca das páginas em
+                paralelo (None = usa `PaginationConfig.parallel`).
+            return_pandas: Se True, retorna um DataFrame; se False, retorna uma lista.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            stream: Se True, retorna um gerador que entrega cada registro
+                conforme as páginas chegam, sem manter o resultado em memória.
+            chunk_size: Se informado, retorna um gerador de DataFrames com até
+                ``chunk_size`` registros cada, normalizados um bloco por vez.
+            embed_included: Se True, os recursos de ``included`` de cada página são
+                embutidos nos registros (ex.: ``registro["owner"]``), sem requisições extras.
+            as_models: Se True, retorna modelos compactos (`Risk`) em vez de dicionários.
+        
+        Returns:
+            Lista de riscos, DataFrame ou gerador (``stream=True``).
+        
+        Example:
+            >>> riscos = client.risks.list_all_by_objective(objective_id=789)
+        """
+        pagination = self._pagination_with(max_pages, parallel=parallel)
+        
+        params = {}
+        if include:
+            params["include"] = ",".join(include)
+        if filters:
+            for key, value in filters.items():
+                params[f"filter[{key}]"] = value
+        
+        riscos = self._paginate(
+            self._objective_endpoint(objective_id), pagination, params,
+            embed_included=embed_included
+        )
+        return self._shape_result(
+            riscos, return_pandas, stream, chunk_size, Risk if as_models else None
+        )
+    
     # ==================== OBTENÇÃO ====================
     
     def get(
         self,
         risk_id: int,
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False,
+        as_models: bool = False
     ) -> Dict[str, Any]:
         """Obtém um risco específico por ID.
         
         Args:
             risk_id: ID do risco.
             include: Relacionamentos para incluir.
-            
+            return_pandas: Se True, retorna um DataFrame; se False, retorna resposta da API.
+                ``"jsonapi"`` usa o esquema estável de `jsonapi_to_dataframe`.
+            as_models: Se True, retorna o modelo compacto (`Risk`) do registro.
+        
         Returns:
             Dados do risco.
-            
+        
         Example:
             >>> risk = client.risks.get(456)
             >>> print(risk['data']['attributes']['title'])
@@ -238,24 +447,27 @@ class RisksModule(PaginationMixin, ThreadingMixin):
         
         if include:
             params["include"] = ",".join(include)
-        if return_pandas:
-            response = self._http_client.get(endpoint, params)
-            return to_dataframe(response)
         
-        return self._http_client.get(endpoint, params if params else None)
+        response = self._http_client.get(endpoint, params if params else None)
+        
+        if as_models:
+            return Risk.from_response(response, include)
+        if return_pandas:
+            return to_dataframe(response, jsonapi=return_pandas == "jsonapi")
+        return response
     
     def get_many(
         self,
         risk_ids: List[int],
         include: Optional[List[str]] = None,
-        return_pandas: bool = False
+        return_pandas: Union[bool, str] = False
     ) -> List[Dict[str, Any]]:
         """Obtém múltiplos riscos em paralelo.
         
         Args:
             risk_ids: Lista de IDs de riscos.
             include: Relacionamentos para incluir.
-            
+        
         Returns:
             Lista de dados de riscos.
         """
@@ -268,7 +480,7 @@ class RisksModule(PaginationMixin, ThreadingMixin):
                 risk_ids,
                 self._threading_config
             )
-            return to_dataframe(risks)
+            return to_dataframe(risks, jsonapi=return_pandas == "jsonapi")
         
         return self._execute_parallel(
             fetch_risk,
@@ -313,10 +525,10 @@ class RisksModule(PaginationMixin, ThreadingMixin):
                 Formato: [{"id": "42", "term": "Fator", "value": ["valor"]}]
             owner_user_uid: UID do usuário responsável (sobrescreve owner, envia notificação).
             framework_origin_id: ID do risco equivalente em um framework associado.
-            
+        
         Returns:
             Dados do risco criado.
-            
+        
         Example:
             >>> risk = client.risks.create(
             ...     objective_id=456,
@@ -405,10 +617,10 @@ class RisksModule(PaginationMixin, ThreadingMixin):
             custom_attributes: Atributos customizados, formato [{ "term": "Fator", "value": ["valor"]}].
             custom_factors: Fatores de risco customizados, formato [{ "term": "Fator", "value": ["valor"]}].
             owner_user_uid: UID do usuário responsável (sobrescreve owner).
-            
+        
         Returns:
             Dados do risco atualizado.
-            
+        
         Example:
             >>> risk = client.risks.update(
             ...     risk_id=456,
@@ -463,13 +675,13 @@ class RisksModule(PaginationMixin, ThreadingMixin):
         
         Args:
             risk_id: ID do risco a excluir.
-            
+        
         Returns:
             Resposta da API.
-            
+        
         Warning:
             Esta ação é irreversível.
         """
         endpoint = f"{self._org_endpoint}/{risk_id}"
         return self._http_client.delete(endpoint)
-    
+
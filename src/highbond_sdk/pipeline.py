@@ -0,0 +1,211 @@
+"""
+Travessia em pipeline de hierarquias para o HighBond SDK.
+"""
+import heapq
+import itertools
+from concurrent.futures import Future, FIRST_COMPLETED, wait
+from typing import Any, Callable, Generator, Iterable, List, Optional, Sequence, Tuple
+
+from .concurrency import WorkerPool
+
+
+class TraversalPipeline:
+    """Percorre uma hierarquia de vários níveis em pipeline (produtor/consumidor).
+    
+    Cada nível é uma função que recebe um item e devolve os itens do nível
+    seguinte (ex.: projeto → objetivos, objetivo → riscos). Em vez de esperar
+    um nível inteiro terminar para começar o próximo, cada item é agendado no
+    `WorkerPool` assim que o item pai chega: as buscas de objetivos começam com
+    a primeira página de projetos e as de riscos com o primeiro objetivo.
+    
+    - Itens de níveis mais profundos têm prioridade, de modo que os primeiros
+      registros chegam cedo e a fila de trabalho não cresce sem limite.
+    - A fonte (ex.: páginas de projetos) só é lida enquanto a fila de itens
+      pendentes tiver menos de ``queue_size`` itens.
+    - No máximo ``limit()`` tarefas ficam em voo e nada novo é agendado
+      enquanto o chamador não consome o próximo registro.
+    
+    Falhas de um item são registradas em `errors` e o item é descartado sem
+    interromper os demais; `ThreadingMixin._iter_pipeline` relança a primeira
+    ao final. Com ``fail_fast``, a primeira falha é propagada imediatamente e
+    as tarefas que ainda não começaram são canceladas. Falhas da fonte são
+    sempre propagadas.
+    
+    Example:
+        >>> pipeline = TraversalPipeline(pool, limit=lambda: 8)
+        >>> riscos = pipeline.run(
+        ...     projetos,
+        ...     [lambda proj: objetivos_do_projeto(proj["id"]),
+        ...      lambda obj: riscos_do_objetivo(obj["id"])]
+        ... )
+        >>> for risco in riscos:
+        ...     print(risco["id"])
+    """
+    
+    def __init__(
+        self,
+        pool: Optional[WorkerPool],
+        limit: Optional[Callable[[], int]] = None,
+        queue_size: Optional[int] = None,
+        batch_size: int = 1,
+        fail_fast: bool = False
+    ):
+        """
+        Args:
+            pool: Pool onde as tarefas são executadas. None executa a travessia
+                sequencialmente (em profundidade) na thread atual.
+            limit: Função que retorna o número máximo de tarefas em voo
+                (padrão: ``pool.max_workers``). Consultada a cada agendamento,
+                permitindo limites adaptativos.
+            queue_size: Máximo de itens pendentes antes de ler mais da fonte
+                (padrão: 4 × o limite inicial, no mínimo ``batch_size``).
+            batch_size: Quantidade de itens lidos da fonte por tarefa.
+            fail_fast: Se True, propaga a primeira falha de um item em vez de
+                registrá-la em `errors`.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser pelo menos 1")
+        self.pool = pool
+        if limit is None:
+            max_workers = pool.max_workers if pool is not None else 1
+            limit = lambda: max_workers
+        self.limit = limit
+        self.queue_size = queue_size or max(4 * limit(), batch_size)
+        self.batch_size = batch_size
+        self.fail_fast = fail_fast
+        self.errors: List[Tuple[Any, Exception]] = []
+    
+    def run(
+        self,
+        source: Iterable[Any],
+        stages: Sequence[Callable[[Any], Iterable[Any]]]
+    ) -> Generator[Any, None, None]:
+        """Executa a travessia e entrega os registros do último nível conforme ficam prontos.
+        
+        Args:
+            source: Itens do primeiro nível (lista ou gerador, ex.: páginas de projetos).
+            stages: Funções de expansão de cada nível; a última devolve os registros.
+        
+        Yields:
+            Registros do último nível, na ordem de conclusão.
+        """
+        if not stages:
+            raise ValueError("stages deve ter pelo menos um nível")
+        if self.pool is None:
+            return self._run_sequential(source, stages)
+        return self._run_parallel(source, stages)
+    
+    def _run_sequential(self, source, stages) -> Generator[Any, None, None]:
+        """Travessia em profundidade na thread atual (threading desativado)."""
+        def descend(item, depth):
+            try:
+                children = list(stages[depth](item))
+            except Exception as e:
+                if self.fail_fast:
+                    raise
+                self.errors.append((item, e))
+                return
+            if depth == len(stages) - 1:
+                yield from children
+                return
+            for child in children:
+                yield from descend(child, depth + 1)
+        
+        for item in source:
+            yield from descend(item, 0)
+    
+    def _run_parallel(self, source, stages) -> Generator[Any, None, None]:
+        """Travessia em pipeline no `WorkerPool`."""
+        pool = self.pool
+        last = len(stages) - 1
+        source_iter = iter(source)
+        source_done = False
+        source_future = None
+        
+        sequence = itertools.count()
+        pending = []    # heap de (-profundidade, ordem, profundidade, item)
+        in_flight = {}  # future -> (profundidade, item); -1 = leitura da fonte
+        stealable = []
+        
+        def expand(task):
+            depth, item = task
+            if depth < 0:
+                return list(itertools.islice(source_iter, self.batch_size))
+            return list(stages[depth](item))
+        
+        def push(depth, items):
+            for item in items:
+                heapq.heappush(pending, (-depth, next(sequence), depth, item))
+        
+        try:
+            while True:
+                while pending and len(in_flight) < self.limit():
+                    _, _, depth, item = heapq.heappop(pending)
+                    future = pool.submit(expand, (depth, item))
+                    in_flight[future] = (depth, item)
+                    stealable.append(future)
+                
+                if (not source_done and source_future is None
+                        and len(pending) < self.queue_size):
+                    source_future = pool.submit(expand, (-1, None))
+                    in_flight[source_future] = (-1, None)
+                    stealable.append(source_future)
+                
+                if not in_flight:
+                    return
+                
+                done, _ = wait(
+                    in_flight,
+                    timeout=0 if pool.saturated else WorkerPool._POLL_INTERVAL,
+                    return_when=FIRST_COMPLETED
+                )
+                if not done:
+                    # Pool ocupado (ex.: a travessia roda dentro de um worker):
+                    # executa aqui uma tarefa que ainda não começou.
+                    stolen = self._steal(stealable)
+                    if stolen is not None:
+                        task = in_flight.pop(stolen)
+                        inline = WorkerPool._run_inline(expand, task)
+                        in_flight[inline] = task
+                        done = {inline}
+                    else:
+                        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                
+                for future in done:
+                    depth, item = in_flight.pop(future)
+                    
+                    if depth < 0:
+                        source_future = None
+                        batch = future.result()
+                        source_done = len(batch) < self.batch_size
+                        push(0, batch)
+                        continue
+                    
+                    try:
+                        children = future.result()
+                    except Exception as e:
+                        if self.fail_fast:
+                            raise
+                        self.errors.append((item, e))
+                        continue
+                    
+                    if depth == last:
+                        yield from children
+                    else:
+                        push(depth + 1, children)
+                
+                # Tarefas concluídas não podem mais ser roubadas
+                stealable[:] = [f for f in stealable if not f.done()]
+        finally:
+            # Iteração interrompida: descarta as tarefas que ainda não começaram
+            for future in in_flight:
+                future.cancel()
+    
+    @staticmethod
+    def _steal(stealable: List[Future]) -> Optional[Future]:
+        """Cancela e devolve a tarefa mais recente que ainda não começou, se houver."""
+        while stealable:
+            future = stealable.pop()
+            if future.cancel():
+                return future
+        return None
@@ -0,0 +1,403 @@
+"""
+Snapshot relacional local da organização (SQLite ou DuckDB) para o HighBond SDK.
+
+O backend DuckDB requer o pacote opcional ``duckdb``
+(``pip install highbond-sdk[duckdb]``).
+"""
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple
+
+try:
+    import duckdb
+except ImportError:  # pragma: no cover - dependência opcional
+    duckdb = None
+
+import pandas as pd
+
+from .models import Action, Control, Issue, Objective, Project, Risk
+
+
+# Tabela → (modelo, chaves estrangeiras coluna → tabela referenciada)
+TABLES: Dict[str, Tuple[type, Dict[str, str]]] = {
+    "projects": (Project, {}),
+    "objectives": (Objective, {"project_id": "projects"}),
+    "risks": (Risk, {"objective_id": "objectives", "project_id": "projects"}),
+    "controls": (Control, {"objective_id": "objectives", "project_id": "projects"}),
+    "issues": (Issue, {"project_id": "projects"}),
+    "actions": (Action, {"issue_id": "issues"}),
+}
+
+# Colunas booleanas; as demais são texto
+_BOOLEAN_COLUMNS = frozenset(("closed", "published"))
+
+
+@dataclass
+class SnapshotResult:
+    """Resultado de um snapshot.
+    
+    Attributes:
+        path: Caminho do banco gerado.
+        backend: ``"sqlite"`` ou ``"duckdb"``.
+        counts: Registros gravados por tabela.
+        duration: Duração em segundos.
+    """
+    
+    path: str
+    backend: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    duration: float = 0.0
+
+
+def _columns(table: str) -> List[str]:
+    """Colunas de uma tabela: id, IDs pai, campos do modelo e ``data`` (JSON completo)."""
+    model, _ = TABLES[table]
+    parents = [f"{name}_id" for name in model.RELATIONSHIPS] + list(model.PARENT_FIELDS)
+    return ["id"] + parents + list(model.FIELDS) + ["data"]
+
+
+def _value(column: str, value: Any) -> Any:
+    """Adapta um valor ao tipo da coluna (texto, ou booleano em ``_BOOLEAN_COLUMNS``)."""
+    if value is None or value.__class__ is str:
+        return value
+    if column in _BOOLEAN_COLUMNS:
+        return value if isinstance(value, bool) else None
+    if isinstance(value, (list, dict)):
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return str(value)
+
+
+def _related_id(record: Dict[str, Any], name: str) -> Optional[Any]:
+    """ID do relacionamento um-para-um ``name`` de um recurso JSON:API (None se ausente)."""
+    data = ((record.get("relationships") or {}).get(name) or {}).get("data")
+    return data.get("id") if isinstance(data, dict) else None
+
+
+def _row(model: type, record: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Converte um registro JSON:API na linha da tabela (ordem de `_columns`).
+    
+    Os IDs pai vêm dos relacionamentos do modelo ou das chaves anexadas pelo
+    SDK (``project_id`` em riscos e controles).
+    """
+    attributes = record.get("attributes") or {}
+    relationships = record.get("relationships") or {}
+    values = [_value("id", record.get("id"))]
+    for name in model.RELATIONSHIPS:
+        data = (relationships.get(name) or {}).get("data")
+        parent_id = data.get("id") if isinstance(data, dict) else record.get(f"{name}_id")
+        values.append(_value("id", parent_id))
+    for name in model.PARENT_FIELDS:
+        values.append(_value(name, record.get(name)))
+    for name in model.FIELDS:
+        values.append(_value(name, attributes.get(name)))
+    values.append(json.dumps(record, ensure_ascii=False, default=str))
+    return tuple(values)
+
+
+class _SQLiteWriter:
+    """Gravação em lote em SQLite (chaves estrangeiras declaradas, não verificadas)."""
+    
+    backend = "sqlite"
+    
+    def __init__(self, path: str):
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=OFF")
+        self._conn.execute("PRAGMA synchronous=OFF")
+    
+    def create_table(self, table: str, columns: List[str], foreign_keys: Dict[str, str]):
+        definitions = [
+            "id TEXT PRIMARY KEY" if column == "id"
+            else f"{column} {'BOOLEAN' if column in _BOOLEAN_COLUMNS else 'TEXT'}"
+            for column in columns
+        ]
+        definitions += [
+            f"FOREIGN KEY ({column}) REFERENCES {parent}(id)"
+            for column, parent in foreign_keys.items()
+        ]
+        self._conn.execute(f"CREATE TABLE {table} ({', '.join(definitions)})")
+    
+    def insert(self, table: str, columns: List[str], rows: List[Tuple[Any, ...]]):
+        placeholders = ", ".join("?" for _ in columns)
+        with self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) VALUES ({placeholders})",
+                rows
+            )
+    
+    def flush(self):
+        """Nada a fazer: cada lote já é gravado em `insert`."""
+    
+    def execute(self, sql: str):
+        self._conn.execute(sql)
+        self._conn.commit()
+    
+    def close(self):
+        self._conn.close()
+
+
+class _DuckDBWriter:
+    """Gravação em lote em DuckDB, inserindo os lotes a partir de um DataFrame.
+    
+    Cada ``INSERT`` tem custo fixo alto no DuckDB, então os lotes de cada
+    tabela são acumulados até ``FLUSH_ROWS`` linhas antes da inserção.
+    
+    As chaves estrangeiras não são declaradas: o DuckDB as verifica na
+    inserção e registros órfãos na API (ou filhos que chegam antes do pai
+    na travessia concorrente) interromperiam o snapshot.
+    """
+    
+    backend = "duckdb"
+    FLUSH_ROWS = 20000
+    
+    def __init__(self, path: str):
+        if duckdb is None:
+            raise ImportError(
+                "O snapshot em DuckDB requer o pacote 'duckdb'. "
+                "Instale com: pip install highbond-sdk[duckdb]"
+            )
+        self._conn = duckdb.connect(path)
+        self._pending: Dict[str, Tuple[List[str], Dict[Any, Tuple[Any, ...]]]] = {}
+    
+    def create_table(self, table: str, columns: List[str], foreign_keys: Dict[str, str]):
+        definitions = [
+            "id VARCHAR PRIMARY KEY" if column == "id"
+            else f"{column} {'BOOLEAN' if column in _BOOLEAN_COLUMNS else 'VARCHAR'}"
+            for column in columns
+        ]
+        self._conn.execute(f"CREATE TABLE {table} ({', '.join(definitions)})")
+    
+    def insert(self, table: str, columns: List[str], rows: List[Tuple[Any, ...]]):
+        _, pending = self._pending.setdefault(table, (columns, {}))
+        # Um registro por id (o último), como no INSERT OR REPLACE do SQLite
+        pending.update((row[0], row) for row in rows)
+        if len(pending) >= self.FLUSH_ROWS:
+            self._flush_table(table)
+    
+    def _flush_table(self, table: str):
+        columns, pending = self._pending.pop(table)
+        batch = pd.DataFrame.from_records(list(pending.values()), columns=columns)
+        self._conn.register("snapshot_batch", batch)
+        try:
+            self._conn.execute(
+                f"INSERT OR REPLACE INTO {table} ({', '.join(columns)}) "
+                f"SELECT {', '.join(columns)} FROM snapshot_batch"
+            )
+        finally:
+            self._conn.unregister("snapshot_batch")
+    
+    def flush(self):
+        """Grava os lotes acumulados de todas as tabelas."""
+        for table in list(self._pending):
+            self._flush_table(table)
+    
+    def execute(self, sql: str):
+        self._conn.execute(sql)
+    
+    def close(self):
+        self._conn.close()
+
+
+_WRITERS = {"sqlite": _SQLiteWriter, "duckdb": _DuckDBWriter}
+
+
+class SnapshotEngine:
+    """Grava um snapshot relacional da organização em um banco local.
+    
+    Projetos, objetivos, riscos, controles, issues e ações viram tabelas com
+    a chave ``id``, as colunas dos IDs pai (``project_id``, ``objective_id``,
+    ``issue_id``), os campos principais dos modelos (`Project`, `Risk`, ...)
+    e o registro JSON:API completo em ``data``. Índices nos IDs pai são
+    criados depois da carga.
+    
+    Os recursos são listados ao mesmo tempo, um produtor por recurso (as
+    travessias usam o pool de threads do cliente), e gravados em lotes de
+    ``batch_size`` registros por uma única conexão. O banco é montado em
+    ``<path>.tmp`` e só substitui ``path`` quando o snapshot termina.
+    
+    Example:
+        >>> result = client.snapshot("org.db")
+        >>> import sqlite3
+        >>> sqlite3.connect("org.db").execute(
+        ...     "SELECT p.name, COUNT(*) FROM issues i JOIN projects p ON p.id = i.project_id"
+        ...     " GROUP BY p.name"
+        ... ).fetchall()
+    """
+    
+    RESOURCES = tuple(TABLES)
+    
+    def __init__(self, client, batch_size: int = 1000, queue_size: int = 16):
+        """
+        Args:
+            client: `HighBondClient` usado nas requisições.
+            batch_size: Registros por inserção em lote.
+            queue_size: Lotes aguardando gravação antes de os produtores pausarem.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size deve ser pelo menos 1")
+        self.client = client
+        self.batch_size = batch_size
+        self.queue_size = queue_size
+    
+    def _records(self, resource: str) -> Iterable[Dict[str, Any]]:
+        """Lista os registros de um recurso em streaming."""
+        records = getattr(self.client, resource).list_all(stream=True)
+        if "project_id" in TABLES[resource][0].PARENT_FIELDS:
+            return self._with_project_ids(records)
+        return records
+    
+    def _with_project_ids(
+        self,
+        records: Iterable[Dict[str, Any]]
+    ) -> Generator[Dict[str, Any], None, None]:
+        """Preenche o ``project_id`` ausente pelo objetivo.
+        
+        A listagem de controles da organização não informa o projeto; ele vem
+        de um mapa objetivo → projeto montado uma única vez, na primeira
+        necessidade, a partir de `objectives.list_all` (só IDs ficam em
+        memória; o índice de hierarquia do cliente não é preenchido).
+        """
+        projects_of: Optional[Dict[str, Any]] = None
+        for record in records:
+            if record.get("project_id") is None:
+                objective_id = _related_id(record, "objective")
+                if objective_id is not None:
+                    if projects_of is None:
+                        projects_of = {
+                            str(obj["id"]): _related_id(obj, "project")
+                            for obj in self.client.objectives.list_all(stream=True)
+                        }
+                    record["project_id"] = projects_of.get(str(objective_id))
+            yield record
+    
+    def _produce(self, resource: str, batches: "queue.Queue", stop: threading.Event):
+        """Lista um recurso e enfileira seus registros em lotes."""
+        try:
+            batch = []
+            for record in self._records(resource):
+                if stop.is_set():
+                    return
+                batch.append(record)
+                if len(batch) >= self.batch_size:
+                    batches.put((resource, batch, None))
+                    batch = []
+            if batch:
+                batches.put((resource, batch, None))
+        except BaseException as exc:
+            batches.put((resource, None, exc))
+        finally:
+            batches.put((resource, None, None))
+    
+    def run(
+        self,
+        path: str,
+        backend: str = "sqlite",
+        resources: Optional[List[str]] = None
+    ) -> SnapshotResult:
+        """Grava o snapshot.
+        
+        Args:
+            path: Caminho do banco (substituído se já existir).
+            backend: ``"sqlite"`` ou ``"duckdb"``.
+            resources: Tabelas a preencher (padrão: todas). As demais são
+                criadas vazias, para que o esquema seja sempre o mesmo.
+        
+        Returns:
+            `SnapshotResult` com o número de registros por tabela.
+        
+        Raises:
+            ImportError: Se ``backend="duckdb"`` e o pacote ``duckdb`` não
+                estiver instalado.
+            ValueError: Se o backend ou algum recurso não for suportado.
+        """
+        if backend not in _WRITERS:
+            raise ValueError(f"Backend não suportado: {backend!r}. Use: {list(_WRITERS)}")
+        resources = list(resources or self.RESOURCES)
+        unknown = [name for name in resources if name not in TABLES]
+        if unknown:
+            raise ValueError(
+                f"Recursos não suportados: {unknown}. Use: {list(self.RESOURCES)}"
+            )
+        
+        started = time.time()
+        path = os.path.expanduser(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{path}.tmp"
+        # Um WAL deixado por uma execução interrompida seria aplicado ao novo banco
+        _remove(temp_path)
+        _remove(f"{temp_path}.wal")
+        
+        result = SnapshotResult(path, backend, {table: 0 for table in TABLES})
+        columns = {table: _columns(table) for table in TABLES}
+        writer = _WRITERS[backend](temp_path)
+        try:
+            for table, (_, foreign_keys) in TABLES.items():
+                writer.create_table(table, columns[table], foreign_keys)
+            
+            batches: "queue.Queue" = queue.Queue(maxsize=self.queue_size)
+            stop = threading.Event()
+            producers = [
+                threading.Thread(
+                    target=self._produce,
+                    args=(resource, batches, stop),
+                    name=f"highbond-snapshot-{resource}",
+                    daemon=True
+                )
+                for resource in resources
+            ]
+            for producer in producers:
+                producer.start()
+            
+            error = None
+            pending = len(producers)
+            while pending:
+                resource, batch, exc = batches.get()
+                if exc is not None:
+                    error = error or exc
+                    stop.set()
+                elif batch is None:
+                    pending -= 1
+                elif error is None:
+                    model = TABLES[resource][0]
+                    # Um registro por id no lote (INSERT OR REPLACE resolve entre lotes)
+                    rows = list({
+                        row[0]: row for row in (_row(model, record) for record in batch)
+                    }.values())
+                    writer.insert(resource, columns[resource], rows)
+                    result.counts[resource] += len(rows)
+            if error is not None:
+                raise error
+            writer.flush()
+            
+            for table, (model, _) in TABLES.items():
+                for column in columns[table][1:]:
+                    if not column.endswith("_id") or column in model.FIELDS:
+                        continue
+                    writer.execute(
+                        f"CREATE INDEX idx_{table}_{column} ON {table} ({column})"
+                    )
+        except BaseException:
+            writer.close()
+            _remove(temp_path)
+            _remove(f"{temp_path}.wal")
+            raise
+        
+        writer.close()
+        os.replace(temp_path, path)
+        result.duration = time.time() - started
+        return result
+    
+    def __repr__(self) -> str:
+        return f"SnapshotEngine(client={self.client!r}, batch_size={self.batch_size})"
+
+
+def _remove(path: str):
+    """Remove um arquivo, se existir."""
+    if os.path.exists(path):
+        os.remove(path)
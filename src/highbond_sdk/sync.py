@@ -0,0 +1,386 @@
+"""
+Sincronização incremental (delta sync) para o HighBond SDK.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from .exceptions import HighBondValidationError
+
+
+@dataclass
+class SyncState:
+    """Estado da sincronização de um recurso em uma organização.
+    
+    Attributes:
+        high_water: Maior ``updated_at`` já sincronizado (None = nunca sincronizado).
+        reconciled_at: Momento (epoch) da última reconciliação completa de IDs.
+        synced_at: Momento (epoch) da última sincronização.
+    """
+    
+    high_water: Optional[str] = None
+    reconciled_at: Optional[float] = None
+    synced_at: Optional[float] = None
+
+
+@dataclass
+class SyncResult:
+    """Resultado da sincronização de um recurso.
+    
+    Attributes:
+        resource: Nome do recurso (issues, actions, risks, ...).
+        mode: ``"full"`` (listagem completa com reconciliação de IDs) ou
+            ``"incremental"`` (apenas registros alterados).
+        fetched: Registros recebidos da API.
+        upserted: Registros novos ou alterados gravados no store.
+        deleted: Registros removidos do store por não existirem mais na API.
+        high_water: Novo ``updated_at`` máximo do recurso.
+        duration: Duração em segundos.
+    """
+    
+    resource: str
+    mode: str
+    fetched: int = 0
+    upserted: int = 0
+    deleted: int = 0
+    high_water: Optional[str] = None
+    duration: float = 0.0
+
+
+class SyncStore:
+    """Interface do armazenamento local usado pela sincronização incremental.
+    
+    Guarda os registros de cada recurso por organização e o estado
+    (`SyncState`) da última sincronização.
+    """
+    
+    def state(self, org_id: int, resource: str) -> SyncState:
+        """Retorna o estado salvo do recurso (vazio se nunca sincronizado)."""
+        raise NotImplementedError
+    
+    def save_state(self, org_id: int, resource: str, state: SyncState):
+        """Salva o estado do recurso."""
+        raise NotImplementedError
+    
+    def upsert(self, org_id: int, resource: str, records: Iterable[Dict[str, Any]]) -> int:
+        """Insere ou substitui registros pelo ``id``.
+        
+        Returns:
+            Número de registros gravados.
+        """
+        raise NotImplementedError
+    
+    def ids(self, org_id: int, resource: str) -> Set[str]:
+        """Retorna os IDs armazenados do recurso."""
+        raise NotImplementedError
+    
+    def delete(self, org_id: int, resource: str, ids: Iterable[str]) -> int:
+        """Remove registros pelo ID.
+        
+        Returns:
+            Número de registros removidos.
+        """
+        raise NotImplementedError
+    
+    def records(self, org_id: int, resource: str) -> Iterator[Dict[str, Any]]:
+        """Itera sobre os registros armazenados do recurso."""
+        raise NotImplementedError
+    
+    def close(self):
+        """Libera os recursos do store (nada a fazer por padrão)."""
+
+
+class SQLiteSyncStore(SyncStore):
+    """Store de sincronização em um arquivo SQLite local.
+    
+    Example:
+        >>> store = SQLiteSyncStore("~/highbond/sync.db")
+        >>> client.sync(["issues", "actions"], store=store)
+        >>> issues = list(store.records(client.config.api.org_id, "issues"))
+    """
+    
+    def __init__(self, path: str):
+        """
+        Args:
+            path: Caminho do arquivo SQLite (criado se não existir).
+        """
+        self.path = os.path.expanduser(path)
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS records ("
+                " org_id INTEGER NOT NULL,"
+                " resource TEXT NOT NULL,"
+                " id TEXT NOT NULL,"
+                " updated_at TEXT,"
+                " data TEXT NOT NULL,"
+                " PRIMARY KEY (org_id, resource, id))"
+            )
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS sync_state ("
+                " org_id INTEGER NOT NULL,"
+                " resource TEXT NOT NULL,"
+                " high_water TEXT,"
+                " reconciled_at REAL,"
+                " synced_at REAL,"
+                " PRIMARY KEY (org_id, resource))"
+            )
+    
+    def state(self, org_id: int, resource: str) -> SyncState:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT high_water, reconciled_at, synced_at FROM sync_state"
+                " WHERE org_id = ? AND resource = ?",
+                (org_id, resource)
+            ).fetchone()
+        return SyncState(*row) if row else SyncState()
+    
+    def save_state(self, org_id: int, resource: str, state: SyncState):
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state"
+                " (org_id, resource, high_water, reconciled_at, synced_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (org_id, resource, state.high_water, state.reconciled_at, state.synced_at)
+            )
+    
+    def upsert(self, org_id: int, resource: str, records: Iterable[Dict[str, Any]]) -> int:
+        rows = [
+            (
+                org_id,
+                resource,
+                str(record["id"]),
+                _updated_at(record),
+                json.dumps(record, ensure_ascii=False)
+            )
+            for record in records
+        ]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (org_id, resource, id, updated_at, data)"
+                " VALUES (?, ?, ?, ?, ?)",
+                rows
+            )
+        return len(rows)
+    
+    def ids(self, org_id: int, resource: str) -> Set[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id FROM records WHERE org_id = ? AND resource = ?",
+                (org_id, resource)
+            ).fetchall()
+        return {row[0] for row in rows}
+    
+    def delete(self, org_id: int, resource: str, ids: Iterable[str]) -> int:
+        rows = [(org_id, resource, str(record_id)) for record_id in ids]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM records WHERE org_id = ? AND resource = ? AND id = ?",
+                rows
+            )
+        return len(rows)
+    
+    def records(self, org_id: int, resource: str) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM records WHERE org_id = ? AND resource = ? ORDER BY id",
+                (org_id, resource)
+            ).fetchall()
+        for (data,) in rows:
+            yield json.loads(data)
+    
+    def close(self):
+        with self._lock:
+            self._conn.close()
+    
+    def __repr__(self) -> str:
+        return f"SQLiteSyncStore(path={self.path!r})"
+
+
+def _updated_at(record: Dict[str, Any]) -> Optional[str]:
+    """Extrai o ``updated_at`` de um registro JSON:API."""
+    return (record.get("attributes") or {}).get("updated_at")
+
+
+def _default_since_filter(high_water: str) -> Dict[str, Any]:
+    """Filtro de servidor para registros alterados desde ``high_water``."""
+    return {"updated_at": f">={high_water}"}
+
+
+class Synchronizer:
+    """Sincroniza recursos da organização com um `SyncStore` local.
+    
+    A primeira execução (ou ``full=True``) lista o recurso inteiro. As
+    seguintes pedem à API apenas os registros com ``updated_at`` a partir do
+    último valor já visto (o *high-water mark*), de modo que o tempo de cada
+    execução acompanha a quantidade de alterações e não o tamanho da
+    organização. Exclusões são detectadas por uma reconciliação completa de
+    IDs a cada ``reconcile_interval`` segundos.
+    
+    Registros anteriores ao high-water mark são ignorados mesmo que a API não
+    aplique o filtro; se ela rejeitar o filtro (422), mesmo que em um único
+    objetivo de uma travessia, o recurso é listado inteiro e filtrado
+    localmente.
+    
+    Se a listagem falhar (inclusive a busca de um único objetivo ou issue), a
+    exceção é propagada sem remover registros do store e sem avançar o
+    estado; os registros já gravados continuam válidos.
+    
+    Ações não têm listagem filtrável na organização: são listadas a partir
+    das páginas de issues (``include=actions``) e filtradas localmente, o que
+    também reconcilia seus IDs a cada execução.
+    """
+    
+    RESOURCES = ("projects", "issues", "actions", "risks", "controls")
+    
+    def __init__(
+        self,
+        client,
+        store: SyncStore,
+        reconcile_interval: Optional[float] = 7 * 86400,
+        since_filter: Callable[[str], Dict[str, Any]] = _default_since_filter
+    ):
+        """
+        Args:
+            client: `HighBondClient` usado nas requisições.
+            store: Store local dos registros e do estado.
+            reconcile_interval: Intervalo em segundos entre reconciliações
+                completas de IDs (None = apenas com ``full=True``).
+            since_filter: Função que recebe o high-water mark e devolve os
+                filtros (``filters`` dos módulos) dos registros alterados desde então.
+        """
+        self.client = client
+        self.store = store
+        self.reconcile_interval = reconcile_interval
+        self.since_filter = since_filter
+    
+    def _list(self, resource: str, filters: Optional[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Lista os registros de um recurso em streaming."""
+        if resource == "actions":
+            return self.client.actions.list_all(stream=True)
+        module = getattr(self.client, resource)
+        return module.list_all(filters=filters, stream=True)
+    
+    def sync(
+        self,
+        resources: Optional[List[str]] = None,
+        full: bool = False
+    ) -> Dict[str, SyncResult]:
+        """Sincroniza os recursos pedidos.
+        
+        Args:
+            resources: Recursos a sincronizar (padrão: todos em `RESOURCES`).
+            full: Se True, força listagem completa e reconciliação de IDs.
+        
+        Returns:
+            Dicionário recurso → `SyncResult`.
+        """
+        resources = list(resources or self.RESOURCES)
+        unknown = [name for name in resources if name not in self.RESOURCES]
+        if unknown:
+            raise ValueError(
+                f"Recursos não suportados: {unknown}. Use: {list(self.RESOURCES)}"
+            )
+        return {name: self.sync_resource(name, full=full) for name in resources}
+    
+    def sync_resource(self, resource: str, full: bool = False) -> SyncResult:
+        """Sincroniza um recurso.
+        
+        Args:
+            resource: Nome do recurso.
+            full: Se True, força listagem completa e reconciliação de IDs.
+        
+        Returns:
+            Resultado da sincronização.
+        """
+        started = time.time()
+        org_id = self.client.config.api.org_id
+        state = self.store.state(org_id, resource)
+        
+        reconcile = (
+            full
+            or state.high_water is None
+            or resource == "actions"
+            or (self.reconcile_interval is not None
+                and (state.reconciled_at or 0) + self.reconcile_interval <= started)
+        )
+        result = SyncResult(resource, "full" if reconcile else "incremental")
+        
+        # Falhas das listagens (inclusive de um único objetivo ou issue nas
+        # travessias) são propagadas: sem a lista completa de IDs, a
+        # reconciliação apagaria registros válidos e o estado não pode avançar.
+        if reconcile:
+            high_water, seen = self._store(
+                org_id, resource, self._list(resource, None), state, full, result
+            )
+        else:
+            try:
+                high_water, seen = self._store(
+                    org_id, resource, self._list(resource, self.since_filter(state.high_water)),
+                    state, full, result
+                )
+            except HighBondValidationError:
+                # Filtro rejeitado pela API (na primeira página ou em qualquer
+                # objetivo da travessia): lista tudo e filtra localmente
+                result.fetched = result.upserted = 0
+                high_water, seen = self._store(
+                    org_id, resource, self._list(resource, None), state, full, result
+                )
+        
+        if reconcile:
+            missing = self.store.ids(org_id, resource) - seen
+            if missing:
+                result.deleted = self.store.delete(org_id, resource, missing)
+            state.reconciled_at = started
+        
+        state.high_water = high_water
+        state.synced_at = started
+        self.store.save_state(org_id, resource, state)
+        
+        result.high_water = high_water
+        result.duration = time.time() - started
+        return result
+    
+    def _store(
+        self,
+        org_id: int,
+        resource: str,
+        records: Iterable[Dict[str, Any]],
+        state: SyncState,
+        full: bool,
+        result: SyncResult
+    ) -> Tuple[Optional[str], Set[str]]:
+        """Grava os registros novos ou alterados em lotes.
+        
+        Returns:
+            Novo high-water mark e IDs recebidos da API.
+        """
+        high_water = state.high_water
+        seen: Set[str] = set()
+        batch = []
+        for record in records:
+            result.fetched += 1
+            seen.add(str(record["id"]))
+            updated_at = _updated_at(record)
+            if updated_at and (high_water is None or updated_at > high_water):
+                high_water = updated_at
+            # Registros anteriores ao high-water mark já estão no store
+            if full or state.high_water is None or not updated_at \
+                    or updated_at >= state.high_water:
+                batch.append(record)
+            if len(batch) >= 500:
+                result.upserted += self.store.upsert(org_id, resource, batch)
+                batch = []
+        if batch:
+            result.upserted += self.store.upsert(org_id, resource, batch)
+        return high_water, seen
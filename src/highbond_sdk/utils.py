@@ -1,15 +1,182 @@
+import itertools
+from operator import itemgetter
+
 import pandas as pd
 
-def to_dataframe(data):
+def to_dataframe(data, jsonapi=False):
     """
     Converte uma resposta de API ou generator/lista de dicts em um pandas.DataFrame.
     Aceita:
       - dict com chave 'data' (padrão das respostas HighBond)
       - generator/lista de dicts
+    Com jsonapi=True usa `jsonapi_to_dataframe` em vez de pd.json_normalize.
     """
+    if jsonapi:
+        return jsonapi_to_dataframe(data)
     if isinstance(data, dict) and "data" in data:
         return pd.json_normalize(data["data"])
     elif isinstance(data, list) or hasattr(data, "__iter__"):
         return pd.json_normalize(list(data))
     else:
         raise ValueError("Formato de dados não suportado para conversão em DataFrame.")
+
+
+def jsonapi_to_dataframe(data):
+    """
+    Converte recursos JSON:API do HighBond em um pandas.DataFrame, coluna a coluna.
+    Cada coluna é extraída de todos os registros de uma vez e o DataFrame é montado a
+    partir dessas listas, sem o achatamento genérico registro a registro de
+    pd.json_normalize. O esquema é estável:
+      - 'id' e 'type'
+      - cada atributo com o próprio nome ('title', não 'attributes.title'); atributos
+        que são objetos viram colunas com ponto ('owner.name')
+      - relacionamentos como '<nome>_id' (um) ou '<nome>_ids' (lista de IDs)
+      - outros campos do registro com o próprio nome (ex.: 'project_id'); recursos
+        anexados pelo SDK, como 'objective' e 'project', com prefixo ('objective.title')
+      - 'links' e 'meta' são descartados
+    Registros sem uma coluna recebem None. Aceita os mesmos formatos de `to_dataframe`,
+    além de um único recurso.
+    """
+    if isinstance(data, dict):
+        data = data["data"] if "data" in data else data
+        if isinstance(data, dict):
+            data = [data]
+    elif not (isinstance(data, list) or hasattr(data, "__iter__")):
+        raise ValueError("Formato de dados não suportado para conversão em DataFrame.")
+
+    columns = {}
+    _flatten_resources(list(data), "", columns)
+    return pd.DataFrame(columns)
+
+
+_EMPTY = {}
+
+
+def _columns(objects):
+    """
+    Transpõe uma lista de dicts em {chave: lista de valores}, na ordem das chaves.
+    Quando todos têm as mesmas chaves (o caso comum numa página da API), a transposição
+    é feita com itemgetter e zip; senão, chaves ausentes viram None.
+    """
+    objects = [obj if type(obj) is dict else _EMPTY for obj in objects]
+    if not objects:
+        return {}
+    keys = list(objects[0])
+    if keys and len(set(map(len, objects))) == 1:
+        try:
+            return {key: list(map(itemgetter(key), objects)) for key in keys}
+        except KeyError:
+            pass
+    all_keys = dict.fromkeys(keys)
+    for obj in objects:
+        if not obj.keys() <= all_keys.keys():
+            all_keys.update(dict.fromkeys(obj))
+    return {key: [obj.get(key) for obj in objects] for key in all_keys}
+
+
+def _flatten_resources(records, prefix, columns):
+    """
+    Achata uma lista de recursos JSON:API em ``columns`` (nome -> lista de valores).
+    Em conflitos de nome, as chaves do próprio registro ('id', 'type' e as anexadas pelo
+    SDK, como 'project_id') têm prioridade, depois os relacionamentos ('<nome>_id') e por
+    último os atributos; quem perde mantém o prefixo de origem ('attributes.id',
+    'relationships.project_id'). O resultado não depende da ordem das chaves.
+    """
+    parts = []
+    for key, values in _columns(records).items():
+        part = {}
+        if key == "attributes":
+            _flatten_objects(values, "", part)
+            parts.append(("attributes.", part))
+        elif key == "relationships":
+            _flatten_relationships(values, part)
+            parts.append(("relationships.", part))
+        elif key not in ("links", "meta"):
+            _flatten_field(key, values, part)
+            parts.append(("", part))
+
+    names = {}
+    taken = set()
+    for origin in ("", "relationships.", "attributes."):
+        for part_origin, part in parts:
+            if part_origin != origin:
+                continue
+            for name in part:
+                final = origin + name if origin and name in taken else name
+                names[origin, name] = final
+                taken.add(final)
+    for origin, part in parts:
+        for name, values in part.items():
+            columns[prefix + names[origin, name]] = values
+
+
+def _flatten_field(key, values, columns):
+    """Achata um campo do registro: valores simples, recurso anexado pelo SDK ou objeto."""
+    types = set(map(type, values))
+    types.discard(type(None))
+    if types != {dict} or not any(values):
+        columns[key] = values
+    elif all("type" in value and "id" in value for value in values if value):
+        _flatten_resources(values, f"{key}.", columns)
+    else:
+        _flatten_objects(values, f"{key}.", columns)
+
+
+def _flatten_relationships(relationships, columns):
+    """Achata os relacionamentos em '<nome>_id' (um) ou '<nome>_ids' (lista de IDs)."""
+    for name, relationship in _columns(relationships).items():
+        refs = _columns(relationship).get("data")
+        if refs is None:
+            continue
+        types = set(map(type, refs))
+        if list in types:
+            columns[f"{name}_ids"] = [
+                [item.get("id") for item in ref] if type(ref) is list else None
+                for ref in refs
+            ]
+        else:
+            columns[f"{name}_id"] = [
+                ref.get("id") if type(ref) is dict else None for ref in refs
+            ]
+
+
+def _flatten_objects(objects, prefix, columns):
+    """
+    Achata uma lista de objetos (ex.: atributos) em ``columns``, com ponto nos aninhados.
+    Uma chave só é expandida se todos os seus valores não nulos forem objetos; com valores
+    simples misturados, a coluna fica como veio, sem descartá-los.
+    """
+    for key, values in _columns(objects).items():
+        types = set(map(type, values))
+        types.discard(type(None))
+        if types == {dict} and any(values):
+            _flatten_objects(values, f"{prefix}{key}.", columns)
+        else:
+            columns[prefix + key] = values
+
+
+def iter_dataframes(data, chunk_size=10000, jsonapi=False):
+    """
+    Converte registros em DataFrames de até ``chunk_size`` linhas, um bloco por vez.
+    Ao contrário de `to_dataframe`, nunca materializa todos os registros: cada bloco
+    é normalizado com pd.json_normalize e entregue antes de o próximo ser lido, de modo
+    que a memória depende de ``chunk_size`` e não do total de registros.
+    As colunas de cada bloco são as dos registros daquele bloco.
+    Aceita os mesmos formatos de `to_dataframe`; com jsonapi=True cada bloco usa
+    `jsonapi_to_dataframe`.
+    """
+    if chunk_size is None or chunk_size < 1:
+        raise ValueError("chunk_size deve ser pelo menos 1")
+    if isinstance(data, dict) and "data" in data:
+        data = data["data"]
+    elif not (isinstance(data, list) or hasattr(data, "__iter__")):
+        raise ValueError("Formato de dados não suportado para conversão em DataFrame.")
+
+    def chunks():
+        records = iter(data)
+        while True:
+            chunk = list(itertools.islice(records, chunk_size))
+            if not chunk:
+                return
+            yield jsonapi_to_dataframe(chunk) if jsonapi else pd.json_normalize(chunk)
+    return chunks()
@@ -0,0 +1,266 @@
+"""
+Fixtures dos testes: cliente HighBond com a sessão HTTP substituída por uma API em memória.
+"""
+import base64
+import json
+import re
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+import pytest
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from highbond_sdk import HighBondClient
+
+
+ORG_ID = 1
+
+
+def resource(type_: str, id_: Any, relationships: Optional[Dict[str, Any]] = None, **attributes):
+    """Monta um recurso JSON:API."""
+    record = {"id": str(id_), "type": type_, "attributes": attributes}
+    if relationships:
+        record["relationships"] = {
+            name: {"data": ref} for name, ref in relationships.items()
+        }
+    return record
+
+
+def ref(type_: str, id_: Any) -> Dict[str, str]:
+    """Referência JSON:API (``{"type": ..., "id": ...}``)."""
+    return {"type": type_, "id": str(id_)}
+
+
+class FakeAPI:
+    """Substituto de ``requests.Session.request`` que responde a partir de dados em memória.
+
+    Cada rota associa uma expressão regular (aplicada ao endpoint, sem a base
+    URL) a uma função ``handler(match, params, headers)`` que devolve
+    ``(status, corpo, cabeçalhos)``. Falhas podem ser injetadas por padrão
+    aplicado a ``endpoint?query``.
+    """
+
+    def __init__(self, base_path: str = "/v1"):
+        self.base_path = base_path
+        self.routes: List[Tuple[str, "re.Pattern", Callable]] = []
+        self.failures: Dict[str, int] = {}
+        self.calls: List[Tuple[str, str, Dict[str, Any], Dict[str, str]]] = []
+        self._lock = threading.Lock()
+
+    # ==================== ROTAS ====================
+
+    def route(self, pattern: str, handler: Callable, method: str = "GET"):
+        """Registra ``handler`` para os endpoints que casam com ``pattern``."""
+        self.routes.append((method, re.compile(pattern), handler))
+
+    def collection(self, pattern: str, items: Callable[[Any], List[Dict[str, Any]]]):
+        """Registra uma listagem paginada; ``items(match)`` devolve os registros."""
+        def handler(match, params, headers):
+            return 200, paginate(items(match), params), {}
+        self.route(pattern, handler)
+
+    def fail(self, pattern: str, status: int):
+        """Faz as requisições cujo ``endpoint?query`` casa com ``pattern`` responderem ``status``."""
+        self.failures[pattern] = status
+
+    # ==================== CONSULTA ====================
+
+    def endpoints(self, method: str = "GET") -> List[str]:
+        """Endpoints requisitados com ``method``, na ordem."""
+        return [endpoint for m, endpoint, _, _ in self.calls if m == method]
+
+    def count(self, pattern: str) -> int:
+        """Número de requisições cujo endpoint casa com ``pattern``."""
+        return sum(1 for _, endpoint, _, _ in self.calls if re.search(pattern, endpoint))
+
+    # ==================== SESSÃO ====================
+
+    def __call__(self, method: str, url: str, params=None, headers=None, json=None, **kwargs):
+        endpoint = urlparse(url).path[len(self.base_path):]
+        params = dict(params or {})
+        headers = dict(headers or {})
+        with self._lock:
+            self.calls.append((method, endpoint, params, headers))
+
+        target = f"{endpoint}?{urlencode(params)}"
+        for pattern, status in list(self.failures.items()):
+            if re.search(pattern, target):
+                return make_response(status, {"errors": [{"title": "falha injetada"}]}, url=url)
+
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(endpoint)
+            if route_method == method and match:
+                status, body, response_headers = handler(match, params, headers)
+                return make_response(status, body, response_headers, url)
+        return make_response(404, {"errors": [{"title": "Not found", "detail": endpoint}]}, url=url)
+
+
+def make_response(
+    status: int,
+    body: Optional[Dict[str, Any]],
+    headers: Optional[Dict[str, str]] = None,
+    url: str = ""
+) -> requests.Response:
+    """Monta um ``requests.Response`` com corpo JSON."""
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode() if body is not None else b""
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.url = url
+    return response
+
+
+def paginate(items: List[Dict[str, Any]], params: Dict[str, Any]) -> Dict[str, Any]:
+    """Fatia ``items`` conforme ``page[size]``/``page[number]`` (Base64), como a API."""
+    size = int(params.get("page[size]", 50))
+    number = params.get("page[number]")
+    page = int(base64.b64decode(number).decode()) if number else 1
+    last = max(1, -(-len(items) // size))
+    body = {
+        "data": items[(page - 1) * size:page * size],
+        "links": {},
+        "meta": {"page_count": last, "total_count": len(items)},
+    }
+    if page < last:
+        body["links"]["next"] = base64.b64encode(str(page + 1).encode()).decode()
+    return body
+
+
+class Hierarchy:
+    """Organização de teste: projetos → objetivos → riscos, e issues → ações."""
+
+    def __init__(self, projects: int = 3, objectives: int = 2, risks: int = 3, issues: int = 6):
+        self.projects = [resource("projects", p, name=f"Projeto {p}") for p in range(1, projects + 1)]
+        self.objectives: Dict[str, List[Dict[str, Any]]] = {}
+        self.risks: Dict[str, List[Dict[str, Any]]] = {}
+        objective_id = 100
+        risk_id = 1000
+        for project in self.projects:
+            self.objectives[project["id"]] = []
+            for _ in range(objectives):
+                objective_id += 1
+                objective = resource(
+                    "objectives", objective_id, {"project": ref("projects", project["id"])},
+                    title=f"Objetivo {objective_id}"
+                )
+                self.objectives[project["id"]].append(objective)
+                self.risks[objective["id"]] = []
+                for _ in range(risks):
+                    risk_id += 1
+                    self.risks[objective["id"]].append(resource(
+                        "risks", risk_id, {"objective": ref("objectives", objective_id)},
+                        title=f"Risco {risk_id}"
+                    ))
+
+        self.actions: Dict[str, List[Dict[str, Any]]] = {}
+        self.issues = []
+        action_id = 5000
+        for i in range(1, issues + 1):
+            self.actions[str(i)] = []
+            for _ in range(i % 3):
+                action_id += 1
+                self.actions[str(i)].append(resource(
+                    "actions", action_id, {"issue": ref("issues", i)}, title=f"Ação {action_id}"
+                ))
+            self.issues.append(resource(
+                "issues", i, {"actions": [ref("actions", a["id"]) for a in self.actions[str(i)]]},
+                title=f"Issue {i}"
+            ))
+
+    @property
+    def all_risks(self) -> List[Dict[str, Any]]:
+        return [risk for risks in self.risks.values() for risk in risks]
+
+    @property
+    def all_actions(self) -> List[Dict[str, Any]]:
+        return [action for actions in self.actions.values() for action in actions]
+
+    def project_of_risk(self, risk: Dict[str, Any]) -> str:
+        objective_id = risk["relationships"]["objective"]["data"]["id"]
+        for project_id, objectives in self.objectives.items():
+            if any(o["id"] == objective_id for o in objectives):
+                return project_id
+        raise KeyError(objective_id)
+
+    def install(self, api: FakeAPI):
+        """Registra na API as rotas da organização."""
+        org = f"/orgs/{ORG_ID}"
+        objectives = {o["id"]: o for os_ in self.objectives.values() for o in os_}
+        projects = {p["id"]: p for p in self.projects}
+
+        api.collection(rf"{org}/projects", lambda m: self.projects)
+        api.collection(rf"{org}/projects/(\d+)/objectives", lambda m: self.objectives.get(m.group(1), []))
+        api.collection(rf"{org}/objectives/(\d+)/risks", lambda m: self.risks.get(m.group(1), []))
+        api.collection(rf"{org}/issues/(\d+)/actions", lambda m: self.actions.get(m.group(1), []))
+
+        def project(match, params, headers):
+            record = projects.get(match.group(1))
+            if record is None:
+                return 404, {"errors": [{"title": "Not found"}]}, {}
+            etag = f'"p{record["id"]}"'
+            if headers.get("If-None-Match") == etag:
+                return 304, None, {"ETag": etag}
+            return 200, {"data": record}, {"ETag": etag}
+        api.route(rf"{org}/projects/(\d+)", project)
+
+        def org_risks(match, params, headers):
+            body = paginate(self.all_risks, params)
+            include = params.get("include", "").split(",")
+            included = {}
+            for risk in body["data"]:
+                objective = objectives[risk["relationships"]["objective"]["data"]["id"]]
+                if "objective" in include:
+                    included[("objectives", objective["id"])] = objective
+                if "objective.project" in include:
+                    project_id = objective["relationships"]["project"]["data"]["id"]
+                    included[("projects", project_id)] = projects[project_id]
+            if included:
+                body["included"] = list(included.values())
+            return 200, body, {}
+        api.route(rf"{org}/risks", org_risks)
+
+        def org_issues(match, params, headers):
+            body = paginate(self.issues, params)
+            if "actions" in params.get("include", "").split(","):
+                body["included"] = [
+                    action for issue in body["data"] for action in self.actions[issue["id"]]
+                ]
+            return 200, body, {}
+        api.route(rf"{org}/issues", org_issues)
+
+
+@pytest.fixture
+def api() -> FakeAPI:
+    return FakeAPI()
+
+
+@pytest.fixture
+def org(api) -> Hierarchy:
+    hierarchy = Hierarchy()
+    hierarchy.install(api)
+    return hierarchy
+
+
+@pytest.fixture
+def make_client(api):
+    """Cria clientes cuja sessão HTTP é a `FakeAPI`; fechados ao final do teste."""
+    clients = []
+
+    def factory(**kwargs):
+        kwargs.setdefault("retry_delay", 0)
+        kwargs.setdefault("page_size", 2)
+        client = HighBondClient(token="token", org_id=ORG_ID, **kwargs)
+        client._http_client._session.request = api
+        clients.append(client)
+        return client
+
+    yield factory
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def client(make_client) -> HighBondClient:
+    return make_client()
@@ -0,0 +1,41 @@
+"""
+Testes de `ActionsModule.list_all` a partir das páginas de issues.
+"""
+import pytest
+
+
+def test_actions_come_from_included_resources(client, api, org):
+    actions = client.actions.list_all()
+
+    assert sorted(a["id"] for a in actions) == sorted(a["id"] for a in org.all_actions)
+    assert api.count(r"/issues/\d+/actions") == 0
+
+
+def test_issues_with_missing_actions_are_fetched(client, api, org):
+    issue = org.issues[1]
+    issue["relationships"]["actions"]["meta"] = {"count": len(org.actions[issue["id"]]) + 1}
+
+    actions = client.actions.list_all()
+
+    assert sorted(a["id"] for a in actions) == sorted(a["id"] for a in org.all_actions)
+    assert api.endpoints().count(f"/orgs/1/issues/{issue['id']}/actions") == 1
+    assert api.count(r"/issues/\d+/actions") == 1
+
+
+@pytest.mark.parametrize("status", [400, 422])
+def test_rejected_include_falls_back_to_each_issue(client, api, org, status):
+    api.fail(r"/orgs/1/issues\?.*include=actions", status)
+
+    actions = client.actions.list_all()
+
+    assert sorted(a["id"] for a in actions) == sorted(a["id"] for a in org.all_actions)
+    fetched = {endpoint for endpoint in api.endpoints() if endpoint.endswith("/actions")}
+    assert fetched == {f"/orgs/1/issues/{issue['id']}/actions" for issue in org.issues}
+
+
+def test_filters_fetch_each_issue(client, api, org):
+    client.actions.list_all(filters={"status": "open"})
+
+    issue_calls = [params for _, endpoint, params, _ in api.calls if endpoint == "/orgs/1/issues"]
+    assert all("include" not in params for params in issue_calls)
+    assert api.count(r"/issues/\d+/actions") == len(org.issues)
@@ -0,0 +1,175 @@
+"""
+Testes de `MemoryCache`, `SQLiteCache` e da revalidação condicional no cliente HTTP.
+"""
+import os
+
+import pytest
+
+from highbond_sdk import cache as cache_module
+from highbond_sdk.cache import MemoryCache, SQLiteCache
+
+
+class FakeClock:
+    """Relógio controlado pelo teste, no lugar do módulo ``time`` de `highbond_sdk.cache`."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def advance(self, seconds: float = 1.0):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(cache_module, "time", clock)
+    return clock
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_cache(request, tmp_path):
+    caches = []
+
+    def factory(**kwargs):
+        if request.param == "memory":
+            cache = MemoryCache(**kwargs)
+        else:
+            cache = SQLiteCache(str(tmp_path / "cache.db"), **kwargs)
+        caches.append(cache)
+        return cache
+
+    yield factory
+    for cache in caches:
+        cache.close()
+
+
+def test_evicts_least_recently_used_entries(make_cache, clock):
+    cache = make_cache(max_entries=10)
+    for i in range(10):
+        cache.set(f"k{i}", "/orgs/1/projects", b"x")
+        clock.advance()
+    # k0 e k1 voltam a ser usadas: as descartadas são k2, k3...
+    cache.get("k0")
+    clock.advance()
+    cache.get("k1")
+    clock.advance()
+
+    cache.set("k10", "/orgs/1/projects", b"x")
+
+    assert cache.get("k0") == b"x"
+    assert cache.get("k1") == b"x"
+    assert cache.get("k2") is None
+    assert cache.get("k10") == b"x"
+    assert cache.stats.entries <= 10
+    assert cache.stats.evictions >= 1
+
+
+def test_evicts_by_size(make_cache, clock):
+    cache = make_cache(max_bytes=4096)
+    # Aleatórios para que a compressão do SQLiteCache não reduza o tamanho
+    values = [os.urandom(2000) for _ in range(6)]
+    for i, value in enumerate(values):
+        cache.set(f"k{i}", "/orgs/1/projects", value)
+        clock.advance()
+
+    stats = cache.stats
+    assert stats.bytes <= 4096
+    assert cache.get("k5") == values[5]
+    assert cache.get("k0") is None
+
+
+def test_expired_entries_without_validators_are_dropped(make_cache, clock):
+    cache = make_cache(ttl=10)
+    cache.set("k", "/orgs/1/projects", b"corpo")
+    assert cache.lookup("k").fresh
+
+    clock.advance(11)
+
+    assert cache.lookup("k") is None
+    assert cache.stats.entries == 0
+
+
+def test_expired_entries_with_validators_are_kept_for_revalidation(make_cache, clock):
+    cache = make_cache(ttl=10)
+    cache.set("k", "/orgs/1/projects/1", b"corpo", etag='"v1"')
+    clock.advance(11)
+
+    entry = cache.lookup("k")
+    assert not entry.fresh
+    assert entry.validators == {"If-None-Match": '"v1"'}
+
+    assert cache.refresh("k", "/orgs/1/projects/1") == b"corpo"
+    assert cache.lookup("k").fresh
+    assert cache.stats.revalidations == 1
+
+
+def test_sqlite_eviction_leaves_headroom(tmp_path, clock):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_entries=100)
+    for i in range(101):
+        cache.set(f"k{i}", "/orgs/1/projects", b"x")
+        clock.advance()
+
+    entries = cache.stats.entries
+    assert entries <= 100 * SQLiteCache.EVICT_TO + 1
+    evictions = cache.stats.evictions
+
+    # Com folga abaixo do limite, as gravações seguintes não descartam nada
+    for i in range(101, 101 + 100 - entries):
+        cache.set(f"k{i}", "/orgs/1/projects", b"x")
+    assert cache.stats.evictions == evictions
+    cache.close()
+
+
+def test_sqlite_counters_match_the_file(tmp_path, clock):
+    path = str(tmp_path / "cache.db")
+    cache = SQLiteCache(path, max_entries=50)
+    for i in range(80):
+        cache.set(f"k{i % 60}", "/orgs/1/projects", b"y" * (i % 7 + 1))
+        clock.advance()
+    cache.lookup("k59")
+
+    entries, size = cache._entries, cache._bytes
+    cache.close()
+
+    reopened = SQLiteCache(path, max_entries=50)
+    stats = reopened.stats
+    assert (stats.entries, stats.bytes) == (entries, size)
+    reopened.close()
+
+
+def test_client_serves_repeated_gets_from_cache(make_client, api, org):
+    client = make_client(cache=MemoryCache())
+
+    first = client.projects.get(1)
+    first["data"]["attributes"]["name"] = "alterado"
+    second = client.projects.get(1)
+
+    assert second["data"]["attributes"]["name"] == "Projeto 1"
+    assert api.count(r"/projects/1$") == 1
+    assert client.cache.stats.hits == 1
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_client_revalidates_with_304(make_client, api, org, tmp_path, backend):
+    if backend == "memory":
+        cache = MemoryCache(ttl=0)
+    else:
+        cache = SQLiteCache(str(tmp_path / "cache.db"), ttl=0)
+    client = make_client(cache=cache)
+
+    first = client.projects.get(1)
+    second = client.projects.get(1)
+
+    assert second == first
+    calls = [headers for _, endpoint, _, headers in api.calls if endpoint.endswith("/projects/1")]
+    assert len(calls) == 2
+    assert "If-None-Match" not in calls[0]
+    assert calls[1]["If-None-Match"] == '"p1"'
+    assert cache.stats.revalidations == 1
+    cache.close()
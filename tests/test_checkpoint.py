@@ -0,0 +1,111 @@
+"""
+Testes de `Checkpoint` e da retomada de listagens interrompidas.
+"""
+import base64
+import json
+from urllib.parse import quote
+
+import pytest
+
+from highbond_sdk.checkpoint import Checkpoint
+from highbond_sdk.exceptions import HighBondConnectionError, HighBondNotFoundError
+
+
+def page_param(page: int) -> str:
+    """``page[number]=...`` como aparece na query string."""
+    return "page%5Bnumber%5D=" + quote(base64.b64encode(str(page).encode()).decode(), safe="")
+
+
+def test_state_survives_reopening(tmp_path):
+    path = str(tmp_path / "export.ckpt")
+    checkpoint = Checkpoint(path, flush_interval=0)
+    checkpoint.mark_page("projetos", 3)
+    checkpoint.mark_parent("riscos", 101)
+    checkpoint.mark_complete("objetivos")
+
+    reopened = Checkpoint(path)
+    assert reopened.pages_done("projetos") == 3
+    assert reopened.parent_done("riscos", "101")
+    assert not reopened.parent_done("riscos", 102)
+    assert reopened.is_complete("objetivos")
+
+    reopened.clear()
+    assert not (tmp_path / "export.ckpt").exists()
+
+
+def test_rejects_files_from_another_version(tmp_path):
+    path = tmp_path / "export.ckpt"
+    path.write_text(json.dumps({"version": 99}))
+    with pytest.raises(ValueError):
+        Checkpoint(str(path))
+
+
+def test_pagination_resumes_after_the_last_delivered_page(client, api, org, tmp_path):
+    path = str(tmp_path / "projetos.ckpt")
+    api.fail(page_param(2), 500)
+
+    delivered = []
+    with pytest.raises(HighBondConnectionError):
+        for project in client.projects.list_all(stream=True, checkpoint=path):
+            delivered.append(project["id"])
+    assert delivered == ["1", "2"]
+
+    api.failures.clear()
+    api.calls.clear()
+    for project in client.projects.list_all(stream=True, checkpoint=path):
+        delivered.append(project["id"])
+
+    assert delivered == ["1", "2", "3"]
+    pages = [params["page[number]"] for _, _, params, _ in api.calls]
+    assert pages == [base64.b64encode(b"2").decode()]
+
+    # Listagem concluída: nada é buscado de novo
+    api.calls.clear()
+    assert list(client.projects.list_all(stream=True, checkpoint=path)) == []
+    assert api.calls == []
+
+
+def test_fan_out_resumes_after_the_last_delivered_parent(make_client, api, org, tmp_path):
+    client = make_client(threading_enabled=False)
+    checkpoint = Checkpoint(str(tmp_path / "riscos.ckpt"), flush_interval=0)
+    failing = org.objectives["2"][0]["id"]
+    api.fail(rf"/objectives/{failing}/risks", 404)
+
+    delivered = []
+    with pytest.raises(HighBondNotFoundError):
+        for risk in client.risks.list_all(use_org_endpoint=False, stream=True, checkpoint=checkpoint):
+            delivered.append(risk["id"])
+
+    api.failures.clear()
+    api.calls.clear()
+    resumed = Checkpoint(checkpoint.path)
+    for risk in client.risks.list_all(use_org_endpoint=False, stream=True, checkpoint=resumed):
+        delivered.append(risk["id"])
+
+    assert sorted(delivered) == sorted(r["id"] for r in org.all_risks)
+    assert len(delivered) == len(set(delivered))
+    fetched = {endpoint for endpoint in api.endpoints() if endpoint.endswith("/risks")}
+    project_1 = {f"/orgs/1/objectives/{o['id']}/risks" for o in org.objectives["1"]}
+    assert not fetched & project_1
+
+
+def test_partial_pages_are_delivered_again(client, api, org, tmp_path):
+    path = str(tmp_path / "projetos.ckpt")
+    projects = client.projects.list_all(stream=True, checkpoint=Checkpoint(path, flush_interval=0))
+    first = next(projects)
+    projects.close()
+
+    resumed = [p["id"] for p in client.projects.list_all(stream=True, checkpoint=path)]
+    assert first["id"] == resumed[0]
+    assert resumed == ["1", "2", "3"]
+
+
+def test_requires_stream_or_chunk_size(client, org, tmp_path):
+    path = str(tmp_path / "projetos.ckpt")
+    with pytest.raises(ValueError):
+        client.projects.list_all(checkpoint=path)
+    with pytest.raises(ValueError):
+        client.risks.list_all(checkpoint=path)
+
+    chunks = client.projects.list_all(checkpoint=path, chunk_size=2)
+    assert sum(len(chunk) for chunk in chunks) == len(org.projects)
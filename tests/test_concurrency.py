@@ -0,0 +1,134 @@
+"""
+Testes do `WorkerPool`.
+"""
+import threading
+import time
+
+import pytest
+
+from highbond_sdk.concurrency import WorkerPool
+
+
+@pytest.fixture
+def pool():
+    with WorkerPool(max_workers=4) as pool:
+        yield pool
+
+
+def test_map_yields_every_item_in_completion_order(pool):
+    delays = {0: 0.15, 1: 0.0, 2: 0.08, 3: 0.02}
+
+    def work(item):
+        time.sleep(delays[item])
+        return item * 10
+
+    results = [(item, future.result()) for item, future in pool.map(work, delays)]
+
+    assert sorted(results) == [(0, 0), (1, 10), (2, 20), (3, 30)]
+    assert [item for item, _ in results] == [1, 3, 2, 0]
+
+
+def test_map_keeps_failures_in_their_future(pool):
+    def work(item):
+        if item % 3 == 0:
+            raise ValueError(item)
+        return item
+
+    outcomes = {}
+    for item, future in pool.map(work, range(10)):
+        try:
+            outcomes[item] = future.result()
+        except ValueError as e:
+            outcomes[item] = e
+
+    assert sorted(outcomes) == list(range(10))
+    failed = sorted(item for item, value in outcomes.items() if isinstance(value, ValueError))
+    assert failed == [0, 3, 6, 9]
+    assert outcomes[4] == 4
+
+
+def test_map_respects_limit(pool):
+    running = []
+    peak = []
+    lock = threading.Lock()
+
+    def work(item):
+        with lock:
+            running.append(item)
+            peak.append(len(running))
+        time.sleep(0.01)
+        with lock:
+            running.remove(item)
+        return item
+
+    items = [item for item, _ in pool.map(work, range(20), limit=lambda: 2)]
+
+    assert sorted(items) == list(range(20))
+    assert max(peak) <= 2
+
+
+def test_map_consumes_items_lazily_and_cancels_on_break(pool):
+    consumed = []
+
+    def items():
+        for item in range(1000):
+            consumed.append(item)
+            yield item
+
+    for item, future in pool.map(lambda item: item, items(), limit=lambda: 3):
+        future.result()
+        break
+
+    assert len(consumed) < 10
+
+
+def test_map_does_not_retain_finished_futures():
+    with WorkerPool(max_workers=2) as pool:
+        generator = pool.map(lambda item: item, range(5000), limit=lambda: 4)
+        for _ in range(4000):
+            next(generator)
+        # Gerador suspenso: só as tarefas em voo continuam referenciadas
+        assert len(generator.gi_frame.f_locals["stealable"]) <= 12
+        generator.close()
+
+
+def test_nested_map_does_not_deadlock():
+    with WorkerPool(max_workers=2) as pool:
+        def children(parent):
+            return sum(future.result() for _, future in pool.map(lambda c: parent * c, range(5)))
+
+        totals = dict((item, future.result()) for item, future in pool.map(children, range(6)))
+
+    assert totals == {parent: parent * 10 for parent in range(6)}
+
+
+def test_map_ordered_preserves_item_order_and_failures(pool):
+    def work(item):
+        time.sleep(0.01 * (5 - item % 5))
+        if item == 7:
+            raise RuntimeError("falhou")
+        return item
+
+    items = []
+    for item, future in pool.map_ordered(work, range(12), window=4):
+        items.append(item)
+        if item == 7:
+            with pytest.raises(RuntimeError):
+                future.result()
+        else:
+            assert future.result() == item
+
+    assert items == list(range(12))
+
+
+def test_map_ordered_rejects_empty_window(pool):
+    with pytest.raises(ValueError):
+        list(pool.map_ordered(lambda item: item, range(3), window=0))
+
+
+def test_shutdown_rejects_new_work():
+    pool = WorkerPool(max_workers=1)
+    pool.submit(lambda: None).result()
+    pool.shutdown()
+    with pytest.raises(RuntimeError):
+        pool.submit(lambda: None)
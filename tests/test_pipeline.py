@@ -0,0 +1,137 @@
+"""
+Testes do `TraversalPipeline` e da travessia em pipeline dos módulos.
+"""
+import threading
+import time
+
+import pytest
+
+from highbond_sdk.concurrency import WorkerPool
+from highbond_sdk.exceptions import HighBondNotFoundError
+from highbond_sdk.pipeline import TraversalPipeline
+
+
+PROJECTS = [1, 2, 3, 4]
+
+
+def objectives_of(project):
+    return [(project, objective) for objective in range(3)]
+
+
+def risks_of(pair):
+    project, objective = pair
+    return [f"{project}-{objective}-{risk}" for risk in range(2)]
+
+
+EXPECTED = sorted(
+    f"{project}-{objective}-{risk}"
+    for project in PROJECTS for objective in range(3) for risk in range(2)
+)
+
+
+@pytest.fixture(params=[True, False], ids=["parallel", "sequential"])
+def make_pipeline(request):
+    pools = []
+
+    def factory(**kwargs):
+        pool = WorkerPool(max_workers=4) if request.param else None
+        if pool is not None:
+            pools.append(pool)
+        return TraversalPipeline(pool, **kwargs)
+
+    yield factory
+    for pool in pools:
+        pool.shutdown()
+
+
+def test_run_yields_every_leaf(make_pipeline):
+    pipeline = make_pipeline()
+    assert sorted(pipeline.run(PROJECTS, [objectives_of, risks_of])) == EXPECTED
+    assert pipeline.errors == []
+
+
+def test_failures_are_recorded_without_stopping_the_traversal(make_pipeline):
+    def flaky_risks(pair):
+        if pair == (2, 1):
+            raise RuntimeError("objetivo 2-1")
+        return risks_of(pair)
+
+    pipeline = make_pipeline()
+    records = list(pipeline.run(PROJECTS, [objectives_of, flaky_risks]))
+
+    assert sorted(records) == [r for r in EXPECTED if not r.startswith("2-1-")]
+    assert [(item, str(error)) for item, error in pipeline.errors] == [((2, 1), "objetivo 2-1")]
+
+
+def test_fail_fast_propagates_the_first_failure(make_pipeline):
+    def failing_objectives(project):
+        if project == 1:
+            raise RuntimeError("projeto 1")
+        return objectives_of(project)
+
+    pipeline = make_pipeline(fail_fast=True)
+    with pytest.raises(RuntimeError, match="projeto 1"):
+        list(pipeline.run(PROJECTS, [failing_objectives, risks_of]))
+    assert pipeline.errors == []
+
+
+def test_fail_fast_cancels_work_not_yet_started():
+    started = []
+    lock = threading.Lock()
+
+    def slow_leaf(item):
+        with lock:
+            started.append(item)
+        if item == 0:
+            raise RuntimeError("primeiro item")
+        time.sleep(0.05)
+        return [item]
+
+    with WorkerPool(max_workers=2) as pool:
+        pipeline = TraversalPipeline(pool, limit=lambda: 2, fail_fast=True)
+        with pytest.raises(RuntimeError, match="primeiro item"):
+            list(pipeline.run(range(100), [slow_leaf]))
+
+    assert len(started) < 20
+
+
+def test_source_is_read_on_demand():
+    read = []
+
+    def source():
+        for item in range(1000):
+            read.append(item)
+            yield item
+
+    with WorkerPool(max_workers=2) as pool:
+        pipeline = TraversalPipeline(pool, limit=lambda: 2, queue_size=4)
+        records = pipeline.run(source(), [lambda item: [item]])
+        next(records)
+        records.close()
+
+    assert len(read) < 50
+
+
+def test_list_by_project_fails_fast_on_an_objective_error(client, api, org):
+    objective_id = org.objectives["1"][0]["id"]
+    api.fail(rf"/objectives/{objective_id}/risks", 404)
+
+    with pytest.raises(HighBondNotFoundError):
+        client.risks.list_by_project(1)
+
+
+def test_tree_traversal_reports_failures_after_delivering_the_rest(make_client, api, org):
+    client = make_client()
+    objective_id = org.objectives["2"][1]["id"]
+    api.fail(rf"/objectives/{objective_id}/risks", 404)
+
+    delivered = []
+    with pytest.raises(HighBondNotFoundError):
+        for risk in client.risks.list_all(use_org_endpoint=False, stream=True):
+            delivered.append(risk["id"])
+
+    expected = [
+        r["id"] for r in org.all_risks
+        if r["relationships"]["objective"]["data"]["id"] != objective_id
+    ]
+    assert sorted(delivered) == sorted(expected)
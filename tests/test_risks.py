@@ -0,0 +1,81 @@
+"""
+Testes de `RisksModule.list_all` e das alternativas ao endpoint de riscos da organização.
+"""
+import pytest
+
+from highbond_sdk.exceptions import HighBondValidationError
+
+
+def by_id(records):
+    return {record["id"]: record for record in records}
+
+
+def assert_complete(risks, org):
+    risks = by_id(risks)
+    assert sorted(risks) == sorted(r["id"] for r in org.all_risks)
+    for risk_id, risk in risks.items():
+        expected = org.project_of_risk(risk)
+        assert risk["project_id"] == expected
+        assert risk["project"]["id"] == expected
+        assert risk["objective"]["id"] == risk["relationships"]["objective"]["data"]["id"]
+
+
+def test_org_endpoint_includes_parents(client, api, org):
+    risks = client.risks.list_all(include=["objectives", "projects"])
+
+    assert_complete(risks, org)
+    assert api.count(r"/orgs/1/risks$") == len(org.all_risks) // 2
+    assert api.count(r"/objectives/") == 0
+    assert all(
+        params.get("include") == "objective,objective.project"
+        for _, endpoint, params, _ in api.calls if endpoint.endswith("/risks")
+    )
+
+
+@pytest.mark.parametrize("status", [400, 422])
+def test_rejected_include_retries_without_it(client, api, org, status):
+    api.fail(r"/orgs/1/risks\?.*include=objective", status)
+
+    risks = client.risks.list_all(include=["objectives", "projects"])
+
+    assert_complete(risks, org)
+    assert api.count(r"/objectives/\d+/risks") == 0
+    org_calls = [params for _, endpoint, params, _ in api.calls if endpoint == "/orgs/1/risks"]
+    assert "include" in org_calls[0]
+    assert all("include" not in params for params in org_calls[1:])
+
+
+def test_rejected_filter_is_raised(client, api, org):
+    api.fail(r"/orgs/1/risks\?", 422)
+
+    with pytest.raises(HighBondValidationError):
+        client.risks.list_all(filters={"status": "x"})
+    assert api.count(r"/orgs/1/risks$") == 2
+
+
+@pytest.mark.parametrize("status", [403, 404])
+def test_missing_org_endpoint_falls_back_to_tree(client, api, org, status):
+    api.fail(r"/orgs/1/risks\?", status)
+
+    risks = client.risks.list_all(include=["objectives", "projects"])
+
+    assert_complete(risks, org)
+    assert api.count(r"/orgs/1/risks$") == 1
+    objectives = {endpoint for endpoint in api.endpoints() if endpoint.startswith("/orgs/1/objectives/")}
+    assert len(objectives) == sum(len(o) for o in org.objectives.values())
+
+
+def test_tree_traversal_without_org_endpoint(client, api, org):
+    risks = client.risks.list_all(include=["objectives", "projects"], use_org_endpoint=False)
+
+    assert_complete(risks, org)
+    assert api.count(r"/orgs/1/risks$") == 0
+
+
+def test_positional_arguments_keep_their_meaning(client, org):
+    frame = client.risks.list_all(["objectives"], True)
+    assert len(frame) == len(org.all_risks)
+
+    risks = client.risks.list_by_project(1, None, None, False, True)
+    assert {risk["project_id"] for risk in risks} == {"1"}
+    assert all("objective_id" in risk for risk in risks)